@@ -0,0 +1,47 @@
+""" Decode time of every installed JSON decoder on the recorded responses in ``tests/``.
+
+    Each recorded getPlayerStats response is also scaled up by repeating its ``statsTable`` to show how the decoders
+    behave on multi-megabyte payloads.
+
+    Run with ``python benchmarks/bench_json.py [--repeat 20]``.
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import FIXTURES # noqa
+from fantraxapi.decoders import DECODERS # noqa
+
+
+def payloads():
+    for name in sorted(os.listdir(FIXTURES)):
+        if name.endswith(".json"):
+            with open(os.path.join(FIXTURES, name), "rb") as f:
+                yield name, f.read()
+    with open(os.path.join(FIXTURES, "active_available_players.json"), "rb") as f:
+        body = json.loads(f.read())
+    rows = body["responses"][0]["data"]["statsTable"]
+    for factor in (3, 10):
+        body["responses"][0]["data"]["statsTable"] = rows * factor
+        yield f"active_available_players x{factor}", json.dumps(body).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    names = list(DECODERS)
+    print(f"{'payload':<34} {'KiB':>8} " + " ".join(f"{n + ' ms':>12}" for n in names) + f" {'speedup':>8}")
+    for payload, content in payloads():
+        times = {name: min(timeit.repeat(lambda: DECODERS[name](content), number=1, repeat=args.repeat)) for name in names}
+        best = min(times.values())
+        print(f"{payload:<34} {len(content) / 1024:>8.0f} " + " ".join(f"{times[n] * 1e3:>12.2f}" for n in names) + f" {times['json'] / best:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+""" End to end load test of many FantraxAPI clients against a local FantraxServer.
+
+    ``--processes`` worker processes each run ``--threads`` clients, every client is a :class:`~fantraxapi.FantraxAPI`
+    with its own session. For ``--duration`` seconds each client picks a scenario from ``--mix`` and runs it:
+
+    * ``dashboard``: Standings, the user's Roster, pending Trades and the Trade Block.
+    * ``waiver``: The latest Transactions and every page of available Players.
+    * ``history``: The schedule and the Standings after every Scoring Period.
+
+    The server runs in its own process with ``--latency`` seconds added to each request and serves ``--leagues``
+    Leagues of the ``--scale`` :data:`~fantraxapi.synthetic.SCALES` size, clients are spread across them.
+
+    Reported per scenario and for every request: throughput, p50/p95/p99 latency, CPU time of the worker processes per
+    request and the memory high-water mark (max RSS) of the biggest worker. ``--json`` also writes the results to a file.
+
+    Run with ``python benchmarks/bench_load.py [--processes 2] [--threads 8] [--duration 10] [--latency 0.05]``.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fantraxapi import FantraxAPI, FantraxException # noqa
+from fantraxapi.server import FantraxServer # noqa
+from fantraxapi.synthetic import SCALES # noqa
+
+
+def dashboard(api):
+    api.standings()
+    api.roster_info(api.default_team_id)
+    api.pending_trades()
+    api.trade_block()
+
+
+def waiver(api):
+    api.transactions(50)
+    for _ in api.iter_available_players(page_size=500):
+        pass
+
+
+def history(api):
+    for week in api.scoring_periods():
+        api.standings(week)
+
+
+SCENARIOS = {"dashboard": dashboard, "waiver": waiver, "history": history}
+DEFAULT_MIX = "dashboard=6,waiver=3,history=1"
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"Scenario: {name} not found, options: {', '.join(SCENARIOS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def percentile(values, q):
+    """ Nearest-rank percentile of sorted ``values``. """
+    if not values:
+        return 0.0
+    return values[min(int(len(values) * q / 100), len(values) - 1)]
+
+
+def cpu_seconds():
+    if resource is None:
+        return time.process_time()
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def max_rss_kib():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def serve(options, ready, stop, results):
+    """ Runs the server in its own process until ``stop`` is set. """
+    with FantraxServer(**options) as server:
+        ready.put(server.port)
+        stop.wait()
+        results.put({"requests": server.requests, "errors_injected": server.errors_injected})
+
+
+def client(url, league_id, mix, deadline, seed, samples, lock):
+    """ Runs scenarios on one client until ``deadline``. """
+    requests = []
+    api = FantraxAPI(league_id, base_url=url, hooks={"on_response": lambda event: requests.append(event.seconds)})
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    local = {name: [] for name in names}
+    errors = {name: 0 for name in names}
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights)[0]
+        start = time.perf_counter()
+        try:
+            SCENARIOS[name](api)
+        except FantraxException:
+            errors[name] += 1
+            continue
+        local[name].append(time.perf_counter() - start)
+    with lock:
+        samples["requests"].extend(requests)
+        for name in names:
+            samples["scenarios"][name].extend(local[name])
+            samples["errors"][name] += errors[name]
+
+
+def worker(url, process, threads, duration, mix, leagues, seed):
+    """ Runs ``threads`` clients in this process and returns their samples and resource usage. """
+    samples = {"requests": [], "scenarios": {name: [] for name in mix}, "errors": {name: 0 for name in mix}}
+    lock = threading.Lock()
+    cpu = cpu_seconds()
+    start = time.perf_counter()
+    deadline = start + duration
+    pool = []
+    for thread in range(threads):
+        number = process * threads + thread
+        args = (url, f"load{number % leagues}", mix, deadline, seed + number, samples, lock)
+        pool.append(threading.Thread(target=client, args=args, daemon=True))
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    samples["elapsed"] = time.perf_counter() - start
+    samples["cpu"] = cpu_seconds() - cpu
+    samples["max_rss_kib"] = max_rss_kib()
+    return samples
+
+
+def summarize(values, elapsed):
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "per_sec": len(values) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(values, 50) * 1e3,
+        "p95_ms": percentile(values, 95) * 1e3,
+        "p99_ms": percentile(values, 99) * 1e3,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=4, help="Clients in each process")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds each client runs scenarios")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"Scenario weights, default {DEFAULT_MIX}")
+    parser.add_argument("--scale", type=int, default=1, choices=sorted(SCALES))
+    parser.add_argument("--leagues", type=int, default=4, help="Leagues the clients are spread across")
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds the server adds to every request")
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context()
+    ready, results, stop = context.Queue(), context.Queue(), context.Event()
+    options = {"latency": args.latency, "jitter": args.jitter, "error_rate": args.error_rate, "seed": args.seed,
+               "league_options": dict(SCALES[args.scale])}
+    server = context.Process(target=serve, args=(options, ready, stop, results), daemon=True)
+    server.start()
+    url = f"http://127.0.0.1:{ready.get(timeout=60)}"
+
+    try:
+        with context.Pool(args.processes) as pool:
+            runs = pool.starmap(worker, [(url, p, args.threads, args.duration, args.mix, args.leagues, args.seed)
+                                         for p in range(args.processes)])
+    finally:
+        stop.set()
+        server_stats = results.get(timeout=60)
+        server.join()
+
+    elapsed = max(run["elapsed"] for run in runs)
+    requests = [value for run in runs for value in run["requests"]]
+    cpu = sum(run["cpu"] for run in runs)
+    rss = [run["max_rss_kib"] for run in runs if run["max_rss_kib"] is not None]
+    report = {
+        "clients": args.processes * args.threads,
+        "elapsed": elapsed,
+        "scenarios": {},
+        "requests": summarize(requests, elapsed),
+        "cpu_ms_per_request": cpu / len(requests) * 1e3 if requests else 0.0,
+        "max_rss_mib": max(rss) / 1024 if rss else None,
+        "server": server_stats,
+    }
+    for name in args.mix:
+        report["scenarios"][name] = summarize([v for run in runs for v in run["scenarios"][name]], elapsed)
+        report["scenarios"][name]["errors"] = sum(run["errors"][name] for run in runs)
+
+    print(f"{report['clients']} clients ({args.processes} processes x {args.threads} threads), scale {args.scale}, "
+          f"{args.latency * 1e3:.0f}ms latency, {elapsed:.1f}s")
+    print(f"{'':<12} {'count':>8} {'per sec':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for name, row in list(report["scenarios"].items()) + [("requests", report["requests"])]:
+        print(f"{name:<12} {row['count']:>8} {row['per_sec']:>9.1f} {row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f} "
+              f"{row['p99_ms']:>9.1f} {row.get('errors', ''):>7}")
+    print(f"\nCPU per request: {report['cpu_ms_per_request']:.2f} ms")
+    if report["max_rss_mib"] is not None:
+        print(f"Max RSS of a worker process: {report['max_rss_mib']:.1f} MiB")
+    print(f"Server: {server_stats['requests']} requests, {server_stats['errors_injected']} injected errors")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
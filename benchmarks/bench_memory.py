@@ -0,0 +1,94 @@
+""" Memory used by the objs models, measured with tracemalloc.
+
+    Reports the bytes allocated per object for each model and for a whole parsed league: schedule, standings,
+    every roster and every available player. Strings shared with the raw response are not counted.
+
+    Run with ``python benchmarks/bench_memory.py [--teams 12] [--periods 26]``.
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import OfflineSession, recorded_responses, schedule # noqa
+from fantraxapi import FantraxAPI # noqa
+from fantraxapi.objs import Matchup, Player, PlayerStats, Position, Record, RosterRow, Team # noqa
+
+
+def measure(build):
+    """ Bytes still allocated after ``build()`` returns, while its result is alive. """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def make_api(num_teams, num_periods):
+    responses = recorded_responses()
+    season = schedule(num_teams, num_periods)
+    standings = responses["getStandings"]
+    responses["getStandings"] = lambda data: season if data.get("view") == "SCHEDULE" else standings
+    responses["getFantasyTeams"]["fantasyTeams"].extend([
+        {"id": k, "name": v["name"], "shortName": v["shortName"], "logoUrl256": v["logoUrl512"]} for k, v in season["fantasyTeamInfo"].items()
+    ])
+    api = FantraxAPI("benchmark", session=OfflineSession(responses))
+    api.positions # noqa
+    api.teams # noqa
+    return api, responses, season
+
+
+def per_object(api, responses, season, count=2000):
+    player_rows = [row for row in responses["getPlayerStats"]["statsTable"] if "scorer" in row]
+    headers = [cell["shortName"] for cell in responses["getPlayerStats"]["tableHeader"]["cells"]]
+    roster_table = responses["getTeamRosterInfo"]["tables"][0]
+    roster_headers = [cell["shortName"] for cell in roster_table["header"]["cells"]]
+    roster_rows = [row for row in roster_table["rows"] if "scorer" in row]
+    matchup_cells = season["tableList"][0]["rows"][0]["cells"]
+    team_id = next(iter(season["fantasyTeamInfo"]))
+    position = next(iter(responses["getRefObject"]["allObjs"].values()))
+    builders = {
+        "Player": lambda i: Player(api, player_rows[i % len(player_rows)]["scorer"]),
+        "PlayerStats": lambda i: PlayerStats(api, player_rows[i % len(player_rows)], headers),
+        "RosterRow": lambda i: RosterRow(api, roster_rows[i % len(roster_rows)], roster_headers),
+        "Matchup": lambda i: Matchup(api, i, matchup_cells),
+        "Record": lambda i: Record(api, team_id, i, {"Pts": "1"}),
+        "Team": lambda i: Team(api, f"team{i}", f"Team {i}", f"T{i}", ""),
+        "Position": lambda i: Position(api, position),
+    }
+    return {name: measure(lambda: [build(i) for i in range(count)]) / count for name, build in builders.items()}
+
+
+def per_league(api):
+    def parse():
+        return (
+            api.scoring_periods(),
+            api.standings(),
+            [api.roster_info(team.team_id) for team in api.teams],
+            api.get_available_players(),
+        )
+    return measure(parse)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument("--periods", type=int, default=26)
+    args = parser.parse_args()
+
+    api, responses, season = make_api(args.teams, args.periods)
+    print(f"{'object':<14} {'bytes/object':>12}")
+    for name, size in per_object(api, responses, season).items():
+        print(f"{name:<14} {size:>12.0f}")
+    total = per_league(api)
+    print(f"\nparsed league ({args.teams} teams, {args.periods} periods): {total / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+""" Parse speed and allocations of every objs constructor, compared against a stored baseline.
+
+    Each case builds Objects from response data that is already decoded, so only the code in ``fantraxapi/objs.py``
+    and the ``_parse_*`` helpers is measured. Players stay interned between runs like they do during a crawl.
+
+    * ``ops/s``: Parses of the whole response per second, from the fastest of ``--repeat`` runs.
+    * ``KiB``: Peak memory allocated by one parse, measured with tracemalloc.
+    * ``blocks``: Memory blocks still allocated while the result of one parse is alive.
+
+    Payloads come from a :class:`~fantraxapi.synthetic.SyntheticLeague` of ``--scale`` or from ``--payloads``, a
+    directory laid out like ``SyntheticLeague.write`` with responses recorded from a real League.
+
+    ``--save`` stores the results in ``benchmarks/baseline_parse.json`` and every later run prints the change from
+    it. With ``--check`` the exit status is 1 when a case got slower or allocates more than ``--tolerance`` allows.
+    Speed is compared on the fastest run, since noise from other processes only ever slows a run down, and the
+    default tolerance is 20%. That default is the value to gate CI with on a dedicated runner. Shared or single CPU
+    VMs can change speed by 40% between runs, so pass ``--tolerance`` there and re-run before trusting a failure.
+    Allocations are deterministic and use the tighter ``--memory-tolerance``. The baseline is machine specific,
+    save a new one before comparing on different hardware.
+
+    Run with ``python benchmarks/bench_parse.py [--scale 1] [--payloads DIR] [--save] [--check]``.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import OfflineSession # noqa
+from fantraxapi import FantraxAPI # noqa
+from fantraxapi.synthetic import SAMPLES, SCALES, SyntheticLeague # noqa
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline_parse.json")
+
+
+def load_payloads(args):
+    """ ``name -> response data`` of every :data:`~fantraxapi.synthetic.SAMPLES` payload and the source label. """
+    if args.payloads:
+        payloads = {}
+        for name in SAMPLES:
+            path = os.path.join(args.payloads, f"{name}.json")
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    payloads[name] = json.load(f)["responses"][0]["data"]
+        return payloads, os.path.basename(os.path.normpath(args.payloads))
+    league = SyntheticLeague.scaled(args.scale)
+    return {name: response for name, (_, _, response) in league.payloads().items()}, f"scale-{args.scale}"
+
+
+def make_api(payloads, lazy):
+    responses = {"getFantasyLeagueInfo": payloads["league_info"], "getFantasyTeams": payloads["teams"], "getRefObject": payloads["positions"]}
+    api = FantraxAPI("benchmark", session=OfflineSession(responses), lazy=lazy)
+    api.teams # noqa
+    api.positions # noqa
+    return api
+
+
+def cases(api, payloads):
+    """ ``name -> parse`` of every case whose payloads are available. """
+    roster_team = api.default_team_id
+    available = {
+        "ScoringPeriod": ("schedule", lambda p: api._parse_scoring_periods(p["schedule"])),
+        "StandingsCollection": ("standings", lambda p: api._parse_standings(p["standings"], None)),
+        "Roster": ("roster_info", lambda p: api._parse_roster(p["roster_info"], roster_team)),
+        "PlayerStats": ("available_players", lambda p: list(api._parse_player_stats(p["available_players"]))),
+        "Transaction": ("transactions", lambda p: api._parse_transactions(p["transactions"])),
+        "Trade": ("pending_trades", lambda p: api._parse_pending_trades(p["pending_trades"])),
+        "TradeBlock": ("trade_blocks", lambda p: api._parse_trade_block(p["trade_blocks"])),
+        "playoffs": ("playoffs", lambda p: api._parse_playoffs(p["playoffs"], [p["playoffs_bracket"]] if "playoffs_bracket" in p else [])),
+    }
+    return {name: (lambda parse=parse: parse(payloads)) for name, (needs, parse) in available.items() if needs in payloads}
+
+
+def allocations(parse):
+    """ Peak KiB allocated by one parse and the blocks still allocated while its result is alive. """
+    gc.collect()
+    tracemalloc.start()
+    result = parse()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    gc.collect()
+    before = sys.getallocatedblocks()
+    del result
+    gc.collect()
+    return peak / 1024, before - sys.getallocatedblocks()
+
+
+def ops_per_second(parse, repeat, min_time=0.2):
+    number, elapsed = 1, timeit.timeit(parse, number=1)
+    while elapsed < min_time:
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+        elapsed = timeit.timeit(parse, number=number)
+    return number / min(timeit.repeat(parse, number=number, repeat=repeat))
+
+
+def change(value, base):
+    return f"{(value - base) / base * 100:+.1f}%" if base else ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=1, choices=sorted(SCALES))
+    parser.add_argument("--payloads", help="Directory of recorded responses named like SyntheticLeague.write")
+    parser.add_argument("--lazy", action="store_true", help="Parse with lazy=True")
+    parser.add_argument("--repeat", type=int, default=11, help="Timed runs of each case, the fastest is reported")
+    parser.add_argument("--save", action="store_true", help=f"Store the results in {os.path.basename(BASELINE)}")
+    parser.add_argument("--check", action="store_true", help="Exit with 1 when a case regressed past --tolerance")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown, 0.2 is 20%%")
+    parser.add_argument("--memory-tolerance", type=float, default=0.1, help="Allowed allocation growth, 0.1 is 10%%")
+    args = parser.parse_args()
+
+    payloads, source = load_payloads(args)
+    source += "-lazy" if args.lazy else ""
+    api = make_api(payloads, args.lazy)
+    baselines = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE, "r", encoding="utf-8") as f:
+            baselines = json.load(f)
+    baseline = baselines.get(source, {}).get("cases", {})
+
+    results, regressions = {}, []
+    print(f"{source} on Python {platform.python_version()}")
+    print(f"{'case':<20} {'ops/s':>10} {'ms/op':>9} {'KiB':>10} {'blocks':>9} {'ops/s vs base':>14} {'KiB vs base':>12}")
+    for name, parse in cases(api, payloads).items():
+        parse() # warm up and intern every Player
+        kib, blocks = allocations(parse)
+        ops = ops_per_second(parse, args.repeat)
+        results[name] = {"ops_per_sec": round(ops, 2), "kib": round(kib, 1), "blocks": blocks}
+        base = baseline.get(name)
+        print(f"{name:<20} {ops:>10.1f} {1e3 / ops:>9.3f} {kib:>10.1f} {blocks:>9} "
+              f"{change(ops, base['ops_per_sec']) if base else '':>14} {change(kib, base['kib']) if base else '':>12}")
+        if base and (ops < base["ops_per_sec"] * (1 - args.tolerance) or kib > base["kib"] * (1 + args.memory_tolerance)):
+            regressions.append(name)
+
+    if args.save:
+        baselines[source] = {"python": platform.python_version(), "machine": platform.machine(), "cases": results}
+        with open(BASELINE, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nBaseline saved for {source}")
+    if regressions:
+        print(f"\nRegressed past {args.tolerance:.0%} slower or {args.memory_tolerance:.0%} more memory: {', '.join(regressions)}")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
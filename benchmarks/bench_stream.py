@@ -0,0 +1,66 @@
+""" Peak memory of walking every available Player with and without ``stream=True``, measured with tracemalloc.
+
+    The recorded getPlayerStats rows are repeated to ``--players`` rows and served in pages of each size. Every
+    :class:`~fantraxapi.objs.PlayerStats` is dropped as soon as it's yielded, so the peak is what the client itself
+    holds on to: the whole page body and decoded page without streaming, a single row with it.
+
+    Run with ``python benchmarks/bench_stream.py [--players 20000]``.
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import OfflineSession, recorded_responses # noqa
+from fantraxapi import FantraxAPI # noqa
+
+
+def player_stats(num_players):
+    """ getPlayerStats callable serving ``num_players`` rows in the requested pages. """
+    data = recorded_responses()["getPlayerStats"]
+    rows = [row for row in data["statsTable"] if "scorer" in row]
+    rows = [rows[i % len(rows)] for i in range(num_players)]
+
+    def page(request):
+        size, number = int(request["maxResultsPerPage"]), int(request["pageNumber"])
+        output = dict(data)
+        output["statsTable"] = rows[(number - 1) * size:number * size]
+        output["paginatedResultSet"] = {"totalNumPages": -(-num_players // size), "pageNumber": number,
+                                        "maxResultsPerPage": size, "totalNumResults": num_players}
+        return output
+    return page
+
+
+def measure(api, page_size, stream):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = sum(1 for _ in api.iter_available_players(page_size=page_size, prefetch=False, stream=stream))
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=20000)
+    args = parser.parse_args()
+
+    responses = recorded_responses()
+    responses["getPlayerStats"] = player_stats(args.players)
+    print(f"{'page size':>10} {'mode':>9} {'players':>8} {'peak MiB':>9} {'seconds':>8}")
+    for page_size in (500, 2000, 5000, args.players):
+        for stream in (False, True):
+            api = FantraxAPI("benchmark", session=OfflineSession(responses))
+            api.positions # noqa: loaded before measuring
+            count, peak, elapsed = measure(api, page_size, stream)
+            print(f"{page_size:>10} {'stream' if stream else 'buffered':>9} {count:>8} {peak / 2 ** 20:>9.1f} {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+""" Team lookup cost as league size and season length grow.
+
+    Run with ``python benchmarks/bench_team_lookup.py``.
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import OfflineSession, league_info, schedule # noqa
+from fantraxapi import FantraxAPI # noqa
+
+
+def run(num_teams, num_periods, repeat=5):
+    payload = schedule(num_teams, num_periods)
+    api = FantraxAPI("benchmark", session=OfflineSession({"getFantasyLeagueInfo": league_info(), "getStandings": payload}))
+    periods = api.scoring_periods()
+    team_ids = list(payload["fantasyTeamInfo"])
+    lookups = len(team_ids) * 100
+    per_lookup = min(timeit.repeat(lambda: [api.team(t) for t in team_ids * 100], number=1, repeat=repeat)) / lookups
+    per_parse = min(timeit.repeat(api.scoring_periods, number=1, repeat=repeat))
+    matchups = sum(len(p.matchups) for p in periods.values())
+    same = api.scoring_periods()[1].matchups[0].away is periods[1].matchups[0].away
+    return per_lookup, per_parse, matchups, same
+
+
+def main():
+    print(f"{'teams':>6} {'periods':>8} {'matchups':>9} {'ns/lookup':>10} {'ms/season':>10} {'stable':>7}")
+    for num_teams in (8, 32, 128, 512):
+        for num_periods in (10, 26, 52):
+            per_lookup, per_parse, matchups, same = run(num_teams, num_periods)
+            print(f"{num_teams:>6} {num_periods:>8} {matchups:>9} {per_lookup * 1e9:>10.0f} {per_parse * 1e3:>10.2f} {str(same):>7}")
+
+
+if __name__ == "__main__":
+    main()
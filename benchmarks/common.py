@@ -0,0 +1,138 @@
+import functools
+import json
+import os
+from datetime import datetime, timedelta
+
+
+def _pieces(value, depth=5):
+    """ JSON text of ``value`` in pieces, splitting the outer ``depth`` levels of dicts and lists into one piece per item. """
+    if depth > 0 and isinstance(value, dict) and value:
+        for i, (key, item) in enumerate(value.items()):
+            yield ("{" if i == 0 else ",") + json.dumps(key) + ":"
+            yield from _pieces(item, depth - 1)
+        yield "}"
+    elif depth > 0 and isinstance(value, list) and value:
+        for i, item in enumerate(value):
+            yield "[" if i == 0 else ","
+            yield from _pieces(item, depth - 1)
+        yield "]"
+    else:
+        yield json.dumps(value)
+
+
+class OfflineResponse:
+    """ Minimal stand-in for :class:`requests.Response` used by the benchmarks.
+
+        The body is only encoded when :attr:`content` is read, :meth:`iter_content` encodes it piece by piece like a
+        streamed download.
+    """
+    def __init__(self, body):
+        self.body = body
+        self.status_code = 200
+        self.reason = "OK"
+        self._content = None
+
+    @property
+    def content(self):
+        if self._content is None:
+            self._content = json.dumps(self.body).encode()
+        return self._content
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size=1):
+        pending = []
+        size = 0
+        for piece in _pieces(self.body):
+            pending.append(piece)
+            size += len(piece)
+            if size >= chunk_size:
+                yield "".join(pending).encode()
+                pending, size = [], 0
+        if pending:
+            yield "".join(pending).encode()
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class OfflineSession:
+    """ Session that answers every Fantrax method from a dict of ``method -> response data``.
+
+        A value can also be a callable taking the request data and returning the response data.
+    """
+    def __init__(self, responses):
+        self.responses = responses
+        self.posts = 0
+
+    def _data(self, msg):
+        value = self.responses[msg["method"]]
+        return value(msg["data"]) if callable(value) else value
+
+    def post(self, url, params=None, json=None, **kwargs):
+        self.posts += 1
+        return OfflineResponse({"responses": [{"data": self._data(msg)} for msg in json["msgs"]]})
+
+
+def league_info(name="Benchmark League"):
+    return {"fantasySettings": {"myDefaultTeamId": "team0", "teamName": "Team 0", "leagueName": name}}
+
+
+def team_info(num_teams):
+    return {f"team{i}": {"name": f"Team {i}", "shortName": f"T{i}", "logoUrl512": ""} for i in range(num_teams)}
+
+
+def schedule(num_teams, num_periods, start=datetime(2024, 10, 7)):
+    """ getStandings view=SCHEDULE shaped response with a full round of matchups every period. """
+    table = []
+    for week in range(1, num_periods + 1):
+        begin = start + timedelta(days=7 * (week - 1))
+        end = begin + timedelta(days=6)
+        rows = []
+        for i in range(0, num_teams - 1, 2):
+            rows.append({"cells": [
+                {"teamId": f"team{i}", "content": f"Team {i}"}, {"content": "101.5"},
+                {"teamId": f"team{i + 1}", "content": f"Team {i + 1}"}, {"content": "1,099.25"}
+            ]})
+        table.append({"caption": f"Scoring Period {week}", "subCaption": f"({begin:%a %b %d, %Y} - {end:%a %b %d, %Y})", "rows": rows})
+    return {"fantasyTeamInfo": team_info(num_teams), "tableList": table}
+
+
+def synthetic_responses(league):
+    """ ``method -> callable`` answering every Fantrax method from a :class:`~fantraxapi.synthetic.SyntheticLeague`. """
+    return {method: functools.partial(league.respond, method) for method in (
+        "getFantasyLeagueInfo", "getFantasyTeams", "getRefObject", "getStandings", "getTeamRosterInfo", "getPlayerStats",
+        "getTransactionDetailsHistory", "getPendingTransactions", "getTradeBlocks"
+    )}
+
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests")
+
+
+def fixture(name):
+    """ Response data of a recorded response in ``tests/``. """
+    with open(os.path.join(FIXTURES, name), "r", encoding="utf-8") as f:
+        return json.load(f)["responses"][0]["data"]
+
+
+def recorded_responses():
+    """ ``method -> response data`` for every recorded fixture plus the pieces they need to parse. """
+    league = fixture("league_info.json")
+    standings = fixture("standings.json")
+    positions = {k: {"id": v["id"], "name": v["name"], "shortName": v["shortName"]} for k, v in league["positionMap"].items()}
+    teams = [{"id": k, "name": v["name"], "shortName": v["shortName"], "logoUrl256": v["logoUrl512"]} for k, v in standings["fantasyTeamInfo"].items()]
+    return {
+        "getFantasyLeagueInfo": league,
+        "getFantasyTeams": {"fantasyTeams": teams},
+        "getRefObject": {"allObjs": positions},
+        "getStandings": standings,
+        "getTeamRosterInfo": fixture("roster_info.json"),
+        "getPlayerStats": fixture("active_available_players.json"),
+    }
@@ -1,8 +1,14 @@
 import importlib.metadata
 
-from fantraxapi.fantrax import FantraxAPI
+from fantraxapi.aio import AsyncBatch, AsyncFantraxAPI
+from fantraxapi.cache import Cache, MemoryCache, SQLiteCache
+from fantraxapi.cassette import Cassette
+from fantraxapi.fantrax import Batch, BatchResult, FantraxAPI, TransactionSync
 from fantraxapi.exceptions import FantraxException
-from fantraxapi.objs import DraftPick, Matchup, Player, Position, Record, ScoringPeriod, StandingsCollection, Standings, Team, Trade, TradeBlock, TradePlayer, Transaction
+from fantraxapi.hooks import ParseEvent, RequestEvent
+from fantraxapi.metrics import Metrics
+from fantraxapi.table import StatsTable
+from fantraxapi.objs import AvailablePlayers, DraftPick, Matchup, Player, Position, Record, ScoringPeriod, StandingsCollection, Standings, Team, Trade, TradeBlock, TradePlayer, Transaction
 
 try:
     __version__ = importlib.metadata.version("fantraxapi")
@@ -17,8 +23,22 @@ __url__ = "https://github.com/meisnate12/FantraxAPI"
 __email__ = "meisnate12@gmail.com"
 __license__ = "MIT License"
 __all__ = [
+    "AsyncBatch",
+    "AsyncFantraxAPI",
+    "Batch",
+    "BatchResult",
+    "Cache",
+    "Cassette",
+    "MemoryCache",
+    "Metrics",
+    "ParseEvent",
+    "RequestEvent",
+    "SQLiteCache",
+    "StatsTable",
+    "TransactionSync",
     "FantraxAPI",
     "FantraxException",
+    "AvailablePlayers",
     "DraftPick",
     "Matchup",
     "Player",
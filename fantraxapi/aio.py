@@ -0,0 +1,474 @@
+import asyncio
+from time import perf_counter
+from typing import Any, AsyncIterator, Callable, Optional, Union, List, Dict, Tuple
+from fantraxapi.cache import Cache
+from fantraxapi.cassette import Cassette
+from fantraxapi.exceptions import FantraxException
+from fantraxapi.fantrax import FANTRAX_URL, Batch, _FantraxBase
+from fantraxapi.hooks import RequestEvent
+from fantraxapi.objs import AvailablePlayers, PlayerStats, ScoringPeriod, Team, StandingsCollection, Trade, TradeBlock, Position, Transaction, Roster
+from fantraxapi.stream import JSONArrayStream
+from fantraxapi.tracing import traced
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class AsyncBatch(Batch):
+    """ :class:`~Batch` for :class:`~AsyncFantraxAPI` used as an ``async with`` context manager.
+
+        .. code-block:: python
+
+            async with api.batch() as batch:
+                standings = batch.request("getStandings")
+            print(standings.data)
+    """
+    async def send(self) -> List[dict]:
+        """ Sends every queued method call in one request.
+
+            Returns:
+                List[dict]: Response data in the same order the calls were added.
+        """
+        if self._sent:
+            raise FantraxException("Batch has already been sent")
+        self._sent = True
+        if not self._results:
+            return []
+        try:
+            responses = await self._api.request_many([(r.method, r.kwargs) for r in self._results])
+        except FantraxException as e:
+            self._fail(e)
+            raise
+        self._finish(responses)
+        return responses
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with an AsyncBatch")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None and not self._sent:
+            await self.send()
+
+
+class AsyncFantraxAPI(_FantraxBase):
+    """ Asyncio Object Class with the same methods as :class:`~FantraxAPI`.
+
+        Requires the ``aiohttp`` package (``pip install fantraxapi[async]``).
+
+        League info, Teams and Positions are loaded with a single request the first time any method needs them or
+        when :meth:`load` is awaited. Until then :attr:`teams` and :attr:`positions` raise :class:`FantraxException`.
+
+        .. code-block:: python
+
+            async with AsyncFantraxAPI(league_id) as api:
+                await api.load()
+                rosters = await asyncio.gather(*[api.roster_info(team.team_id) for team in api.teams])
+
+        Parameters:
+            league_id (str): Fantrax League ID.
+            session (Optional[aiohttp.ClientSession]): Use you're own ClientSession object.
+            max_concurrency (int): Maximum number of requests this object will have in flight at once.
+            semaphore (Optional[asyncio.Semaphore]): Share one limit between multiple objects, overrides ``max_concurrency``.
+            cache (Optional[:class:`~fantraxapi.cache.Cache`]): Cache responses, can be shared between API objects.
+            league_info (Optional[dict]): Response data of a previous ``getFantasyLeagueInfo`` call for this League.
+            fold_league_info (bool): Send ``getFantasyLeagueInfo`` along with the first request instead of during :meth:`load`.
+            lazy (bool): Keep the raw rows of Rosters, Standings and Available Players and only build each row Object
+                (and its stats dict) when it's accessed.
+            json_decoder (Optional[Union[str, Callable[[bytes], Any]]]): ``"orjson"``, ``"msgspec"``, ``"json"`` or a
+                callable used to decode response bodies. Defaults to the fastest one installed.
+            log_payloads (int): Include up to this many characters of every request and response body in the DEBUG
+                logs. ``0`` only logs the method names, status and sizes.
+            hooks (Optional[Dict[str, Union[Callable, List[Callable]]]]): Callbacks for each hook event, see
+                :meth:`~fantraxapi.FantraxAPI.add_hook`. DNS and connect times are only measured on the session this
+                object creates itself.
+            tracer (Optional[opentelemetry.trace.Tracer]): Open a span for each public method with child spans for every
+                request and parse. Any object with OpenTelemetry's ``start_as_current_span`` and ``start_span`` works.
+            cassette (Optional[:class:`~fantraxapi.cassette.Cassette`]): Record every response to a file or replay them
+                from it without the network.
+            base_url (str): Address requests are sent to, e.g. the ``url`` of a local
+                :class:`~fantraxapi.server.FantraxServer`.
+
+        Attributes:
+            league_id (str): Fantrax League ID.
+            default_team_id (str): Team ID of the logged in user's Team.
+            default_team_name (str): Team Name of the logged in user's Team.
+            league_name (str): League Name.
+            teams (List[:class:`~Team`]): List of Teams in the League.
+            cache (Optional[:class:`~fantraxapi.cache.Cache`]): Response Cache.
+            lazy (bool): Rows are built when they are accessed.
+            log_payloads (int): Characters of each request and response body included in the DEBUG logs.
+            tracer (Optional[opentelemetry.trace.Tracer]): Tracer spans are opened with.
+            cassette (Optional[:class:`~fantraxapi.cassette.Cassette`]): Cassette responses are recorded to or replayed from.
+            base_url (str): Address requests are sent to.
+    """
+    def __init__(self, league_id: str, session: Optional["aiohttp.ClientSession"] = None, max_concurrency: int = 10,
+                 semaphore: Optional[asyncio.Semaphore] = None, cache: Optional[Cache] = None,
+                 league_info: Optional[dict] = None, fold_league_info: bool = False, lazy: bool = False,
+                 json_decoder: Optional[Union[str, Callable[[bytes], Any]]] = None, log_payloads: int = 0,
+                 hooks: Optional[Dict[str, Union[Callable, List[Callable]]]] = None, tracer: Optional[Any] = None,
+                 cassette: Optional[Cassette] = None, base_url: str = FANTRAX_URL):
+        if aiohttp is None:
+            raise FantraxException("AsyncFantraxAPI requires aiohttp: pip install aiohttp")
+        super().__init__(league_id, cache=cache, league_info=league_info, fold_league_info=fold_league_info, lazy=lazy,
+                         json_decoder=json_decoder, log_payloads=log_payloads, hooks=hooks, tracer=tracer, cassette=cassette,
+                         base_url=base_url)
+        self._session = session
+        self._own_session = session is None
+        self._max_concurrency = max_concurrency
+        self._semaphore = semaphore
+        self._load_lock = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """ Closes the ClientSession if it was created by this object. """
+        if self._own_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _fetch_league_info(self):
+        raise FantraxException("League Info not loaded: await AsyncFantraxAPI.load() first")
+
+    @property
+    def teams(self) -> List[Team]:
+        if self._teams is None:
+            raise FantraxException("Teams not loaded: await AsyncFantraxAPI.load() first")
+        return list(self._teams.values())
+
+    @property
+    def positions(self) -> Dict[str, Position]:
+        if self._positions is None:
+            raise FantraxException("Positions not loaded: await AsyncFantraxAPI.load() first")
+        return self._positions
+
+    async def load(self) -> "AsyncFantraxAPI":
+        """ Loads the League Info, Teams and Positions in a single request if they aren't loaded already.
+
+            Returns:
+                :class:`~AsyncFantraxAPI`: This object.
+        """
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        async with self._load_lock:
+            calls = []
+            if self._league_info is None and not self._fold_league_info:
+                calls.append(("getFantasyLeagueInfo", {}, self._load_league_info))
+            if self._teams is None:
+                calls.append(("getFantasyTeams", {}, self._load_teams))
+            if self._positions is None:
+                calls.append(("getRefObject", {"type": "Position"}, self._load_positions))
+            if calls:
+                responses = await self.request_many([(method, kwargs) for method, kwargs, _ in calls])
+                for (_, _, loader), response in zip(calls, responses):
+                    loader(response)
+        return self
+
+    def batch(self) -> AsyncBatch:
+        """ :class:`~AsyncBatch` Object used to send multiple method calls in a single request.
+
+            Returns:
+                :class:`~AsyncBatch`
+        """
+        return AsyncBatch(self)
+
+    async def request_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[dict]:
+        """ Sends multiple Fantrax API method calls in a single request.
+
+            Parameters:
+                calls (List[Tuple[str, Dict[str, Any]]]): List of ``(method, kwargs)`` pairs.
+
+            Returns:
+                List[dict]: Response data in the same order as ``calls``.
+
+            Raises:
+                :class:`FantraxException`: When the request fails or Fantrax returns an error.
+        """
+        msgs = self._build_msgs(calls)
+        folded = self._fold_msgs(msgs)
+        cached = self._from_cache(msgs)
+        missing = [m for m, c in zip(msgs, cached) if c is None]
+        responses = self._replay(missing)
+        if responses is None:
+            responses = await self._post(missing) if missing else []
+            self._record(missing, responses)
+        self._to_cache(missing, responses)
+        return self._unfold_responses(msgs, self._merge_cached(cached, responses), folded)
+
+    async def _post(self, msgs) -> List[dict]:
+        self._log_request(msgs)
+        self._connect()
+        with self._span("fantrax.request", self._methods(msgs)) as span:
+            event = self._request_event(msgs)
+            try:
+                try:
+                    async with self._semaphore:
+                        event.mark("queue")
+                        async with self._session.post(self._url, params={"leagueId": self.league_id}, json={"msgs": msgs},
+                                                      trace_request_ctx=event) as response:
+                            event.mark("wait")
+                            content = await response.read()
+                            event.mark("download")
+                    response_json = self._decode(content)
+                    event.mark("decode")
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                    raise FantraxException(f"Failed to Connect to {self._methods(msgs)}: {e}\nData: {[m['data'] for m in msgs]}")
+                event.status, event.response_bytes = response.status, len(content)
+                self._log_response(msgs, response.status, response.reason, response_json, content)
+                return self._check_response(msgs, response.status, response.reason, response_json)
+            except FantraxException as e:
+                event.error = e
+                raise
+            finally:
+                self._finish_request(event, span)
+
+    def _connect(self):
+        if self._session is None:
+            self._session = aiohttp.ClientSession(trace_configs=[_trace_config()])
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+    async def _request(self, method, **kwargs):
+        return (await self.request_many([(method, kwargs)]))[0]
+
+    async def _stream(self, stream: JSONArrayStream, method: str, **kwargs) -> AsyncIterator[Any]:
+        """ Sends one method call, skipping the cache, and yields the elements of ``stream``'s arrays as the body downloads. """
+        msgs = self._build_msgs([(method, kwargs)])
+        self._log_request(msgs)
+        self._connect()
+        span = self._start_span("fantrax.request", self._methods(msgs), **{"fantrax.stream": True})
+        event = self._request_event(msgs)
+        try:
+            try:
+                async with self._semaphore:
+                    event.mark("queue")
+                    async with self._session.post(self._url, params={"leagueId": self.league_id}, json={"msgs": msgs},
+                                                  trace_request_ctx=event) as response:
+                        event.mark("wait")
+                        async for chunk in response.content.iter_chunked(65536):
+                            for element in stream.feed(chunk):
+                                yield element
+                        stream.close()
+                        event.mark("download")
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                raise FantraxException(f"Failed to Connect to {self._methods(msgs)}: {e}\nData: {[m['data'] for m in msgs]}")
+            event.status = response.status
+            self._log_response(msgs, response.status, response.reason, stream.document)
+            self._check_response(msgs, response.status, response.reason, stream.document)
+        except FantraxException as e:
+            event.error = e
+            if span is not None:
+                span.record_exception(e)
+            raise
+        finally:
+            self._finish_request(event, span)
+            if span is not None:
+                span.end()
+
+    @traced
+    async def scoring_periods(self) -> Dict[int, ScoringPeriod]:
+        """ :class:`~ScoringPeriod` Objects for the league.
+
+            Returns:
+                Dict[int, :class:`~ScoringPeriod`]
+        """
+        await self.load()
+        return self._timed_parse("scoring_periods", self._parse_scoring_periods, await self._request("getStandings", view="SCHEDULE"))
+
+    @traced
+    async def standings(self, week: Optional[Union[int, str]] = None) -> StandingsCollection:
+        """ :class:`~StandingsCollection` Object for either the current moment in time or after a specific week..
+
+            Parameters:
+                week (Optional[Union[int, str]]): Pulls data for the Standings at the given week.
+
+            Returns:
+                :class:`~StandingsCollection`
+        """
+        await self.load()
+        return self._timed_parse("standings", self._parse_standings, await self._request("getStandings", **self._standings_kwargs(week)), week)
+
+    @traced
+    async def pending_trades(self) -> List[Trade]:
+        await self.load()
+        return self._timed_parse("pending_trades", self._parse_pending_trades, await self._request("getPendingTransactions"))
+
+    @traced
+    async def trade_block(self) -> List[TradeBlock]:
+        await self.load()
+        return self._timed_parse("trade_block", self._parse_trade_block, await self._request("getTradeBlocks"))
+
+    @traced
+    async def transactions(self, count=100) -> List[Transaction]:
+        await self.load()
+        responses = [await self._request("getTransactionDetailsHistory", maxResultsPerPage=str(count))]
+        while self._continues(responses):
+            responses.append(await self._request("getTransactionDetailsHistory", maxResultsPerPage=str(count), pageNumber=str(len(responses) + 1)))
+        return self._timed_parse("transactions", self._parse_transactions, *responses)
+
+    @traced
+    async def max_goalie_games_this_week(self) -> int:
+        await self.load()
+        return self._timed_parse("max_goalie_games_this_week", self._parse_max_goalie_games, await self._request("getTeamRosterInfo", teamId=self.teams[0].team_id, view="GAMES_PER_POS"))
+
+    @traced
+    async def playoffs(self) -> Dict[int, ScoringPeriod]:
+        await self.load()
+        response = await self._request("getStandings", view="PLAYOFFS")
+        brackets = self._playoff_brackets(response)
+        bracket_responses = await asyncio.gather(*[self._request("getStandings", view=bracket_id) for bracket_id in brackets.values()])
+        return self._timed_parse("playoffs", self._parse_playoffs, response, bracket_responses)
+
+    @traced
+    async def roster_info(self, team_id) -> Roster:
+        await self.load()
+        return self._timed_parse("roster_info", self._parse_roster, await self._request("getTeamRosterInfo", teamId=team_id), team_id)
+
+    @traced
+    async def all_rosters(self) -> Dict[str, Roster]:
+        """ :class:`~Roster` of every Team in the League fetched in a single request.
+
+            Returns:
+                Dict[str, :class:`~Roster`]: Rosters keyed by Team ID.
+        """
+        await self.load()
+        team_ids = [team.team_id for team in self.teams]
+        responses = await self.request_many([("getTeamRosterInfo", {"teamId": team_id}) for team_id in team_ids])
+        return self._timed_parse("all_rosters", self._parse_rosters, team_ids, responses)
+
+    async def _player_stats_pages(self, position, page_size, prefetch=True) -> AsyncIterator[dict]:
+        """ Every page of getPlayerStats, fetching the next page while the current one is used. """
+        def fetch(page_number):
+            return self._request("getPlayerStats", **self._available_players_kwargs(position, page_size, page_number))
+
+        await self.load()
+        upcoming = None
+        try:
+            response = await fetch(1)
+            total = self._total_pages(response)
+            for page in range(2, total + 2):
+                upcoming = asyncio.ensure_future(fetch(page)) if prefetch and page <= total else None
+                yield response
+                if page > total:
+                    break
+                response = await upcoming if upcoming else await fetch(page)
+                upcoming = None
+        finally:
+            if upcoming is not None:
+                upcoming.cancel()
+
+    async def _stream_player_stats(self, position, page_size) -> AsyncIterator[PlayerStats]:
+        """ Every page of getPlayerStats parsed row by row while it downloads. The stat headers come after the rows in
+            the body so they're read from a one Player page first. """
+        await self.load()
+        header_names = self._stat_headers(await self._request("getPlayerStats", **self._available_players_kwargs(position, 1)))
+        page, total = 1, 1
+        while page <= total:
+            stream = JSONArrayStream("statsTable")
+            async for row in self._stream(stream, "getPlayerStats", **self._available_players_kwargs(position, page_size, page)):
+                if "scorer" in row:
+                    yield PlayerStats(self, row, header_names)
+            total = self._total_pages(stream.document["responses"][0]["data"])
+            page += 1
+
+    @traced
+    async def iter_available_players(self, position: Optional[str] = None, page_size: int = 500, prefetch: bool = True,
+                                     stream: bool = False) -> AsyncIterator[PlayerStats]:
+        """ Iterates over the :class:`~PlayerStats` of every available Player, walking through every page of results.
+
+            While one page is being parsed the next page is already being fetched, so at most two pages of results
+            are held in memory at once.
+
+            With ``stream=True`` each page is parsed while it downloads and every row is yielded as soon as it's
+            decoded, so memory stays flat no matter how big ``page_size`` is. Streamed pages skip the cache, are
+            never prefetched and aren't streamed while a :class:`~fantraxapi.cassette.Cassette` is set.
+
+            Parameters:
+                position (Optional[str]): ``G``, ``F`` or ``D`` to only include that Position.
+                page_size (int): Number of Players requested per page.
+                prefetch (bool): Fetch the next page while the current one is parsed.
+                stream (bool): Parse each page incrementally as it downloads.
+
+            Returns:
+                AsyncIterator[:class:`~PlayerStats`]
+        """
+        if stream and self.cassette is None:
+            async for player_stats in self._stream_player_stats(position, page_size):
+                yield player_stats
+            return
+        async for response in self._player_stats_pages(position, page_size, prefetch=prefetch):
+            for player_stats in self._parse_player_stats(response):
+                yield player_stats
+
+    @traced
+    async def get_available_players(self, position: Optional[str] = None, page_size: int = 500) -> AvailablePlayers:
+        """ :class:`~AvailablePlayers` Object with every available Player across all pages of results.
+
+            Parameters:
+                position (Optional[str]): ``G``, ``F`` or ``D`` to only include that Position.
+                page_size (int): Number of Players requested per page.
+
+            Returns:
+                :class:`~AvailablePlayers`
+        """
+        return self._timed_parse("get_available_players", self._parse_available_players, [response async for response in self._player_stats_pages(position, page_size)])
+
+
+def _trace_config() -> "aiohttp.TraceConfig":
+    """ Records DNS and connect times on the :class:`~fantraxapi.hooks.RequestEvent` passed as ``trace_request_ctx``. """
+    async def dns_start(session, context, params):
+        context.dns_start = perf_counter()
+
+    async def dns_end(session, context, params):
+        context.dns = perf_counter() - context.dns_start
+        if isinstance(context.trace_request_ctx, RequestEvent):
+            context.trace_request_ctx.record("dns", context.dns)
+
+    async def connect_start(session, context, params):
+        context.connect_start = perf_counter()
+        context.dns = 0.0
+
+    async def connect_end(session, context, params):
+        if isinstance(context.trace_request_ctx, RequestEvent):
+            context.trace_request_ctx.record("connect", perf_counter() - context.connect_start - context.dns)
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_dns_resolvehost_start.append(dns_start)
+    trace_config.on_dns_resolvehost_end.append(dns_end)
+    trace_config.on_connection_create_start.append(connect_start)
+    trace_config.on_connection_create_end.append(connect_end)
+    return trace_config
+
+
+async def gather_limited(*aws, limit: int = 10) -> list:
+    """ Awaits many awaitables at once with at most ``limit`` running at the same time.
+
+        Useful for fanning out over many leagues, each with their own :class:`~AsyncFantraxAPI`.
+
+        .. code-block:: python
+
+            apis = [AsyncFantraxAPI(league_id) for league_id in league_ids]
+            all_standings = await gather_limited(*[api.standings() for api in apis], limit=20)
+
+        Parameters:
+            aws: Awaitables to run.
+            limit (int): Maximum number running at once.
+
+        Returns:
+            list: Results in the same order as ``aws``.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(aw):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*[_run(aw) for aw in aws])
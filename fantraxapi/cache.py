@@ -0,0 +1,310 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+DEFAULT_TTLS = {
+    "getFantasyLeagueInfo": 3600,
+    "getFantasyTeams": 3600,
+    "getRefObject": 86400,
+    "getStandings": 300,
+}
+""" Default seconds each Fantrax method is cached for. Methods not listed use ``default_ttl``. """
+
+
+class Cache:
+    """ Base class for response caches used by :class:`~fantraxapi.FantraxAPI`.
+
+        Responses are cached per message of a request and keyed on the method name plus the sorted request data
+        (which includes the League ID), so a single Cache can be shared between multiple API objects. Every lookup
+        returns a copy, changing a response doesn't change what later lookups get.
+
+        Subclasses implement ``_get``, ``_set``, ``_delete`` and ``_clear``.
+
+        Parameters:
+            ttls (Optional[Dict[str, float]]): Seconds to cache each method for. Defaults to :data:`DEFAULT_TTLS`.
+            default_ttl (float): Seconds to cache methods not in ``ttls`` for. ``0`` disables caching for them.
+
+        Attributes:
+            hits (int): Number of lookups answered from the cache.
+            misses (int): Number of lookups not found or expired.
+            evictions (int): Number of entries removed to stay under the size limit.
+            expirations (int): Number of entries removed because their TTL passed.
+    """
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, default_ttl: float = 0):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._lock = threading.RLock()
+
+    def ttl(self, method: str) -> float:
+        """ Seconds responses for the given method are cached for. """
+        return self.ttls.get(method, self.default_ttl)
+
+    @staticmethod
+    def key(method: str, data: Dict[str, Any]) -> str:
+        """ Cache key for a method and its request data. """
+        return json.dumps([method, data], sort_keys=True, separators=(",", ":"), default=str)
+
+    def get(self, method: str, data: Dict[str, Any]) -> Optional[dict]:
+        """ Cached response data for the method and request data or ``None`` if it's not cached or expired. """
+        if self.ttl(method) <= 0:
+            return None
+        with self._lock:
+            value = self._get(self.key(method, data), time.time())
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def set(self, method: str, data: Dict[str, Any], value: dict):
+        """ Caches response data for the method and request data using the method's TTL. """
+        ttl = self.ttl(method)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._set(self.key(method, data), method, data.get("leagueId"), value, time.time() + ttl)
+
+    def invalidate(self, method: Optional[str] = None, league_id: Optional[str] = None):
+        """ Removes cached entries matching the method and/or League ID, or every entry when neither is given. """
+        with self._lock:
+            if method is None and league_id is None:
+                self._clear()
+            else:
+                self._delete(method, league_id)
+
+    def clear(self):
+        """ Removes every cached entry and resets the statistics. """
+        with self._lock:
+            self._clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """ Hit, miss and size statistics for the cache. """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "entries": self._entries(),
+                "bytes": self._bytes(),
+            }
+
+    def _get(self, key, now):
+        raise NotImplementedError
+
+    def _set(self, key, method, league_id, value, expires):
+        raise NotImplementedError
+
+    def _delete(self, method, league_id):
+        raise NotImplementedError
+
+    def _clear(self):
+        raise NotImplementedError
+
+    def _entries(self) -> int:
+        raise NotImplementedError
+
+    def _bytes(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryCache(Cache):
+    """ In-memory LRU :class:`~Cache` bounded by number of entries and optionally by bytes.
+
+        Responses are stored as JSON and decoded on every hit, so like :class:`~SQLiteCache` each lookup returns a
+        fresh copy that callers can change without affecting the cache.
+
+        .. code-block:: python
+
+            cache = MemoryCache(max_entries=512, max_bytes=50_000_000)
+            api = FantraxAPI(league_id, cache=cache)
+            print(cache.stats)
+
+        Parameters:
+            max_entries (int): Maximum number of cached responses.
+            max_bytes (Optional[int]): Maximum total JSON size of cached responses.
+            ttls (Optional[Dict[str, float]]): Seconds to cache each method for. Defaults to :data:`DEFAULT_TTLS`.
+            default_ttl (float): Seconds to cache methods not in ``ttls`` for. ``0`` disables caching for them.
+    """
+    def __init__(self, max_entries: int = 1024, max_bytes: Optional[int] = None, ttls: Optional[Dict[str, float]] = None, default_ttl: float = 0):
+        super().__init__(ttls=ttls, default_ttl=default_ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._size = 0
+
+    def _get(self, key, now):
+        if key not in self._data:
+            return None
+        method, league_id, value, expires, size = self._data[key]
+        if expires <= now:
+            self._pop(key)
+            self.expirations += 1
+            return None
+        self._data.move_to_end(key)
+        return json.loads(value)
+
+    def _set(self, key, method, league_id, value, expires):
+        payload = json.dumps(value, separators=(",", ":"))
+        size = len(payload)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        if key in self._data:
+            self._pop(key)
+        self._data[key] = (method, league_id, payload, expires, size)
+        self._size += size
+        while len(self._data) > self.max_entries or (self.max_bytes is not None and self._size > self.max_bytes):
+            self._pop(next(iter(self._data)))
+            self.evictions += 1
+
+    def _pop(self, key):
+        self._size -= self._data.pop(key)[4]
+
+    def _delete(self, method, league_id):
+        for key, entry in list(self._data.items()):
+            if (method is None or entry[0] == method) and (league_id is None or entry[1] == league_id):
+                self._pop(key)
+
+    def _clear(self):
+        self._data.clear()
+        self._size = 0
+
+    def _entries(self):
+        return len(self._data)
+
+    def _bytes(self):
+        return self._size
+
+
+class SQLiteCache(Cache):
+    """ Persistent :class:`~Cache` stored in a SQLite database that multiple processes can share.
+
+        The database runs in WAL mode so readers don't block the writer, payloads are stored as zlib compressed JSON
+        and the least recently used entries are evicted when the compressed size passes ``max_bytes``.
+
+        .. code-block:: python
+
+            cache = SQLiteCache("/var/cache/fantrax.db", max_bytes=200_000_000)
+            api = FantraxAPI(league_id, cache=cache)
+
+        Parameters:
+            path (str): Path to the database file. Created if it doesn't exist.
+            max_bytes (Optional[int]): Maximum total compressed size of cached responses.
+            max_entries (Optional[int]): Maximum number of cached responses.
+            ttls (Optional[Dict[str, float]]): Seconds to cache each method for. Defaults to :data:`DEFAULT_TTLS`.
+            default_ttl (float): Seconds to cache methods not in ``ttls`` for. ``0`` disables caching for them.
+            compression_level (int): zlib compression level used for payloads.
+            timeout (float): Seconds to wait for another process to release a lock.
+    """
+    def __init__(self, path: str, max_bytes: Optional[int] = 100_000_000, max_entries: Optional[int] = None, ttls: Optional[Dict[str, float]] = None,
+                 default_ttl: float = 0, compression_level: int = 6, timeout: float = 10):
+        super().__init__(ttls=ttls, default_ttl=default_ttl)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.compression_level = compression_level
+        self.timeout = timeout
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, method TEXT NOT NULL, league_id TEXT, "
+                         "payload BLOB NOT NULL, size INTEGER NOT NULL, expires REAL NOT NULL, accessed REAL NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires)")
+
+    def _connection(self) -> sqlite3.Connection:
+        """ Connection for the current thread and process, connections are never shared across a fork. """
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def close(self):
+        """ Closes the database connection for the current thread. """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _get(self, key, now):
+        conn = self._connection()
+        row = conn.execute("SELECT payload, expires FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        payload, expires = row
+        if expires <= now:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.expirations += 1
+            return None
+        conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        return json.loads(zlib.decompress(payload))
+
+    def _set(self, key, method, league_id, value, expires):
+        payload = zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"), self.compression_level)
+        if self.max_bytes is not None and len(payload) > self.max_bytes:
+            return
+        now = time.time()
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("INSERT OR REPLACE INTO responses (key, method, league_id, payload, size, expires, accessed) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                         (key, method, league_id, payload, len(payload), expires, now))
+            self.expirations += conn.execute("DELETE FROM responses WHERE expires <= ?", (now,)).rowcount
+            self._evict(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _evict(self, conn):
+        entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        over_entries = entries - self.max_entries if self.max_entries is not None else 0
+        over_bytes = size - self.max_bytes if self.max_bytes is not None else 0
+        if over_entries <= 0 and over_bytes <= 0:
+            return
+        evict = []
+        for key, entry_size in conn.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            if over_entries <= 0 and over_bytes <= 0:
+                break
+            evict.append((key,))
+            over_entries -= 1
+            over_bytes -= entry_size
+        conn.executemany("DELETE FROM responses WHERE key = ?", evict)
+        self.evictions += len(evict)
+
+    def _delete(self, method, league_id):
+        conn = self._connection()
+        if method is not None and league_id is not None:
+            conn.execute("DELETE FROM responses WHERE method = ? AND league_id = ?", (method, league_id))
+        elif method is not None:
+            conn.execute("DELETE FROM responses WHERE method = ?", (method,))
+        else:
+            conn.execute("DELETE FROM responses WHERE league_id = ?", (league_id,))
+
+    def _clear(self):
+        self._connection().execute("DELETE FROM responses")
+
+    def _entries(self):
+        return self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _bytes(self):
+        return self._connection().execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
@@ -0,0 +1,140 @@
+import gzip
+import json
+import os
+import threading
+from typing import Any, Dict, List
+
+from fantraxapi.cache import Cache
+from fantraxapi.exceptions import FantraxException
+
+MODES = ("record", "replay", "auto")
+
+
+class Cassette:
+    """ Records the response data of every message sent to Fantrax to a gzip compressed JSON file and replays it
+        without touching the network.
+
+        Responses are matched on the method name plus the request data, the same key :class:`~fantraxapi.cache.Cache`
+        uses. When the same message was recorded more than once the responses are replayed in the order they were
+        recorded and the last one is repeated after that, so a replay is always deterministic. Responses are kept as
+        JSON and every play decodes a fresh copy, so changing a replayed or recorded response doesn't change the
+        cassette.
+
+        .. code-block:: python
+
+            with Cassette("league.json.gz", mode="record") as cassette:
+                api = FantraxAPI(league_id, cassette=cassette)
+                api.standings()
+
+            api = FantraxAPI(league_id, cassette=Cassette("league.json.gz"))
+            api.standings()  # served from the file
+
+        Streaming is turned off while a cassette is set because whole responses are recorded.
+
+        Parameters:
+            path (str): Path to the cassette file.
+            mode (str): ``record`` always sends requests and records them, ``replay`` only serves recorded responses
+                and ``auto`` replays when the file exists and records otherwise.
+
+        Attributes:
+            path (str): Path to the cassette file.
+            mode (str): ``record`` or ``replay``.
+            plays (int): Number of responses served from the cassette.
+            records (int): Number of responses recorded since it was loaded.
+    """
+    def __init__(self, path: str, mode: str = "auto"):
+        if mode not in MODES:
+            raise FantraxException(f"Cassette Mode: {mode} not found, options: {', '.join(MODES)}")
+        self.path = path
+        self.mode = ("replay" if os.path.exists(path) else "record") if mode == "auto" else mode
+        self.plays = 0
+        self.records = 0
+        self._lock = threading.Lock()
+        self._interactions: Dict[str, List[dict]] = {}
+        self._positions: Dict[str, int] = {}
+        if self.mode == "replay":
+            self.load()
+
+    @property
+    def replaying(self) -> bool:
+        """ ``True`` when responses are served from the cassette. """
+        return self.mode == "replay"
+
+    def load(self):
+        """ Reads the recorded interactions from :attr:`path`. """
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise FantraxException(f"Failed to Load Cassette {self.path}: {e}")
+        with self._lock:
+            self._interactions = {}
+            self._positions = {}
+            for interaction in data["interactions"]:
+                self._interactions.setdefault(Cache.key(interaction["method"], interaction["data"]), []).append(
+                    {"method": interaction["method"], "data": interaction["data"], "response": self._encode(interaction["response"])}
+                )
+
+    def save(self):
+        """ Writes every recorded interaction to :attr:`path`. """
+        with self._lock:
+            interactions = [{"method": i["method"], "data": i["data"], "response": json.loads(i["response"])}
+                            for recorded in self._interactions.values() for i in recorded]
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            json.dump({"version": 1, "interactions": interactions}, f, separators=(",", ":"))
+
+    def record(self, msgs: List[Dict[str, Any]], responses: List[dict]):
+        """ Adds the response data of each message. """
+        with self._lock:
+            for msg, response in zip(msgs, responses):
+                self._interactions.setdefault(Cache.key(msg["method"], msg["data"]), []).append(
+                    {"method": msg["method"], "data": msg["data"], "response": self._encode(response)}
+                )
+                self.records += 1
+
+    def play(self, msgs: List[Dict[str, Any]]) -> List[dict]:
+        """ Recorded response data of each message.
+
+            Raises:
+                :class:`FantraxException`: When a message was never recorded.
+        """
+        responses = []
+        with self._lock:
+            for msg in msgs:
+                key = Cache.key(msg["method"], msg["data"])
+                if key not in self._interactions:
+                    raise FantraxException(f"No Recorded Response in {self.path} for {msg['method']}: {msg['data']}")
+                recorded = self._interactions[key]
+                position = self._positions.get(key, 0)
+                self._positions[key] = position + 1
+                responses.append(json.loads(recorded[min(position, len(recorded) - 1)]["response"]))
+                self.plays += 1
+        return responses
+
+    @staticmethod
+    def _encode(response) -> str:
+        return json.dumps(response, separators=(",", ":"))
+
+    def rewind(self):
+        """ Replays every message from its first recorded response again. """
+        with self._lock:
+            self._positions = {}
+
+    def __len__(self):
+        return sum(len(recorded) for recorded in self._interactions.values())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.mode == "record":
+            self.save()
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        return f"Cassette: {self.path} ({self.mode}, {len(self)} Responses)"
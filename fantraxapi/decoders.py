@@ -0,0 +1,55 @@
+import json
+from typing import Any, Callable, Dict, Optional, Union
+from fantraxapi.exceptions import FantraxException
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+_msgspec_decoder = msgspec.json.Decoder() if msgspec is not None else None
+
+
+def _msgspec_loads(content: bytes) -> Any:
+    try:
+        return _msgspec_decoder.decode(content)
+    except msgspec.DecodeError as e:
+        raise ValueError(str(e)) from e
+
+
+DECODERS: Dict[str, Callable[[bytes], Any]] = {"json": json.loads}
+""" Available JSON decoders by name. ``orjson`` and ``msgspec`` are only included when they are installed. """
+if msgspec is not None:
+    DECODERS["msgspec"] = _msgspec_loads
+if orjson is not None:
+    DECODERS["orjson"] = orjson.loads
+
+_preferred = ["orjson", "msgspec", "json"]
+
+
+def get_decoder(decoder: Optional[Union[str, Callable[[bytes], Any]]] = None) -> Callable[[bytes], Any]:
+    """ JSON decoder that parses a response body straight from bytes.
+
+        Parameters:
+            decoder (Optional[Union[str, Callable[[bytes], Any]]]): ``"orjson"``, ``"msgspec"``, ``"json"`` or your own
+                callable that raises ``ValueError`` on invalid JSON. Defaults to the fastest one installed.
+
+        Returns:
+            Callable[[bytes], Any]
+
+        Raises:
+            :class:`FantraxException`: When the named decoder isn't installed.
+    """
+    if callable(decoder):
+        return decoder
+    if decoder is None:
+        return next(DECODERS[name] for name in _preferred if name in DECODERS)
+    if decoder not in DECODERS:
+        raise FantraxException(f"JSON Decoder: {decoder} not installed, options: {', '.join(DECODERS)}")
+    return DECODERS[decoder]
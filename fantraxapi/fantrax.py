@@ -1,51 +1,334 @@
+import contextvars
+import itertools
+import json
 import logging
-from typing import Optional, Union, List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Callable, Optional, Union, List, Dict, Iterator, Tuple
 from requests import Session
-from json.decoder import JSONDecodeError
 from requests.exceptions import RequestException
+from fantraxapi.cache import Cache
+from fantraxapi.cassette import Cassette
+from fantraxapi.decoders import get_decoder
 from fantraxapi.exceptions import FantraxException, Unauthorized
-from fantraxapi.objs import ScoringPeriod, Team, StandingsCollection, PlayerStats, Trade, TradeBlock, Position, Transaction, Roster
+from fantraxapi.hooks import HOOK_EVENTS, ParseEvent, RequestEvent
+from fantraxapi.stream import JSONArrayStream
+from fantraxapi.tracing import NO_SPAN, traced
+from fantraxapi.objs import AvailablePlayers, Player, ScoringPeriod, Team, StandingsCollection, PlayerStats, Trade, TradeBlock, Position, Transaction, Roster
 
 logger = logging.getLogger(__name__)
 
+FANTRAX_URL = "https://www.fantrax.com"
+""" Default address requests are sent to. """
 
 
-class FantraxAPI:
-    """ Main Object Class
+class BatchResult:
+    """ Placeholder for the response of a single method call inside a :class:`~Batch`.
+
+        Attributes:
+            method (str): Fantrax API Method Name.
+            kwargs (dict): Data sent with the Method.
+    """
+    def __init__(self, method: str, kwargs: dict):
+        self.method = method
+        self.kwargs = kwargs
+        self._data = None
+        self._done = False
+        self._error = None
+
+    @property
+    def data(self) -> dict:
+        """ Response data for this call.
+
+            Raises:
+                :class:`FantraxException`: When the Batch has not been sent yet or sending it failed.
+        """
+        if self._error is not None:
+            raise FantraxException(f"Batch containing {self.method} failed: {self._error}") from self._error
+        if not self._done:
+            raise FantraxException(f"Batch containing {self.method} has not been sent")
+        return self._data
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        return f"{self.method} ({'Failed' if self._error is not None else 'Done' if self._done else 'Pending'})"
+
+
+class Batch:
+    """ Collects multiple Fantrax API method calls and sends them to Fantrax in a single request.
+
+        Used as a context manager the Batch is sent when the ``with`` block exits without an error.
+
+        .. code-block:: python
+
+            with api.batch() as batch:
+                info = batch.request("getFantasyLeagueInfo")
+                rosters = [batch.request("getTeamRosterInfo", teamId=t) for t in team_ids]
+            print(info.data)
 
         Parameters:
-            league_id (str): Fantrax League ID.
-            session (Optional[Session]): Use you're own Session object
+            api (:class:`~FantraxAPI`): API Object used to send the Batch.
+    """
+    def __init__(self, api):
+        self._api = api
+        self._results = []
+        self._sent = False
+
+    def request(self, method: str, **kwargs) -> BatchResult:
+        """ Adds a method call to the Batch.
+
+            Parameters:
+                method (str): Fantrax API Method Name.
+                kwargs: Data sent with the Method.
+
+            Returns:
+                :class:`~BatchResult`
+
+            Raises:
+                :class:`FantraxException`: When the Batch has already been sent.
+        """
+        if self._sent:
+            raise FantraxException("Batch has already been sent")
+        result = BatchResult(method, kwargs)
+        self._results.append(result)
+        return result
+
+    def send(self) -> List[dict]:
+        """ Sends every queued method call in one request.
+
+            Returns:
+                List[dict]: Response data in the same order the calls were added.
+        """
+        if self._sent:
+            raise FantraxException("Batch has already been sent")
+        self._sent = True
+        if not self._results:
+            return []
+        try:
+            responses = self._api.request_many([(r.method, r.kwargs) for r in self._results])
+        except FantraxException as e:
+            self._fail(e)
+            raise
+        self._finish(responses)
+        return responses
+
+    def _finish(self, responses):
+        for result, data in zip(self._results, responses):
+            result._data = data
+            result._done = True
+
+    def _fail(self, error):
+        for result in self._results:
+            result._error = error
+
+    def __len__(self):
+        return len(self._results)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None and not self._sent:
+            self.send()
+
+
+class TransactionSync:
+    """ Incrementally syncs the Transaction history of a League.
+
+        Remembers the newest Transaction ID it has returned, so each :meth:`poll` only pages back through
+        ``getTransactionDetailsHistory`` until it reaches a Transaction it has already seen. Save :attr:`last_id`
+        and pass it back in to resume the sync in another process.
+
+        .. code-block:: python
+
+            sync = api.transaction_sync()
+            history = sync.backfill()  # the whole season, once
+            new = sync.poll()          # usually a single small request
+
+        Parameters:
+            api (:class:`~FantraxAPI`): API Object used to make the requests.
+            last_id (Optional[str]): Newest Transaction ID already seen.
+            page_size (int): Number of Transaction rows requested per page.
 
         Attributes:
-            league_id (str): Fantrax League ID.
-            teams (List[:class:`~Team`]): List of Teams in the League.
+            last_id (Optional[str]): Newest Transaction ID already seen.
+            page_size (int): Number of Transaction rows requested per page.
     """
-    def __init__(self, league_id: str, session: Optional[Session] = None):
+    def __init__(self, api, last_id: Optional[str] = None, page_size: int = 25):
+        self._api = api
+        self.last_id = last_id
+        self.page_size = page_size
+
+    def poll(self) -> List[Transaction]:
+        """ Transactions made since the last poll, newest first. The first poll with no :attr:`last_id` is a :meth:`backfill`.
+
+            Returns:
+                List[:class:`~Transaction`]
+        """
+        return self._sync(self.last_id)
+
+    def backfill(self) -> List[Transaction]:
+        """ Every Transaction of the League, newest first, regardless of :attr:`last_id`.
+
+            Returns:
+                List[:class:`~Transaction`]
+        """
+        return self._sync(None)
+
+    def _sync(self, stop_id):
+        transactions = list(self._api._group_transactions(self._api._transaction_rows(self.page_size, stop_id=stop_id)))
+        if transactions:
+            self.last_id = transactions[0].id
+        return transactions
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        return f"Transaction Sync ({self.last_id})"
+
+
+class _FantraxBase:
+    """ State and response parsing shared by :class:`~FantraxAPI` and :class:`~fantraxapi.aio.AsyncFantraxAPI`. """
+    def __init__(self, league_id: str, cache: Optional[Cache] = None, league_info: Optional[dict] = None, fold_league_info: bool = False,
+                 lazy: bool = False, json_decoder: Optional[Union[str, Callable[[bytes], Any]]] = None, log_payloads: int = 0,
+                 hooks: Optional[Dict[str, Union[Callable, List[Callable]]]] = None, tracer: Optional[Any] = None,
+                 cassette: Optional[Cassette] = None, base_url: str = FANTRAX_URL):
         self.league_id = league_id
-        self._session = Session() if session is None else session
+        self.base_url = base_url.rstrip("/")
+        self.tracer = tracer
+        self.cassette = cassette
+        self.cache = cache
+        self.lazy = lazy
+        self.log_payloads = log_payloads
+        self._hooks = {event: [] for event in HOOK_EVENTS}
+        for event, callbacks in (hooks or {}).items():
+            for callback in [callbacks] if callable(callbacks) else callbacks:
+                self.add_hook(event, callback)
+        self._decode = get_decoder(json_decoder)
         self._teams = None
         self._positions = None
+        self._players = {}
+        self._league_info = None
+        self._fold_league_info = fold_league_info
+        if league_info is not None:
+            self._load_league_info(league_info)
+
+    @property
+    def _url(self) -> str:
+        return f"{self.base_url}/fxpa/req"
+
+    @property
+    def default_team_id(self) -> str:
+        return self._settings["myDefaultTeamId"]
+
+    @property
+    def default_team_name(self) -> str:
+        return self._settings["teamName"]
+
+    @property
+    def league_name(self) -> str:
+        return self._settings["leagueName"]
+
+    @property
+    def _settings(self) -> dict:
+        if self._league_info is None:
+            self._fetch_league_info()
+        return self._league_info
 
-        response = self._request("getFantasyLeagueInfo")
-        self.default_team_id = response["fantasySettings"]["myDefaultTeamId"]
-        self.default_team_name = response["fantasySettings"]["teamName"]
-        self.league_name = response["fantasySettings"]["leagueName"]
+    def _fetch_league_info(self):
+        raise NotImplementedError
 
     @property
     def teams(self) -> List[Team]:
-        if self._teams is None:
-            response = self._request("getFantasyTeams")
-            self._teams = []
-            for data in response["fantasyTeams"]:
-                self._teams.append(Team(self, data["id"], data["name"], data["shortName"], data["logoUrl256"]))
-        return self._teams
+        raise NotImplementedError
 
     @property
     def positions(self) -> Dict[str, Position]:
-        if self._positions is None:
-            self._positions = {k: Position(self, v) for k, v in self._request("getRefObject", type="Position")["allObjs"].items()}
-        return self._positions
+        raise NotImplementedError
+
+    def add_hook(self, event: str, callback: Callable) -> Callable:
+        """ Calls ``callback`` on every ``event`` and returns it.
+
+            * ``on_request``: A :class:`~fantraxapi.hooks.RequestEvent` right before each request is sent.
+            * ``on_response``: The same :class:`~fantraxapi.hooks.RequestEvent` once the response is decoded and
+              checked, or the request failed.
+            * ``on_parsed``: A :class:`~fantraxapi.hooks.ParseEvent` after a method finishes building its Objects.
+
+            Hooks can be called from the background thread that prefetches pages. Exceptions raised by a hook are
+            logged and ignored.
+
+            Parameters:
+                event (str): ``on_request``, ``on_response`` or ``on_parsed``.
+                callback (Callable): Function called with the event.
+
+            Raises:
+                :class:`FantraxException`: When the event doesn't exist.
+        """
+        if event not in self._hooks:
+            raise FantraxException(f"Hook Event: {event} not found, options: {', '.join(HOOK_EVENTS)}")
+        self._hooks[event].append(callback)
+        return callback
+
+    def remove_hook(self, event: str, callback: Callable):
+        """ Stops calling ``callback`` on ``event``. """
+        if event in self._hooks and callback in self._hooks[event]:
+            self._hooks[event].remove(callback)
+
+    def _fire(self, event, payload):
+        for callback in self._hooks[event]:
+            try:
+                callback(payload)
+            except Exception:
+                logger.exception("%s hook %r failed", event, callback)
+
+    def _request_event(self, msgs) -> RequestEvent:
+        """ Event for a request about to be sent, ``on_request`` hooks are called with it. """
+        hooked = self._hooks["on_request"] or self._hooks["on_response"]
+        event = RequestEvent(self.league_id, [m["method"] for m in msgs], len(json.dumps({"msgs": msgs}, default=str)) if hooked else None)
+        self._fire("on_request", event)
+        event._last = perf_counter() # time spent in the hooks isn't part of the request
+        return event
+
+    def _finish_request(self, event, span):
+        """ Calls the ``on_response`` hooks and copies the event onto the request span. """
+        if span is not None:
+            span.set_attribute("http.response.status_code", event.status or 0)
+            if event.response_bytes is not None:
+                span.set_attribute("http.response.body.size", event.response_bytes)
+            for phase, seconds in event.timings.items():
+                span.set_attribute(f"fantrax.timing.{phase}", seconds)
+            if event.error is not None:
+                span.set_attribute("error.type", type(event.error).__name__)
+        self._fire("on_response", event)
+
+    def _span_attributes(self, method, **attributes) -> Dict[str, Any]:
+        return {"fantrax.league_id": self.league_id, "fantrax.method": method, **attributes}
+
+    def _span(self, name, method, **attributes):
+        """ Child span of the current span, or a context manager that does nothing when there's no tracer. """
+        if self.tracer is None:
+            return NO_SPAN
+        return self.tracer.start_as_current_span(name, attributes=self._span_attributes(method, **attributes))
+
+    def _start_span(self, name, method, **attributes):
+        """ Span that isn't made current for requests that yield, ended by the caller. ``None`` without a tracer. """
+        if self.tracer is None:
+            return None
+        return self.tracer.start_span(name, attributes=self._span_attributes(method, **attributes))
+
+    def _timed_parse(self, name, parse, *args):
+        """ ``parse(*args)`` reported to the ``on_parsed`` hooks as ``name``. """
+        if not self._hooks["on_parsed"] and self.tracer is None:
+            return parse(*args)
+        with self._span("fantrax.parse", name):
+            start = perf_counter()
+            result = parse(*args)
+            seconds = perf_counter() - start
+        self._fire("on_parsed", ParseEvent(self.league_id, name, seconds))
+        return result
 
     def team(self, team_id: str) -> Team:
         """ :class:`~Team` Object for the given Team ID.
@@ -59,108 +342,260 @@ class FantraxAPI:
             Raises:
                 :class:`FantraxException`: When an Invalid Team ID is provided.
         """
-        for team in self.teams:
-            if team.team_id == team_id:
-                return team
+        if self._teams is None:
+            self.teams # noqa
+        if team_id in self._teams:
+            return self._teams[team_id]
         raise FantraxException(f"Team ID: {team_id} not found")
 
-    def _request(self, method, **kwargs):
-        data = {"leagueId": self.league_id}
-        for key, value in kwargs.items():
-            data[key] = value
-        json_data = {"msgs": [{"method": method, "data": data}]}
-        logger.debug(f"Request JSON: {json_data}")
+    def player(self, scorer_id: str) -> Player:
+        """ :class:`~Player` Object for the given Player ID.
 
-        try:
-            response = self._session.post("https://www.fantrax.com/fxpa/req", params={"leagueId": self.league_id}, json=json_data)
-            response_json = response.json()
-        except (RequestException, JSONDecodeError) as e:
-            raise FantraxException(f"Failed to Connect to {method}: {e}\nData: {data}")
-        logger.debug(f"Response ({response.status_code} [{response.reason}]) {response_json}")
-        if response.status_code >= 400:
-            raise FantraxException(f"({response.status_code} [{response.reason}]) {response_json}")
+            Every Player parsed by this object is kept here and updated in place whenever it shows up again, so the
+            same Player ID always returns the same Object.
+
+            Parameters:
+                scorer_id (str): Player ID.
+
+            Returns:
+                :class:`~Player`
+
+            Raises:
+                :class:`FantraxException`: When the Player hasn't been seen in any response yet.
+        """
+        if scorer_id in self._players:
+            return self._players[scorer_id]
+        raise FantraxException(f"Player ID: {scorer_id} not found")
+
+    def _player(self, data) -> Player:
+        """ Returns the registered Player for the scorer data updated in place, or registers a new one. """
+        player = self._players.get(data["scorerId"])
+        if player is None:
+            player = Player(self, data)
+            self._players[player.id] = player
+        else:
+            player.update(data)
+        return player
+
+    def _update_team(self, team_id, name, short, logo) -> Team:
+        """ Updates the registered Team in place or registers a new one so Team objects keep their identity. """
+        if self._teams is None:
+            self._teams = {}
+        if team_id in self._teams:
+            team = self._teams[team_id]
+            team.name = name
+            team.short = short
+            team.logo = logo
+        else:
+            team = Team(self, team_id, name, short, logo)
+            self._teams[team_id] = team
+        return team
+
+    def _update_teams(self, team_info):
+        for team_id, data in team_info.items():
+            self._update_team(team_id, data["name"], data["shortName"], data["logoUrl512"])
+
+    def _load_league_info(self, response):
+        self._league_info = response["fantasySettings"]
+
+    def _load_teams(self, response):
+        if self._teams is None:
+            self._teams = {}
+        for data in response["fantasyTeams"]:
+            self._update_team(data["id"], data["name"], data["shortName"], data["logoUrl256"])
+
+    def _load_positions(self, response):
+        self._positions = {k: Position(self, v) for k, v in response["allObjs"].items()}
+
+    def _build_msgs(self, calls):
+        msgs = []
+        for method, kwargs in calls:
+            data = {"leagueId": self.league_id}
+            for key, value in kwargs.items():
+                data[key] = value
+            msgs.append({"method": method, "data": data})
+        return msgs
+
+    def _fold_msgs(self, msgs) -> bool:
+        """ Adds getFantasyLeagueInfo to the outgoing msgs when folding is on and League Info isn't loaded yet. """
+        if not msgs or not self._fold_league_info or self._league_info is not None:
+            return False
+        if any(m["method"] == "getFantasyLeagueInfo" for m in msgs):
+            return False
+        msgs.extend(self._build_msgs([("getFantasyLeagueInfo", {})]))
+        return True
+
+    def _unfold_responses(self, msgs, responses, folded) -> List[dict]:
+        """ Loads League Info from any getFantasyLeagueInfo response and drops the folded one. """
+        if self._league_info is None:
+            for msg, response in zip(msgs, responses):
+                if msg["method"] == "getFantasyLeagueInfo":
+                    self._load_league_info(response)
+                    break
+        return responses[:-1] if folded else responses
+
+    def _from_cache(self, msgs) -> List[Optional[dict]]:
+        if self.cache is None:
+            return [None] * len(msgs)
+        return [self.cache.get(m["method"], m["data"]) for m in msgs]
+
+    def _to_cache(self, msgs, responses):
+        if self.cache is not None:
+            for msg, response in zip(msgs, responses):
+                self.cache.set(msg["method"], msg["data"], response)
+
+    def _replay(self, msgs) -> Optional[List[dict]]:
+        """ Response data for ``msgs`` from the cassette, ``None`` when they have to be sent. """
+        if self.cassette is None or not self.cassette.replaying or not msgs:
+            return None
+        return self.cassette.play(msgs)
+
+    def _record(self, msgs, responses):
+        if self.cassette is not None and msgs:
+            self.cassette.record(msgs, responses)
+
+    @staticmethod
+    def _merge_cached(cached, responses) -> List[dict]:
+        responses = iter(responses)
+        return [next(responses) if c is None else c for c in cached]
+
+    def _log_request(self, msgs):
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        record = {"league_id": self.league_id, "methods": [m["method"] for m in msgs]}
+        if self.log_payloads:
+            record["payload"] = self._truncate(json.dumps(msgs, default=str))
+        if "payload" in record:
+            logger.debug("Request %s: %s", self._methods(msgs), record["payload"], extra={"fantrax": record})
+        else:
+            logger.debug("Request %s", self._methods(msgs), extra={"fantrax": record})
+
+    def _log_response(self, msgs, status_code, reason, response_json, content=None):
+        """ Logs a response, ``content`` is the raw body when the transport kept it. """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        record = {"league_id": self.league_id, "methods": [m["method"] for m in msgs], "status": status_code, "bytes": None if content is None else len(content)}
+        if self.log_payloads:
+            if content is None:
+                record["payload"] = self._truncate(json.dumps(response_json, default=str))
+            else:
+                record["payload"] = self._truncate(content[:self.log_payloads + 1].decode("utf-8", "replace"))
+        if "payload" in record:
+            logger.debug("Response %s (%s [%s]): %s", self._methods(msgs), status_code, reason, record["payload"], extra={"fantrax": record})
+        else:
+            logger.debug("Response %s (%s [%s]) %s bytes", self._methods(msgs), status_code, reason, record["bytes"], extra={"fantrax": record})
+
+    def _truncate(self, text):
+        return text if len(text) <= self.log_payloads else f"{text[:self.log_payloads]}..."
+
+    def _check_response(self, msgs, status_code, reason, response_json) -> List[dict]:
+        if status_code >= 400:
+            raise FantraxException(f"({status_code} [{reason}]) {response_json}")
         if "pageError" in response_json:
             if "code" in response_json["pageError"]:
                 if response_json["pageError"]["code"] == "WARNING_NOT_LOGGED_IN":
                     raise Unauthorized("Unauthorized: Not Logged in")
             raise FantraxException(f"Error: {response_json}")
-        return response_json["responses"][0]["data"]
+        responses = response_json["responses"]
+        if len(responses) != len(msgs):
+            raise FantraxException(f"Expected {len(msgs)} Responses for {self._methods(msgs)} but received {len(responses)}")
+        return [r["data"] for r in responses]
 
-    def scoring_periods(self) -> Dict[int, ScoringPeriod]:
-        """ :class:`~ScoringPeriod` Objects for the league.
+    @staticmethod
+    def _methods(msgs):
+        return ", ".join([m["method"] for m in msgs])
 
-            Returns:
-                Dict[int, :class:`~ScoringPeriod`]
-        """
+    @staticmethod
+    def _standings_kwargs(week):
+        if week is None:
+            return {}
+        return {"period": week, "timeframeType": "BY_PERIOD", "timeStartType": "FROM_SEASON_START"}
+
+    @staticmethod
+    def _available_players_kwargs(position, page_size=500, page=1):
+        pos = {
+            "G": "POS_201",
+            "F": "POS_207",
+            "D": "POS_202"
+        }.get(position, "ALL")
+        return {"positionOrGroup": pos, "miscDisplayType": 1, "maxResultsPerPage": page_size, "pageNumber": page, "statusOrTeamFilter": "ACTIVE_AVAILABLE"}
+
+    @staticmethod
+    def _total_pages(response) -> int:
+        return max(int(response.get("paginatedResultSet", {}).get("totalNumPages", 1)), 1)
+
+    def _parse_scoring_periods(self, response) -> Dict[int, ScoringPeriod]:
         periods = {}
-        response = self._request("getStandings", view="SCHEDULE")
-        self._teams = []
-        for team_id, data in response["fantasyTeamInfo"].items():
-            self._teams.append(Team(self, team_id, data["name"], data["shortName"], data["logoUrl512"]))
+        self._update_teams(response["fantasyTeamInfo"])
         for period_data in response["tableList"]:
             period = ScoringPeriod(self, period_data)
             periods[period.week] = period
         return periods
 
-    def standings(self, week: Optional[Union[int, str]] = None) -> StandingsCollection:
-        """ :class:`~StandingsCollection` Object for either the current moment in time or after a specific week..
-
-            Parameters:
-                week (Optional[Union[int, str]]): Pulls data for the Standings at the given week.
-
-            Returns:
-                :class:`~StandingsCollection`
-        """
-        if week is None:
-            response = self._request("getStandings")
-        else:
-            response = self._request("getStandings", period=week, timeframeType="BY_PERIOD", timeStartType="FROM_SEASON_START")
-
-        self._teams = []
-        for team_id, data in response["fantasyTeamInfo"].items():
-            self._teams.append(Team(self, team_id, data["name"], data["shortName"], data["logoUrl512"]))
+    def _parse_standings(self, response, week) -> StandingsCollection:
+        self._update_teams(response["fantasyTeamInfo"])
         return StandingsCollection(self, response["tableList"], week=week)
 
-    def pending_trades(self) -> List[Trade]:
-        response = self._request("getPendingTransactions")
+    def _parse_pending_trades(self, response) -> List[Trade]:
         trades = []
         if "tradeInfoList" in response:
             for trade in response["tradeInfoList"]:
                 trades.append(Trade(self, trade))
         return trades
 
-    def trade_block(self):
-        return [TradeBlock(self, block) for block in self._request("getTradeBlocks")["tradeBlocks"] if len(block) > 2]
+    def _parse_trade_block(self, response) -> List[TradeBlock]:
+        return [TradeBlock(self, block) for block in response["tradeBlocks"] if len(block) > 2]
 
-    def transactions(self, count=100) -> List[Transaction]:
-        response = self._request("getTransactionDetailsHistory", maxResultsPerPage=str(count))
-        transactions = []
-        update = False
-        for row in response["table"]["rows"]:
-            if update:
-                transaction.update(row) # noqa
-                update = False
+    def _parse_transactions(self, response, *pages) -> List[Transaction]:
+        rows = response["table"]["rows"]
+        if pages and rows:
+            last = rows[-1]["txSetId"]
+            more = (row for page in pages for row in page["table"]["rows"])
+            rows = rows + list(itertools.takewhile(lambda row: row["txSetId"] == last, more))
+        return list(self._group_transactions(rows))
+
+    def _continues(self, responses) -> bool:
+        """ Whether the last Transaction on the first page has rows on a page that hasn't been requested yet. """
+        rows = responses[0]["table"]["rows"]
+        if not rows or len(responses) >= self._total_pages(responses[0]):
+            return False
+        last = rows[-1]["txSetId"]
+        if responses[-1]["table"]["rows"][-1:] and responses[-1]["table"]["rows"][-1]["txSetId"] != last:
+            return False
+        seen = sum(1 for response in responses for row in response["table"]["rows"] if row["txSetId"] == last)
+        return seen < int(rows[-1]["numInGroup"])
+
+    def _group_transactions(self, rows) -> Iterator[Transaction]:
+        """ Groups consecutive rows sharing a ``txSetId`` into one Transaction, yielding each as soon as it's complete. """
+        transaction = None
+        for row in rows:
+            if transaction is not None and row["txSetId"] == transaction.id:
+                transaction.update(row)
             else:
+                if transaction is not None:
+                    yield transaction
                 transaction = Transaction(self, row)
-            if transaction.count > 1 and not transaction.finalized:
-                update = True
-            else:
-                transactions.append(transaction)
-        return transactions
+            if transaction.finalized:
+                yield transaction
+                transaction = None
+        if transaction is not None:
+            yield transaction
 
-    def max_goalie_games_this_week(self) -> int:
-        response = self._request("getTeamRosterInfo", teamId=self.teams[0].team_id, view="GAMES_PER_POS")
+    @staticmethod
+    def _parse_max_goalie_games(response) -> int:
         for maxes in response["gamePlayedPerPosData"]["tableData"]:
             if maxes["pos"] == "NHL Team Goalies (TmG)":
                 return int(maxes["max"])
 
-    def playoffs(self) -> Dict[int, ScoringPeriod]:
-        response = self._request("getStandings", view="PLAYOFFS")
+    @staticmethod
+    def _playoff_brackets(response) -> Dict[str, str]:
         other_brackets = {}
         for tab in response["displayedLists"]["tabs"]:
             if tab["id"].startswith("."):
                 other_brackets[tab["name"]] = tab["id"]
+        return other_brackets
 
+    def _parse_playoffs(self, response, bracket_responses) -> Dict[int, ScoringPeriod]:
         playoff_periods = {}
         for obj in response["tableList"]:
             if obj["caption"] == "Standings":
@@ -168,35 +603,377 @@ class FantraxAPI:
             period = ScoringPeriod(self, obj)
             playoff_periods[period.week] = period
 
-        for name, bracket_id in other_brackets.items():
-            response = self._request("getStandings", view=bracket_id)
-            for obj in response["tableList"]:
+        for bracket_response in bracket_responses:
+            for obj in bracket_response["tableList"]:
                 if obj["caption"] == "Standings":
                     continue
                 playoff_periods[int(obj["caption"][17:])].add_matchups(obj)
 
         return playoff_periods
 
-    def roster_info(self, team_id):
-        return Roster(self, self._request("getTeamRosterInfo", teamId=team_id), team_id)
-    
-    def get_available_players(self, position):
-        pos = {
-            "G": "POS_201",
-            "F": "POS_207",
-            "D": "POS_202"
-        }.get(position, "ALL") 
-        
-        response = self._request("getPlayerStats",positionOrGroup=pos, miscDisplayType=1, maxResultsPerPage=500, pageNumber=1, statusOrTeamFilter="ACTIVE_AVAILABLE")
-        header_names = [cell['shortName'] for cell in response['tableHeader']['cells']]
+    def _parse_roster(self, response, team_id) -> Roster:
+        return Roster(self, response, team_id)
+
+    def _parse_rosters(self, team_ids, responses) -> Dict[str, Roster]:
+        return {team_id: Roster(self, response, team_id) for team_id, response in zip(team_ids, responses)}
+
+    @staticmethod
+    def _stat_headers(response) -> List[str]:
+        return [cell['shortName'] for cell in response['tableHeader']['cells']]
+
+    @staticmethod
+    def _player_rows(response) -> List[dict]:
+        return [row for row in response["statsTable"] if "scorer" in row]
+
+    def _parse_player_stats(self, response) -> Iterator[PlayerStats]:
+        header_names = self._stat_headers(response)
+        for row in self._player_rows(response):
+            yield PlayerStats(self, row, header_names)
+
+    def _parse_available_players(self, responses) -> AvailablePlayers:
+        header_names = None
         rows = []
-        for row in response["statsTable"]:
-            if "scorer" in row:
-                rows.append(PlayerStats(self, row, header_names))
-        
-        class AvailablePlayers:
-            def __init__(self, players):
-                self.rows = players
-
-        available_players = AvailablePlayers(rows)
-        return available_players
\ No newline at end of file
+        for response in responses:
+            if header_names is None:
+                header_names = self._stat_headers(response)
+            rows.extend(self._player_rows(response))
+        return AvailablePlayers(self, rows, header_names or [])
+
+
+class FantraxAPI(_FantraxBase):
+    """ Main Object Class
+
+        Parameters:
+            league_id (str): Fantrax League ID.
+            session (Optional[Session]): Use you're own Session object
+            cache (Optional[:class:`~fantraxapi.cache.Cache`]): Cache responses, can be shared between API objects.
+            league_info (Optional[dict]): Response data of a previous ``getFantasyLeagueInfo`` call for this League.
+            fold_league_info (bool): Send ``getFantasyLeagueInfo`` along with the first request instead of on its own.
+            lazy (bool): Keep the raw rows of Rosters, Standings and Available Players and only build each row Object
+                (and its stats dict) when it's accessed.
+            json_decoder (Optional[Union[str, Callable[[bytes], Any]]]): ``"orjson"``, ``"msgspec"``, ``"json"`` or a
+                callable used to decode response bodies. Defaults to the fastest one installed.
+            log_payloads (int): Include up to this many characters of every request and response body in the DEBUG
+                logs. ``0`` only logs the method names, status and sizes.
+            hooks (Optional[Dict[str, Union[Callable, List[Callable]]]]): Callbacks for each hook event, see :meth:`add_hook`.
+            tracer (Optional[opentelemetry.trace.Tracer]): Open a span for each public method with child spans for every
+                request and parse. Any object with OpenTelemetry's ``start_as_current_span`` and ``start_span`` works.
+            cassette (Optional[:class:`~fantraxapi.cassette.Cassette`]): Record every response to a file or replay them
+                from it without the network.
+            base_url (str): Address requests are sent to, e.g. the ``url`` of a local
+                :class:`~fantraxapi.server.FantraxServer`.
+
+        League Info is only requested the first time :attr:`default_team_id`, :attr:`default_team_name` or
+        :attr:`league_name` is accessed, unless it was passed in or folded into an earlier request.
+
+        Attributes:
+            league_id (str): Fantrax League ID.
+            default_team_id (str): Team ID of the logged in user's Team.
+            default_team_name (str): Team Name of the logged in user's Team.
+            league_name (str): League Name.
+            teams (List[:class:`~Team`]): List of Teams in the League.
+            cache (Optional[:class:`~fantraxapi.cache.Cache`]): Response Cache.
+            lazy (bool): Rows are built when they are accessed.
+            log_payloads (int): Characters of each request and response body included in the DEBUG logs.
+            tracer (Optional[opentelemetry.trace.Tracer]): Tracer spans are opened with.
+            cassette (Optional[:class:`~fantraxapi.cassette.Cassette`]): Cassette responses are recorded to or replayed from.
+            base_url (str): Address requests are sent to.
+    """
+    def __init__(self, league_id: str, session: Optional[Session] = None, cache: Optional[Cache] = None,
+                 league_info: Optional[dict] = None, fold_league_info: bool = False, lazy: bool = False,
+                 json_decoder: Optional[Union[str, Callable[[bytes], Any]]] = None, log_payloads: int = 0,
+                 hooks: Optional[Dict[str, Union[Callable, List[Callable]]]] = None, tracer: Optional[Any] = None,
+                 cassette: Optional[Cassette] = None, base_url: str = FANTRAX_URL):
+        super().__init__(league_id, cache=cache, league_info=league_info, fold_league_info=fold_league_info, lazy=lazy,
+                         json_decoder=json_decoder, log_payloads=log_payloads, hooks=hooks, tracer=tracer, cassette=cassette,
+                         base_url=base_url)
+        self._session = Session() if session is None else session
+
+    def _fetch_league_info(self):
+        self._load_league_info(self._request("getFantasyLeagueInfo"))
+
+    @property
+    def teams(self) -> List[Team]:
+        if self._teams is None:
+            self._load_teams(self._request("getFantasyTeams"))
+        return list(self._teams.values())
+
+    @property
+    def positions(self) -> Dict[str, Position]:
+        if self._positions is None:
+            self._load_positions(self._request("getRefObject", type="Position"))
+        return self._positions
+
+    def batch(self) -> Batch:
+        """ :class:`~Batch` Object used to send multiple method calls in a single request.
+
+            Returns:
+                :class:`~Batch`
+        """
+        return Batch(self)
+
+    def request_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[dict]:
+        """ Sends multiple Fantrax API method calls in a single request.
+
+            Parameters:
+                calls (List[Tuple[str, Dict[str, Any]]]): List of ``(method, kwargs)`` pairs.
+
+            Returns:
+                List[dict]: Response data in the same order as ``calls``.
+
+            Raises:
+                :class:`FantraxException`: When the request fails or Fantrax returns an error.
+        """
+        msgs = self._build_msgs(calls)
+        folded = self._fold_msgs(msgs)
+        cached = self._from_cache(msgs)
+        missing = [m for m, c in zip(msgs, cached) if c is None]
+        responses = self._replay(missing)
+        if responses is None:
+            responses = self._post(missing) if missing else []
+            self._record(missing, responses)
+        self._to_cache(missing, responses)
+        return self._unfold_responses(msgs, self._merge_cached(cached, responses), folded)
+
+    def _post(self, msgs) -> List[dict]:
+        self._log_request(msgs)
+        with self._span("fantrax.request", self._methods(msgs)) as span:
+            event = self._request_event(msgs)
+            try:
+                try:
+                    response = self._session.post(self._url, params={"leagueId": self.league_id}, json={"msgs": msgs}, stream=True)
+                    event.mark("wait")
+                    content = response.content
+                    event.mark("download")
+                    response_json = self._decode(content)
+                    event.mark("decode")
+                except (RequestException, ValueError) as e:
+                    raise FantraxException(f"Failed to Connect to {self._methods(msgs)}: {e}\nData: {[m['data'] for m in msgs]}")
+                event.status, event.response_bytes = response.status_code, len(content)
+                self._log_response(msgs, response.status_code, response.reason, response_json, content)
+                return self._check_response(msgs, response.status_code, response.reason, response_json)
+            except FantraxException as e:
+                event.error = e
+                raise
+            finally:
+                self._finish_request(event, span)
+
+    def _request(self, method, **kwargs):
+        return self.request_many([(method, kwargs)])[0]
+
+    def _stream(self, stream: JSONArrayStream, method: str, **kwargs) -> Iterator[Any]:
+        """ Sends one method call, skipping the cache, and yields the elements of ``stream``'s arrays as the body downloads. """
+        msgs = self._build_msgs([(method, kwargs)])
+        self._log_request(msgs)
+        span = self._start_span("fantrax.request", self._methods(msgs), **{"fantrax.stream": True})
+        event = self._request_event(msgs)
+        try:
+            try:
+                with self._session.post(self._url, params={"leagueId": self.league_id}, json={"msgs": msgs}, stream=True) as response:
+                    event.mark("wait")
+                    for chunk in response.iter_content(chunk_size=65536):
+                        yield from stream.feed(chunk)
+                    stream.close()
+                    event.mark("download")
+            except (RequestException, ValueError) as e:
+                raise FantraxException(f"Failed to Connect to {self._methods(msgs)}: {e}\nData: {[m['data'] for m in msgs]}")
+            event.status = response.status_code
+            self._log_response(msgs, response.status_code, response.reason, stream.document)
+            self._check_response(msgs, response.status_code, response.reason, stream.document)
+        except FantraxException as e:
+            event.error = e
+            if span is not None:
+                span.record_exception(e)
+            raise
+        finally:
+            self._finish_request(event, span)
+            if span is not None:
+                span.end()
+
+    @traced
+    def scoring_periods(self) -> Dict[int, ScoringPeriod]:
+        """ :class:`~ScoringPeriod` Objects for the league.
+
+            Returns:
+                Dict[int, :class:`~ScoringPeriod`]
+        """
+        return self._timed_parse("scoring_periods", self._parse_scoring_periods, self._request("getStandings", view="SCHEDULE"))
+
+    @traced
+    def standings(self, week: Optional[Union[int, str]] = None) -> StandingsCollection:
+        """ :class:`~StandingsCollection` Object for either the current moment in time or after a specific week..
+
+            Parameters:
+                week (Optional[Union[int, str]]): Pulls data for the Standings at the given week.
+
+            Returns:
+                :class:`~StandingsCollection`
+        """
+        return self._timed_parse("standings", self._parse_standings, self._request("getStandings", **self._standings_kwargs(week)), week)
+
+    @traced
+    def pending_trades(self) -> List[Trade]:
+        return self._timed_parse("pending_trades", self._parse_pending_trades, self._request("getPendingTransactions"))
+
+    @traced
+    def trade_block(self):
+        return self._timed_parse("trade_block", self._parse_trade_block, self._request("getTradeBlocks"))
+
+    @traced
+    def transactions(self, count=100) -> List[Transaction]:
+        responses = [self._request("getTransactionDetailsHistory", maxResultsPerPage=str(count))]
+        while self._continues(responses):
+            responses.append(self._request("getTransactionDetailsHistory", maxResultsPerPage=str(count), pageNumber=str(len(responses) + 1)))
+        return self._timed_parse("transactions", self._parse_transactions, *responses)
+
+    def _transaction_rows(self, page_size, stop_id=None) -> Iterator[dict]:
+        """ Transaction rows newest first, paging back until ``stop_id`` is reached or the history runs out. """
+        page, total = 1, 1
+        while page <= total:
+            response = self._request("getTransactionDetailsHistory", maxResultsPerPage=str(page_size), pageNumber=str(page))
+            total = self._total_pages(response)
+            rows = response["table"]["rows"]
+            if not rows:
+                return
+            for row in rows:
+                if stop_id is not None and row["txSetId"] == stop_id:
+                    return
+                yield row
+            page += 1
+
+    @traced
+    def iter_transactions(self, page_size: int = 100) -> Iterator[Transaction]:
+        """ Iterates over every :class:`~Transaction` of the League, newest first.
+
+            Pages are requested as they are needed and each Transaction is yielded as soon as all of its rows have
+            been read, so the whole history can be processed without holding it in memory.
+
+            Parameters:
+                page_size (int): Number of Transaction rows requested per page.
+
+            Returns:
+                Iterator[:class:`~Transaction`]
+        """
+        yield from self._group_transactions(self._transaction_rows(page_size))
+
+    def transaction_sync(self, last_id: Optional[str] = None, page_size: int = 25) -> TransactionSync:
+        """ :class:`~TransactionSync` Object used to incrementally sync the League's Transactions.
+
+            Parameters:
+                last_id (Optional[str]): Newest Transaction ID already seen.
+                page_size (int): Number of Transaction rows requested per page.
+
+            Returns:
+                :class:`~TransactionSync`
+        """
+        return TransactionSync(self, last_id=last_id, page_size=page_size)
+
+    @traced
+    def max_goalie_games_this_week(self) -> int:
+        return self._timed_parse("max_goalie_games_this_week", self._parse_max_goalie_games, self._request("getTeamRosterInfo", teamId=self.teams[0].team_id, view="GAMES_PER_POS"))
+
+    @traced
+    def playoffs(self) -> Dict[int, ScoringPeriod]:
+        response = self._request("getStandings", view="PLAYOFFS")
+        brackets = self._playoff_brackets(response)
+        bracket_responses = self.request_many([("getStandings", {"view": bracket_id}) for bracket_id in brackets.values()])
+        return self._timed_parse("playoffs", self._parse_playoffs, response, bracket_responses)
+
+    @traced
+    def roster_info(self, team_id):
+        return self._timed_parse("roster_info", self._parse_roster, self._request("getTeamRosterInfo", teamId=team_id), team_id)
+
+    @traced
+    def all_rosters(self) -> Dict[str, Roster]:
+        """ :class:`~Roster` of every Team in the League fetched in a single request.
+
+            Positions are requested along with the Rosters when they aren't loaded yet. Players on every Roster are
+            the same Objects returned by :meth:`player`.
+
+            Returns:
+                Dict[str, :class:`~Roster`]: Rosters keyed by Team ID.
+        """
+        team_ids = [team.team_id for team in self.teams]
+        calls = [("getTeamRosterInfo", {"teamId": team_id}) for team_id in team_ids]
+        load_positions = self._positions is None
+        if load_positions:
+            calls.append(("getRefObject", {"type": "Position"}))
+        responses = self.request_many(calls)
+        if load_positions:
+            self._load_positions(responses.pop())
+        return self._timed_parse("all_rosters", self._parse_rosters, team_ids, responses)
+
+    def _player_stats_pages(self, position, page_size, prefetch=True) -> Iterator[dict]:
+        """ Every page of getPlayerStats, fetching the next page in a background thread while the current one is used. """
+        def fetch(page_number):
+            return self._request("getPlayerStats", **self._available_players_kwargs(position, page_size, page_number))
+
+        self.positions # noqa: loaded up front so the background thread never has to
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            response = fetch(1)
+            total = self._total_pages(response)
+            for page in range(2, total + 2):
+                upcoming = executor.submit(contextvars.copy_context().run, fetch, page) if executor and page <= total else None
+                yield response
+                if page > total:
+                    break
+                response = upcoming.result() if upcoming else fetch(page)
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+    def _stream_player_stats(self, position, page_size) -> Iterator[PlayerStats]:
+        """ Every page of getPlayerStats parsed row by row while it downloads. The stat headers come after the rows in
+            the body so they're read from a one Player page first. """
+        header_names = self._stat_headers(self._request("getPlayerStats", **self._available_players_kwargs(position, 1)))
+        page, total = 1, 1
+        while page <= total:
+            stream = JSONArrayStream("statsTable")
+            for row in self._stream(stream, "getPlayerStats", **self._available_players_kwargs(position, page_size, page)):
+                if "scorer" in row:
+                    yield PlayerStats(self, row, header_names)
+            total = self._total_pages(stream.document["responses"][0]["data"])
+            page += 1
+
+    @traced
+    def iter_available_players(self, position: Optional[str] = None, page_size: int = 500, prefetch: bool = True,
+                               stream: bool = False) -> Iterator[PlayerStats]:
+        """ Iterates over the :class:`~PlayerStats` of every available Player, walking through every page of results.
+
+            While one page is being parsed the next page is fetched in a background thread, so at most two pages of
+            results are held in memory at once.
+
+            With ``stream=True`` each page is parsed while it downloads and every row is yielded as soon as it's
+            decoded, so memory stays flat no matter how big ``page_size`` is. Streamed pages skip the cache, are
+            never prefetched and aren't streamed while a :class:`~fantraxapi.cassette.Cassette` is set.
+
+            Parameters:
+                position (Optional[str]): ``G``, ``F`` or ``D`` to only include that Position.
+                page_size (int): Number of Players requested per page.
+                prefetch (bool): Fetch the next page in the background while the current one is parsed.
+                stream (bool): Parse each page incrementally as it downloads.
+
+            Returns:
+                Iterator[:class:`~PlayerStats`]
+        """
+        if stream and self.cassette is None:
+            yield from self._stream_player_stats(position, page_size)
+            return
+        for response in self._player_stats_pages(position, page_size, prefetch=prefetch):
+            yield from self._parse_player_stats(response)
+
+    @traced
+    def get_available_players(self, position: Optional[str] = None, page_size: int = 500) -> AvailablePlayers:
+        """ :class:`~AvailablePlayers` Object with every available Player across all pages of results.
+
+            Use :attr:`AvailablePlayers.table` for a columnar :class:`~fantraxapi.table.StatsTable` of the same Players.
+
+            Parameters:
+                position (Optional[str]): ``G``, ``F`` or ``D`` to only include that Position.
+                page_size (int): Number of Players requested per page.
+
+            Returns:
+                :class:`~AvailablePlayers`
+        """
+        return self._timed_parse("get_available_players", self._parse_available_players, list(self._player_stats_pages(position, page_size)))
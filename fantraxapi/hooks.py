@@ -0,0 +1,89 @@
+from time import perf_counter
+from typing import Dict, List, Optional
+
+HOOK_EVENTS = ("on_request", "on_response", "on_parsed")
+""" Events hooks can be added for with :meth:`~fantraxapi.FantraxAPI.add_hook`. """
+
+
+class RequestEvent:
+    """ One request to Fantrax passed to the ``on_request`` and ``on_response`` hooks.
+
+        ``on_request`` gets it right before the request is sent and ``on_response`` gets the same object once the
+        response has been decoded and checked, or has failed. Responses answered from the cache don't send a
+        request so they don't create an event.
+
+        ``timings`` holds the seconds spent in each phase that was measured:
+
+        * ``queue``: Waiting for a free slot under ``max_concurrency``, :class:`~fantraxapi.AsyncFantraxAPI` only.
+        * ``dns``: Resolving the host, only measured by :class:`~fantraxapi.AsyncFantraxAPI` on its own session.
+        * ``connect``: Opening the connection, only measured by :class:`~fantraxapi.AsyncFantraxAPI` on its own session.
+        * ``wait``: Sending the request until the response headers arrive. Includes DNS and connecting when those
+          aren't measured separately.
+        * ``download``: Reading the response body. For streamed responses this includes parsing the rows.
+        * ``decode``: Decoding the JSON body.
+
+        Attributes:
+            league_id (str): Fantrax League ID.
+            methods (List[str]): Fantrax method of every message in the request.
+            request_bytes (Optional[int]): Size of the request body.
+            response_bytes (Optional[int]): Size of the response body, ``None`` for streamed responses.
+            status (Optional[int]): HTTP status code.
+            timings (Dict[str, float]): Seconds spent in each phase.
+            error (Optional[Exception]): The :class:`~fantraxapi.FantraxException` raised by the request.
+    """
+    __slots__ = ("league_id", "methods", "request_bytes", "response_bytes", "status", "timings", "error", "_last")
+
+    def __init__(self, league_id: str, methods: List[str], request_bytes: Optional[int] = None):
+        self.league_id = league_id
+        self.methods = methods
+        self.request_bytes = request_bytes
+        self.response_bytes = None
+        self.status = None
+        self.timings: Dict[str, float] = {}
+        self.error = None
+        self._last = perf_counter()
+
+    @property
+    def seconds(self) -> float:
+        """ Total seconds of every measured phase. """
+        return sum(self.timings.values())
+
+    def mark(self, phase: str):
+        """ Ends ``phase`` now, it started when the previous phase ended. """
+        now = perf_counter()
+        self.timings[phase] = self.timings.get(phase, 0.0) + now - self._last
+        self._last = now
+
+    def record(self, phase: str, seconds: float):
+        """ Adds a phase measured elsewhere, it's left out of the phase currently running. """
+        self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+        self._last += seconds
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        timings = ", ".join(f"{k}={v * 1000:.1f}ms" for k, v in self.timings.items())
+        return f"Request Event: {', '.join(self.methods)} ({self.status}) [{timings}]"
+
+
+class ParseEvent:
+    """ Building the Objects returned by a method, passed to the ``on_parsed`` hooks.
+
+        Attributes:
+            league_id (str): Fantrax League ID.
+            name (str): Name of the API method that parsed the response e.g. ``"standings"``.
+            seconds (float): Seconds spent building the Objects.
+    """
+    __slots__ = ("league_id", "name", "seconds")
+
+    def __init__(self, league_id: str, name: str, seconds: float):
+        self.league_id = league_id
+        self.name = name
+        self.seconds = seconds
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        return f"Parse Event: {self.name} [{self.seconds * 1000:.1f}ms]"
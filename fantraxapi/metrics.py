@@ -0,0 +1,195 @@
+import threading
+import weakref
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+from fantraxapi.hooks import ParseEvent, RequestEvent
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+""" Default upper bounds in seconds of the latency histogram buckets. """
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size):
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class Metrics:
+    """ Request counters and latency histograms per Fantrax method, exported in the Prometheus text format.
+
+        Built on the hooks of :class:`~fantraxapi.FantraxAPI` and :class:`~fantraxapi.AsyncFantraxAPI`, one object
+        can be attached to any number of API objects and only holds weak references to them. Requests that send
+        several methods at once count once towards the request and error counters of each method, their bytes and
+        latency are recorded under the ``batch`` method. Cache statistics are read from the
+        :class:`~fantraxapi.cache.Cache` of each attached API object when the metrics are rendered.
+
+        .. code-block:: python
+
+            metrics = Metrics()
+            api = metrics.attach(FantraxAPI(league_id, cache=MemoryCache()))
+            api.standings()
+            print(metrics.render())
+
+        Parameters:
+            buckets (Sequence[float]): Upper bounds in seconds of the histogram buckets.
+            prefix (str): Prefix of every metric name.
+    """
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = "fantrax"):
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._apis = weakref.WeakSet()
+        self._requests = {}
+        self._errors = {}
+        self._request_bytes = {}
+        self._response_bytes = {}
+        self._latency = {}
+        self._phases = {}
+        self._parse = {}
+
+    def attach(self, api):
+        """ Records every request and parse of ``api`` and returns it. """
+        api.add_hook("on_response", self.on_response)
+        api.add_hook("on_parsed", self.on_parsed)
+        with self._lock:
+            self._apis.add(api)
+        return api
+
+    def detach(self, api):
+        """ Stops recording ``api``, the metrics already recorded are kept. """
+        api.remove_hook("on_response", self.on_response)
+        api.remove_hook("on_parsed", self.on_parsed)
+        with self._lock:
+            self._apis.discard(api)
+
+    def on_response(self, event: RequestEvent):
+        """ ``on_response`` hook recording one request. """
+        methods = set(event.methods)
+        method = next(iter(methods)) if len(methods) == 1 else "batch"
+        with self._lock:
+            for name in methods:
+                self._increment(self._requests, (name,))
+                if event.error is not None:
+                    self._increment(self._errors, (name, type(event.error).__name__))
+            if event.request_bytes is not None:
+                self._increment(self._request_bytes, (method,), event.request_bytes)
+            if event.response_bytes is not None:
+                self._increment(self._response_bytes, (method,), event.response_bytes)
+            self._observe(self._latency, (method,), event.seconds)
+            for phase, seconds in event.timings.items():
+                self._observe(self._phases, (method, phase), seconds)
+
+    def on_parsed(self, event: ParseEvent):
+        """ ``on_parsed`` hook recording the time spent building Objects. """
+        with self._lock:
+            self._observe(self._parse, (event.name,), event.seconds)
+
+    @staticmethod
+    def _increment(counter, labels, amount=1):
+        counter[labels] = counter.get(labels, 0) + amount
+
+    def _observe(self, histograms, labels, seconds):
+        if labels not in histograms:
+            histograms[labels] = _Histogram(len(self.buckets) + 1)
+        histogram = histograms[labels]
+        histogram.counts[bisect_left(self.buckets, seconds)] += 1
+        histogram.sum += seconds
+        histogram.count += 1
+
+    def _cache_stats(self) -> List[dict]:
+        caches = {}
+        for api in list(self._apis):
+            if api.cache is not None:
+                caches[id(api.cache)] = api.cache
+        return [cache.stats for cache in caches.values()]
+
+    @property
+    def stats(self) -> Dict[str, dict]:
+        """ Requests, errors by exception name, bytes received and seconds per method plus the combined cache hit ratio. """
+        with self._lock:
+            errors = {}
+            for (method, exception), count in self._errors.items():
+                errors.setdefault(method, {})[exception] = count
+            output = {
+                "requests": {k[0]: v for k, v in self._requests.items()},
+                "errors": errors,
+                "bytes_received": {k[0]: v for k, v in self._response_bytes.items()},
+                "seconds": {k[0]: v.sum for k, v in self._latency.items()},
+            }
+            caches = self._cache_stats()
+        hits = sum(c["hits"] for c in caches)
+        lookups = hits + sum(c["misses"] for c in caches)
+        output["cache"] = {"hits": hits, "misses": lookups - hits, "hit_ratio": hits / lookups if lookups else 0.0}
+        return output
+
+    def reset(self):
+        """ Clears every recorded metric. """
+        with self._lock:
+            for metric in (self._requests, self._errors, self._request_bytes, self._response_bytes, self._latency, self._phases, self._parse):
+                metric.clear()
+
+    def render(self) -> str:
+        """ Every metric in the Prometheus text exposition format. """
+        lines = []
+        with self._lock:
+            self._counter(lines, "requests_total", "Requests sent to Fantrax.", ("method",), self._requests)
+            self._counter(lines, "errors_total", "Requests that raised an exception.", ("method", "exception"), self._errors)
+            self._counter(lines, "request_bytes_total", "Bytes of request bodies sent.", ("method",), self._request_bytes)
+            self._counter(lines, "response_bytes_total", "Bytes of response bodies received.", ("method",), self._response_bytes)
+            self._histogram(lines, "request_seconds", "Seconds from sending a request until its response was decoded.", ("method",), self._latency)
+            self._histogram(lines, "request_phase_seconds", "Seconds spent in each phase of a request.", ("method", "phase"), self._phases)
+            self._histogram(lines, "parse_seconds", "Seconds spent building Objects from responses.", ("name",), self._parse)
+            caches = self._cache_stats()
+        if caches:
+            hits = sum(c["hits"] for c in caches)
+            misses = sum(c["misses"] for c in caches)
+            self._counter(lines, "cache_hits_total", "Responses answered from the cache.", (), {(): hits})
+            self._counter(lines, "cache_misses_total", "Cache lookups that had to be requested.", (), {(): misses})
+            self._metric(lines, "cache_hit_ratio", "Share of cache lookups answered from the cache.", "gauge")
+            lines.append(f"{self.prefix}_cache_hit_ratio {self._number(hits / (hits + misses) if hits + misses else 0.0)}")
+            self._metric(lines, "cache_bytes", "Bytes stored in the cache.", "gauge")
+            lines.append(f"{self.prefix}_cache_bytes {sum(c['bytes'] for c in caches)}")
+        return "\n".join(lines) + "\n"
+
+    def _metric(self, lines, name, help_text, kind):
+        lines.append(f"# HELP {self.prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {self.prefix}_{name} {kind}")
+
+    def _counter(self, lines, name, help_text, label_names, values: Dict[Tuple[str, ...], float]):
+        self._metric(lines, name, help_text, "counter")
+        for labels, value in sorted(values.items()):
+            lines.append(f"{self.prefix}_{name}{self._labels(label_names, labels)} {self._number(value)}")
+
+    def _histogram(self, lines, name, help_text, label_names, histograms: Dict[Tuple[str, ...], _Histogram]):
+        self._metric(lines, name, help_text, "histogram")
+        for labels, histogram in sorted(histograms.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), histogram.counts):
+                cumulative += count
+                le = self._number(bound)
+                lines.append(f"{self.prefix}_{name}_bucket{self._labels(label_names + ('le',), labels + (le,))} {cumulative}")
+            lines.append(f"{self.prefix}_{name}_sum{self._labels(label_names, labels)} {self._number(histogram.sum)}")
+            lines.append(f"{self.prefix}_{name}_count{self._labels(label_names, labels)} {histogram.count}")
+
+    @staticmethod
+    def _labels(names, values):
+        if not names:
+            return ""
+        escaped = (str(v).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for v in values)
+        return "{" + ",".join(f'{n}="{v}"' for n, v in zip(names, escaped)) + "}"
+
+    @staticmethod
+    def _number(value):
+        if value == float("inf"):
+            return "+Inf"
+        return repr(float(value)) if isinstance(value, float) else str(value)
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        return f"Metrics ({sum(self._requests.values())} Requests)"
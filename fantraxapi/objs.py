@@ -1,6 +1,91 @@
+from collections.abc import Sequence
 from datetime import datetime, timedelta
 import re
 from .exceptions import FantraxException
+from .table import StatsTable
+
+
+class LazyList(Sequence):
+    """ Read-only list that builds each item from its raw row data the first time the item is accessed.
+
+        Used for the rows of :class:`~Roster`, :class:`~Standings` and :class:`~AvailablePlayers` when the API
+        Object was created with ``lazy=True``.
+    """
+    __slots__ = ("_data", "_factory", "_items")
+
+    def __init__(self, data, factory):
+        self._data = data
+        self._factory = factory
+        self._items = [None] * len(data)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        item = self._items[index]
+        if item is None:
+            item = self._factory(self._data[index])
+            self._items[index] = item
+        return item
+
+    def __iter__(self):
+        for i in range(len(self._items)):
+            yield self[i]
+
+    def __eq__(self, other):
+        return list(self) == list(other) if isinstance(other, (list, LazyList)) else NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class AvailablePlayers:
+    """ Represents every Player available to be added.
+
+        Attributes:
+            rows (List[:class:`~PlayerStats`]): Available Players and their Stats.
+            table (:class:`~fantraxapi.table.StatsTable`): Available Players and their Stats as NumPy columns.
+
+    """
+    __slots__ = ("_api", "_data", "_stat_headers", "_table", "rows")
+
+    def __init__(self, api, data, stat_headers):
+        self._api = api
+        self._table = None
+        if self._api.lazy:
+            self._data = data
+            self._stat_headers = stat_headers
+            self.rows = LazyList(data, lambda row: PlayerStats(self._api, row, stat_headers))
+        else:
+            self._data = None
+            self._stat_headers = None
+            self.rows = [PlayerStats(self._api, row, stat_headers) for row in data]
+
+    @property
+    def table(self) -> StatsTable:
+        if self._table is None:
+            if self._data is not None:
+                self._table = StatsTable.from_rows((row, self._stat_headers) for row in self._data)
+            else:
+                self._table = StatsTable.from_rows(self.rows)
+        return self._table
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __getitem__(self, index):
+        return self.rows[index]
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        return f"{len(self.rows)} Available Players"
 
 
 class DraftPick:
@@ -14,6 +99,8 @@ class DraftPick:
             owner (:class:`~Team`]): Original Pick Owner.
 
     """
+    __slots__ = ("_api", "from_team", "to_team", "round", "year", "owner")
+
     def __init__(self, api, data):
         self._api = api
         self.from_team = self._api.team(data["from"]["teamId"])
@@ -40,6 +127,8 @@ class Matchup:
             home_score (float): Home Team Score.
 
     """
+    __slots__ = ("_api", "matchup_key", "away", "away_score", "home", "home_score")
+
     def __init__(self, api, matchup_key, data):
         self._api = api
         self.matchup_key = matchup_key
@@ -90,17 +179,24 @@ class Player:
             positions (List[Position]): Player Positions.
 
     """
-    def __init__(self, api, data, transaction_type=None):
+    __slots__ = ("_api", "id", "name", "short_name", "team_name", "team_short_name", "pos_short_name", "positions", "all_positions", "injured", "suspended")
+
+    def __init__(self, api, data):
         self._api = api
-        self.type = transaction_type
         self.id = data["scorerId"]
+        self.pos_short_name = None
+        self.update(data)
+
+    def update(self, data):
+        """ Updates the Player in place with newer data for the same Player. """
         self.name = data["name"]
         self.short_name = data["shortName"]
         self.team_name = data["teamName"]
         self.team_short_name = data["teamShortName"] if "teamShortName" in data else self.team_name
-        self.pos_short_name = data["posShortNames"]
-        self.positions = [self._api.positions[d] for d in data["posIdsNoFlex"]]
-        self.all_positions = [self._api.positions[d] for d in data["posIds"]]
+        if data["posShortNames"] != self.pos_short_name:
+            self.pos_short_name = data["posShortNames"]
+            self.positions = [self._api.positions[d] for d in data["posIdsNoFlex"]]
+            self.all_positions = [self._api.positions[d] for d in data["posIds"]]
         self.injured = False
         self.suspended = False
         if "icons" in data:
@@ -110,12 +206,11 @@ class Player:
                 elif icon["typeId"] == "6":
                     self.suspended = True
 
-
     def __repr__(self):
         return self.__str__()
 
     def __str__(self):
-        return f"{self.type} {self.name}" if self.type else self.name
+        return self.name
 
 
 class Position:
@@ -127,6 +222,8 @@ class Position:
             short_name (str): Position Short Name.
 
     """
+    __slots__ = ("_api", "id", "name", "short_name")
+
     def __init__(self, api, data):
         self._api = api
         self.id = data["id"]
@@ -151,6 +248,8 @@ class ScoringPeriod:
             matchups (List[:class:`~Matchup`]): List of Matchups.
 
     """
+    __slots__ = ("_api", "name", "week", "start", "end", "next", "days", "complete", "current", "future", "matchups")
+
     def __init__(self, api, data):
         self._api = api
         self.name = data["caption"]
@@ -202,6 +301,8 @@ class Record:
             data (dict): key is header, value is the value for the team
 
     """
+    __slots__ = ("_api", "team", "rank", "data")
+
     def __init__(self, api, team_id, rank, data):
         self._api = api
         self.team = self._api.team(team_id)
@@ -239,6 +340,8 @@ class StandingsCollection:
             standings (List[:class:`~SingleStanding`]): List of Standing sections.
 
     """
+    __slots__ = ("_api", "week", "standings")
+
     def __init__(self, api, data, week=None):
         self._api = api
         self.week = week
@@ -268,6 +371,8 @@ class Standings:
             caption (str): Caption of the standing.
             team_reacord (List[:class:`~Record`]): Team Ranks and their Records.
     """
+    __slots__ = ("_api", "table_type", "caption", "team_records")
+
     def __init__(self, api, section):
         self._api = api
         self.table_type = section.get("tableType")
@@ -276,27 +381,32 @@ class Standings:
 
         header_names = [cell['shortName'] for cell in section['header']['cells']]
 
+        rows = []
         for row in section['rows']:
-            cells = row['cells']
-            
-            row_dict = {}
-
-            for header, cell in zip(header_names, cells):
-                row_dict[header] = cell.get('content', None) 
-            
             fixed_cells = row.get('fixedCells', [])
             if len(fixed_cells) < 2:
                 continue
-            
-            fixed_headers = row.get('fixedHeader', {}).get('cells', [])
-            fixed_headers_names = [cell['shortName'] for cell in fixed_headers]
-            for header, cell in zip(fixed_headers_names, fixed_cells):
-                row_dict[header] = cell.get('content', None)
-            
-            team_id = fixed_cells[1].get("teamId")
-            rank = fixed_cells[0].get("content")
-            if team_id is not None and rank is not None:
-                self.team_records.append(Record(self._api, team_id, rank, row_dict))
+            if fixed_cells[1].get("teamId") is not None and fixed_cells[0].get("content") is not None:
+                rows.append(row)
+
+        if self._api.lazy:
+            self.team_records = LazyList(rows, lambda row: self._record(row, header_names))
+        else:
+            self.team_records = [self._record(row, header_names) for row in rows]
+
+    def _record(self, row, header_names):
+        row_dict = {}
+
+        for header, cell in zip(header_names, row['cells']):
+            row_dict[header] = cell.get('content', None)
+
+        fixed_cells = row['fixedCells']
+        fixed_headers = row.get('fixedHeader', {}).get('cells', [])
+        fixed_headers_names = [cell['shortName'] for cell in fixed_headers]
+        for header, cell in zip(fixed_headers_names, fixed_cells):
+            row_dict[header] = cell.get('content', None)
+
+        return Record(self._api, fixed_cells[1]["teamId"], fixed_cells[0]["content"], row_dict)
 
     def __repr__(self):
         return self.__str__()
@@ -317,6 +427,8 @@ class Team:
             short (str): Team Short Name.
 
     """
+    __slots__ = ("_api", "team_id", "name", "short", "logo")
+
     def __init__(self, api, team_id, name, short, logo):
         self._api = api
         self.team_id = team_id
@@ -342,6 +454,8 @@ class Trade:
             moves (List[Union(:class:`~DraftPick`, :class:`~TradePlayer`)]): Team Short Name.
 
     """
+    __slots__ = ("_api", "trade_id", "proposed_by", "proposed", "accepted", "executed", "moves")
+
     def __init__(self, api, data):
         self._api = api
         info = {i["name"]: i["value"] for i in data["usefulInfo"]}
@@ -377,13 +491,15 @@ class TradeBlock:
             stats_wanted (List[str]): Stats Wanted.
 
     """
+    __slots__ = ("_api", "team", "update_date", "note", "players_offered", "players_wanted", "positions_offered", "positions_wanted", "stats_offered", "stats_wanted")
+
     def __init__(self, api, data):
         self._api = api
         self.team = self._api.team(data["teamId"])
         self.update_date = datetime.fromtimestamp(data["lastUpdated"]["date"] / 1e3)
         self.note = data["comment"]["body"] if "comment" in data else ""
-        self.players_offered = {self._api.positions[k].short_name: [Player(self._api, p) for p in players] for k, players in data["scorersOffered"]["scorers"].items()} if "scorersOffered" in data else {}
-        self.players_wanted = {self._api.positions[k].short_name: [Player(self._api, p) for p in players] for k, players in data["scorersWanted"]["scorers"].items()} if "scorersWanted" in data else {}
+        self.players_offered = {self._api.positions[k].short_name: [self._api._player(p) for p in players] for k, players in data["scorersOffered"]["scorers"].items()} if "scorersOffered" in data else {}
+        self.players_wanted = {self._api.positions[k].short_name: [self._api._player(p) for p in players] for k, players in data["scorersWanted"]["scorers"].items()} if "scorersWanted" in data else {}
         self.positions_offered = [self._api.positions[pos] for pos in data["positionsOffered"]["positions"]] if "positionsOffered" in data else []
         self.positions_wanted = [self._api.positions[pos] for pos in data["positionsWanted"]["positions"]] if "positionsWanted" in data else []
         self.stats_offered = [s["shortName"] for s in data["statsOffered"]["stats"]] if "statsOffered" in data else []
@@ -411,6 +527,8 @@ class TradePlayer:
             points (float): Total Fantasy Points.
 
     """
+    __slots__ = ("_api", "from_team", "to_team", "name", "short_name", "team_name", "team_short_name", "pos", "ppg", "points")
+
     def __init__(self, api, data):
         self._api = api
         self.from_team = self._api.team(data["from"]["teamId"])
@@ -437,32 +555,43 @@ class Transaction:
             id (str): Transaction ID.
             team (:class:`~Team`]): Team who made te Transaction.
             date (datetime): Transaction Date.
-            count (str): Number of Players in the Transaction.
+            count (int): Number of Players in the Transaction.
             players (List[Player]): Players in the Transaction.
+            types (List[str]): Type of move for each Player in ``players`` (Claim Type or Transaction Code). Players
+                are shared between every Object of the League so the move is no longer stored on ``Player.type``.
             finalized (bool): this is true when all player have been added.
 
     """
+    __slots__ = ("_api", "id", "team", "date", "count", "players", "types", "finalized")
+
     def __init__(self, api, data):
         self._api = api
         self.id = data["txSetId"]
         self.team = self._api.team(data["cells"][0]["teamId"])
         self.date = datetime.strptime(data["cells"][1]["content"], "%a %b %d, %Y, %I:%M%p")
         self.count = data["numInGroup"]
-        self.players = [Player(self._api, data["scorer"], data["claimType"] if data["transactionCode"] == "CLAIM" else data["transactionCode"])]
-        self.finalized = self.count == 1
+        self.players = []
+        self.types = []
+        self._add(data)
+
+    def _add(self, data):
+        self.players.append(self._api._player(data["scorer"]))
+        self.types.append(data["claimType"] if data["transactionCode"] == "CLAIM" else data["transactionCode"])
+        self.finalized = len(self.players) >= self.count
 
     def update(self, data):
         if data["txSetId"] == self.id:
-            self.players.append(Player(self._api, data["scorer"], data["claimType"] if data["transactionCode"] == "CLAIM" else data["transactionCode"]))
-            self.finalized = True
+            self._add(data)
 
     def __repr__(self):
         return self.__str__()
 
     def __str__(self):
-        return str(self.players)
+        return f"[{', '.join([f'{t} {p.name}' for t, p in zip(self.types, self.players)])}]"
 
 class Roster:
+    __slots__ = ("_api", "team", "active", "reserve", "max", "injured", "rows", "_data", "_table")
+
     def __init__(self, api, data, team_id):
         self._api = api
         self.team = self._api.team(team_id)
@@ -470,12 +599,26 @@ class Roster:
         self.reserve = data["miscData"]["statusTotals"][1]["total"]
         self.max = data["miscData"]["statusTotals"][1]["max"]
         self.injured = data["miscData"]["statusTotals"][2]["total"]
-        self.rows = []
+        self._table = None
+        rows = []
         for group in data["tables"]: 
             header_names = [cell['shortName'] for cell in group['header']['cells']]
             for row in group["rows"]:
                 if "scorer" in row or row["statusId"] == "1":
-                    self.rows.append(RosterRow(self._api, row, header_names))
+                    rows.append((row, header_names))
+        if self._api.lazy:
+            self._data = rows
+            self.rows = LazyList(rows, lambda d: RosterRow(self._api, d[0], d[1]))
+        else:
+            self._data = None
+            self.rows = [RosterRow(self._api, row, header_names) for row, header_names in rows]
+
+    @property
+    def table(self) -> StatsTable:
+        """ Players on the Roster and their Stats as a :class:`~fantraxapi.table.StatsTable`. """
+        if self._table is None:
+            self._table = StatsTable.from_rows(self._data if self._data is not None else self.rows)
+        return self._table
 
     def __repr__(self):
         return self.__str__()
@@ -485,25 +628,42 @@ class Roster:
         return f"{self.team} Roster\n{rows}"
 
 class PlayerStats:
+    __slots__ = ("_api", "player", "latest_comment", "_stats", "_values", "_stat_headers", "pos_id", "pos")
+
     def __init__(self, api, data, stat_headers):
         self._api = api
         self.player = None
         self.latest_comment = ''
-        self.stats = {}
+        self._stats = None
+        self._values = [cell.get('content', None) for cell in data.get('cells', [])]
+        self._stat_headers = stat_headers
+        self.pos_id = None
+        self.pos = None
 
         # Player information
         if "scorer" in data:
-            self.player = Player(self._api, data["scorer"])
+            self.player = self._api._player(data["scorer"])
             self.pos_id = data["scorer"]["posIdsNoFlex"][0]
             self.pos = self._api.positions[self.pos_id]
 
             if "icons" in data["scorer"]:
                 self.latest_comment = data["scorer"]["icons"][0]["tooltip"]
 
-        # Stats extraction for the player
-        cells = data.get('cells', [])
-        for header, cell in zip(stat_headers, cells):
-            self.stats[header] = re.sub(r"<br\s*/?>", " ", cell.get('content', None))
+        if not self._api.lazy:
+            self.stats # noqa
+
+    @property
+    def stats(self) -> dict:
+        """ Stat values keyed by header, extracted the first time they are used when the API is lazy. """
+        if self._stats is None:
+            self._stats = {}
+            for header, content in zip(self._stat_headers, self._values):
+                self._stats[header] = re.sub(r"<br\s*/?>", " ", content)
+        return self._stats
+
+    @stats.setter
+    def stats(self, value):
+        self._stats = value
 
     def __repr__(self):
         return self.__str__()
@@ -517,6 +677,8 @@ class PlayerStats:
 
 
 class RosterRow(PlayerStats):
+    __slots__ = ()
+
     def __init__(self, api, data, stat_headers):
         super().__init__(api, data, stat_headers)
 
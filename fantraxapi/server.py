@@ -0,0 +1,239 @@
+""" Local stand-in for the Fantrax API serving :class:`~fantraxapi.synthetic.SyntheticLeague` data.
+
+    Run it on its own with ``python -m fantraxapi.server --port 8080 --scale 10`` and point
+    :class:`~fantraxapi.FantraxAPI` at it with ``base_url="http://127.0.0.1:8080"``.
+"""
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, Optional, Sequence
+from urllib.parse import parse_qs, urlsplit
+
+from fantraxapi.cache import Cache
+from fantraxapi.exceptions import FantraxException
+from fantraxapi.synthetic import SCALES, SyntheticLeague
+
+logger = logging.getLogger(__name__)
+
+ERRORS = ("status", "page_error", "not_logged_in", "disconnect")
+""" Kinds of errors :class:`~FantraxServer` can inject. """
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "FantraxServer"
+    disable_nagle_algorithm = True
+
+    def do_POST(self): # noqa: N802
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        if url.path != "/fxpa/req":
+            return self._send(404, b'{"error": "Not Found"}')
+        try:
+            msgs = json.loads(body)["msgs"]
+        except (ValueError, KeyError, TypeError):
+            return self._send(400, b'{"error": "Invalid Request Body"}')
+        status, payload = self.server.fantrax.handle(parse_qs(url.query).get("leagueId", [None])[0], msgs)
+        if payload is None:
+            self.close_connection = True
+            return
+        self._send(status, payload)
+
+    def _send(self, status, payload):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args): # noqa: A002
+        logger.debug("%s %s", self.address_string(), format % args)
+
+
+class FantraxServer:
+    """ HTTP server implementing the ``/fxpa/req`` endpoint of Fantrax for load and integration testing.
+
+        Every method :class:`~fantraxapi.FantraxAPI` calls is answered by the
+        :class:`~fantraxapi.synthetic.SyntheticLeague` of the requested League ID. League IDs that weren't passed in
+        get a League built with ``league_options`` the first time they're requested, so any number of clients can use
+        their own League. The encoded responses of the last ``max_cached`` messages are kept, so repeated requests
+        only spend time on the injected latency.
+
+        .. code-block:: python
+
+            with FantraxServer(latency=0.05, error_rate=0.01) as server:
+                api = FantraxAPI("synthetic", base_url=server.url)
+                api.standings()
+
+        Parameters:
+            leagues (Optional[Iterable[:class:`~fantraxapi.synthetic.SyntheticLeague`]]): Leagues to serve.
+            host (str): Address to listen on.
+            port (int): Port to listen on, ``0`` picks a free one.
+            latency (float): Seconds every request waits before it's answered.
+            jitter (float): Up to this many more seconds are added to ``latency`` at random.
+            error_rate (float): Share of requests answered with an error instead.
+            errors (Sequence[str]): Kinds of errors picked from at random when one is injected: ``status`` answers with
+                HTTP 500, ``page_error`` with a Fantrax ``pageError``, ``not_logged_in`` with the ``pageError`` Fantrax
+                sends when the session isn't logged in and ``disconnect`` closes the connection without an answer.
+            seed (Optional[int]): Seed of the injected latency and errors.
+            league_options (Optional[dict]): Keyword arguments of the Leagues created for unknown League IDs.
+            max_cached (int): Number of encoded responses kept, the least recently used are dropped first. ``0``
+                encodes every response again.
+
+        Attributes:
+            requests (int): Number of requests received.
+            errors_injected (int): Number of requests answered with an injected error.
+    """
+    def __init__(self, leagues: Optional[Iterable[SyntheticLeague]] = None, host: str = "127.0.0.1", port: int = 0,
+                 latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, errors: Sequence[str] = ("status",),
+                 seed: Optional[int] = None, league_options: Optional[dict] = None, max_cached: int = 1024):
+        for kind in errors:
+            if kind not in ERRORS:
+                raise FantraxException(f"Error: {kind} not found, options: {', '.join(ERRORS)}")
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.errors = tuple(errors)
+        self.league_options = league_options or {}
+        self.max_cached = max_cached
+        self.leagues: Dict[str, SyntheticLeague] = {league.league_id: league for league in leagues or []}
+        self.requests = 0
+        self.errors_injected = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._bodies = OrderedDict()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """ Base URL to pass to :class:`~fantraxapi.FantraxAPI` as ``base_url``. """
+        return f"http://{self.host}:{self.port}"
+
+    def league(self, league_id: str) -> SyntheticLeague:
+        """ League served for ``league_id``, created the first time it's requested. """
+        with self._lock:
+            if league_id not in self.leagues:
+                self.leagues[league_id] = SyntheticLeague(league_id, **self.league_options)
+            return self.leagues[league_id]
+
+    def handle(self, league_id, msgs):
+        """ HTTP status and body answering ``msgs``, a ``None`` body drops the connection. """
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+            kind = self._random.choice(self.errors) if self.error_rate and self._random.random() < self.error_rate else None
+            if kind is not None:
+                self.errors_injected += 1
+        if delay:
+            time.sleep(delay)
+        if kind == "status":
+            return 500, b'{"error": "Injected Error"}'
+        elif kind == "page_error":
+            return 200, b'{"pageError": {"code": "ERROR_INJECTED", "title": "Injected Error"}}'
+        elif kind == "not_logged_in":
+            return 200, b'{"pageError": {"code": "WARNING_NOT_LOGGED_IN", "title": "Not Logged In"}}'
+        elif kind == "disconnect":
+            return 200, None
+        try:
+            bodies = [self._body(league_id or msg["data"]["leagueId"], msg["method"], msg["data"]) for msg in msgs]
+        except (FantraxException, KeyError, TypeError, ValueError) as e:
+            return 200, json.dumps({"pageError": {"code": "ERROR_INVALID_REQUEST", "title": str(e)}}).encode()
+        return 200, b'{"responses":[' + b",".join(b'{"data":' + body + b"}" for body in bodies) + b"]}"
+
+    def _body(self, league_id, method, data) -> bytes:
+        key = f"{league_id}:{Cache.key(method, data)}"
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is not None:
+                self._bodies.move_to_end(key)
+                return body
+        body = json.dumps(self.league(league_id).respond(method, data), separators=(",", ":")).encode()
+        if self.max_cached > 0:
+            with self._lock:
+                self._bodies[key] = body
+                while len(self._bodies) > self.max_cached:
+                    self._bodies.popitem(last=False)
+        return body
+
+    def clear(self):
+        """ Drops every kept response, call it after changing a League that is being served. """
+        with self._lock:
+            self._bodies.clear()
+
+    def start(self) -> "FantraxServer":
+        """ Starts serving in a background thread and returns this object. """
+        if self._httpd is None:
+            self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+            self._httpd.daemon_threads = True
+            self._httpd.fantrax = self
+            self.port = self._httpd.server_address[1]
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="FantraxServer", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """ Stops the server and waits for its thread to finish. """
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        return f"Fantrax Server: {self.url} ({len(self.leagues)} Leagues, {self.requests} Requests)"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve synthetic Fantrax Leagues on /fxpa/req.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--scale", type=int, choices=sorted(SCALES), help="Size every League like this preset")
+    parser.add_argument("--teams", type=int, help="Teams in each League")
+    parser.add_argument("--periods", type=int, help="Scoring Periods in each League")
+    parser.add_argument("--players", type=int, help="Players in each League")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Up to this many more random seconds per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with an error")
+    parser.add_argument("--errors", nargs="+", default=["status"], choices=ERRORS)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-cached", type=int, default=1024, help="Encoded responses kept in memory")
+    args = parser.parse_args(argv)
+
+    league_options = dict(SCALES[args.scale]) if args.scale else {}
+    for knob, value in (("num_teams", args.teams), ("num_periods", args.periods), ("num_players", args.players)):
+        if value is not None:
+            league_options[knob] = value
+    server = FantraxServer(host=args.host, port=args.port, latency=args.latency, jitter=args.jitter,
+                           error_rate=args.error_rate, errors=args.errors, seed=args.seed, league_options=league_options,
+                           max_cached=args.max_cached)
+    server.start()
+    print(f"Serving synthetic Fantrax Leagues on {server.url}")
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import codecs
+import json
+import re
+from typing import Any, List, Optional, Union
+
+_token = re.compile(r'"(?:[^"\\]|\\.)*"|["\[\]{}]')
+_separator = re.compile(r"[\s,]*")
+_key_end = re.compile(r"\s*:\s*")
+
+
+class JSONArrayStream:
+    """ Incremental JSON parser that decodes the elements of every array stored under ``key`` as their bytes arrive.
+
+        Chunks of a response body are passed to :meth:`feed` which returns the array elements completed so far, the
+        text of those elements is dropped right away so only the element currently being received is buffered. The
+        rest of the document is kept with each of those arrays left empty and is decoded by :meth:`close`.
+
+        .. code-block:: python
+
+            stream = JSONArrayStream("statsTable")
+            for chunk in response.iter_content(65536):
+                for row in stream.feed(chunk):
+                    ...
+            document = stream.close()
+
+        Parameters:
+            key (str): Object key of the arrays to stream.
+
+        Attributes:
+            document (Optional[dict]): The decoded document without the streamed elements, set by :meth:`close`.
+            count (int): Number of elements decoded so far.
+    """
+    def __init__(self, key: str):
+        self.key = json.dumps(key)
+        self.document = None
+        self.count = 0
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._skeleton = []
+        self._last_key = None
+        self._in_array = False
+
+    def feed(self, chunk: Union[bytes, str]) -> List[Any]:
+        """ Adds the next chunk of the body and returns every array element completed by it. """
+        self._buffer += self._text.decode(chunk) if isinstance(chunk, bytes) else chunk
+        elements = []
+        pos = 0
+        while True:
+            if self._in_array:
+                pos = self._elements(pos, elements)
+            if self._in_array:
+                break
+            pos, done = self._outside(pos)
+            if done:
+                break
+        self._buffer = self._buffer[pos:]
+        self.count += len(elements)
+        return elements
+
+    def close(self) -> Optional[dict]:
+        """ Finishes the stream and decodes the rest of the document.
+
+            Raises:
+                ValueError: When the body isn't complete JSON.
+        """
+        self._buffer += self._text.decode(b"", final=True)
+        if self._in_array:
+            raise ValueError(f"Unterminated {self.key} array")
+        self._skeleton.append(self._buffer)
+        self._buffer = ""
+        self.document = json.loads("".join(self._skeleton))
+        return self.document
+
+    def _outside(self, pos):
+        """ Copies text outside the streamed arrays into the skeleton until one starts or more data is needed. """
+        buffer = self._buffer
+        while True:
+            match = _token.search(buffer, pos)
+            if match is None or match.group() == '"':
+                return pos, True
+            token = match.group()
+            is_array = token == "[" and self._last_key == self.key and _key_end.fullmatch(buffer, pos, match.start()) is not None
+            self._skeleton.append(buffer[pos:match.end()])
+            self._last_key = token if token[0] == '"' else None
+            pos = match.end()
+            if is_array:
+                self._in_array = True
+                return pos, False
+
+    def _elements(self, pos, elements):
+        """ Decodes complete array elements, leaving the array once its closing bracket is reached. """
+        buffer = self._buffer
+        while True:
+            pos = _separator.match(buffer, pos).end()
+            if pos >= len(buffer):
+                return pos
+            if buffer[pos] == "]":
+                self._in_array = False
+                return pos
+            try:
+                element, end = self._decoder.raw_decode(buffer, pos)
+            except ValueError:
+                return pos
+            if end >= len(buffer):
+                return pos
+            elements.append(element)
+            pos = end
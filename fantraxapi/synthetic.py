@@ -0,0 +1,542 @@
+import argparse
+import json
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from fantraxapi.exceptions import FantraxException
+
+POSITIONS = {
+    "201": ("Goalie", "G"),
+    "202": ("Defense", "D"),
+    "203": ("Left Wing", "LW"),
+    "204": ("Right Wing", "RW"),
+    "206": ("Center", "C"),
+    "207": ("Forward", "F"),
+    "208": ("Skater", "Skt"),
+    "210": ("NHL Team Goalies", "TmG"),
+}
+""" Positions of every synthetic League, ``id -> (name, short name)``. """
+
+SKATER_STATS = ("GP", "G", "A", "Pt", "+/-", "PIM", "SOG", "PPP", "SHP", "Hit", "Blk", "FOW", "FOL", "GWG", "PPG",
+                "SHG", "TkA", "GvA", "ATOI", "FPts")
+""" Skater stat columns, the first ``num_stats`` are used. """
+GOALIE_STATS = ("GP", "W", "L", "OTL", "GAA", "SV%", "SV", "GA", "SHO", "GS", "MIN", "FPts")
+""" Goalie stat columns, the first ``num_stats`` are used. """
+
+SCALES = {
+    1: {"num_teams": 30, "num_periods": 26, "num_players": 3000, "roster_size": 26, "num_transactions": 2500, "num_trades": 10},
+    10: {"num_teams": 300, "num_periods": 26, "num_players": 30000, "roster_size": 26, "num_transactions": 25000, "num_trades": 100},
+    100: {"num_teams": 3000, "num_periods": 26, "num_players": 300000, "roster_size": 26, "num_transactions": 250000, "num_trades": 1000},
+}
+""" League sizes of :meth:`SyntheticLeague.scaled`. ``1`` is the biggest real League, the others multiply everything but
+    the Scoring Periods and Roster size, which a season can't grow. """
+
+SAMPLES = {
+    "league_info": ("getFantasyLeagueInfo", {}),
+    "teams": ("getFantasyTeams", {}),
+    "positions": ("getRefObject", {"type": "Position"}),
+    "schedule": ("getStandings", {"view": "SCHEDULE"}),
+    "standings": ("getStandings", {}),
+    "playoffs": ("getStandings", {"view": "PLAYOFFS"}),
+    "playoffs_bracket": ("getStandings", {"view": ".1"}),
+    "roster_info": ("getTeamRosterInfo", {}),
+    "games_per_pos": ("getTeamRosterInfo", {"view": "GAMES_PER_POS"}),
+    "available_players": ("getPlayerStats", {"statusOrTeamFilter": "ACTIVE_AVAILABLE"}),
+    "transactions": ("getTransactionDetailsHistory", {}),
+    "pending_trades": ("getPendingTransactions", {}),
+    "trade_blocks": ("getTradeBlocks", {}),
+}
+""" ``name -> (method, request data)`` of the payloads :meth:`SyntheticLeague.payloads` builds. Rosters are for the
+    first Team and paged methods return everything on one page. """
+
+NHL_TEAMS = (
+    ("Anaheim Ducks", "ANA"), ("Boston Bruins", "BOS"), ("Buffalo Sabres", "BUF"), ("Calgary Flames", "CGY"),
+    ("Carolina Hurricanes", "CAR"), ("Chicago Blackhawks", "CHI"), ("Colorado Avalanche", "COL"),
+    ("Columbus Blue Jackets", "CBJ"), ("Dallas Stars", "DAL"), ("Detroit Red Wings", "DET"), ("Edmonton Oilers", "EDM"),
+    ("Florida Panthers", "FLA"), ("Los Angeles Kings", "LA"), ("Minnesota Wild", "MIN"), ("Montreal Canadiens", "MTL"),
+    ("Nashville Predators", "NSH"), ("New Jersey Devils", "NJ"), ("New York Islanders", "NYI"),
+    ("New York Rangers", "NYR"), ("Ottawa Senators", "OTT"), ("Philadelphia Flyers", "PHI"),
+    ("Pittsburgh Penguins", "PIT"), ("San Jose Sharks", "SJ"), ("Seattle Kraken", "SEA"), ("St. Louis Blues", "STL"),
+    ("Tampa Bay Lightning", "TB"), ("Toronto Maple Leafs", "TOR"), ("Utah Hockey Club", "UTA"),
+    ("Vancouver Canucks", "VAN"), ("Vegas Golden Knights", "VGK"), ("Washington Capitals", "WSH"), ("Winnipeg Jets", "WPG"),
+)
+
+_FIRST = ("Adam", "Alex", "Brady", "Connor", "Dylan", "Evan", "Filip", "Jack", "Jake", "Kirill", "Leon", "Logan",
+          "Mark", "Matt", "Mikko", "Nathan", "Nick", "Quinn", "Ryan", "Sam", "Sidney", "Tyler", "William", "Zach")
+_LAST = ("Anderson", "Barkov", "Bedard", "Crosby", "Dostal", "Eichel", "Forsberg", "Gaudreau", "Hughes", "Jones",
+         "Kaprizov", "Larkin", "MacKinnon", "Marner", "Nylander", "Ovechkin", "Pastrnak", "Pettersson", "Reinbacher",
+         "Stamkos", "Tkachuk", "Werenski", "Zegras", "Zibanejad")
+_TEAM_WORDS = ("Ospreys", "Batman", "Poo Poo Heads", "Toe Drag", "Snipers", "Grinders", "Pylons", "Sin Bin",
+               "Five Holes", "Mitts", "Dangles", "Wristers", "Top Shelf", "Barn Burners", "Ice Holes", "Slap Shots")
+
+
+def _base36(number: int, width: int) -> str:
+    digits = ""
+    while number:
+        number, remainder = divmod(number, 36)
+        digits = "0123456789abcdefghijklmnopqrstuvwxyz"[remainder] + digits
+    return digits.rjust(width, "0")
+
+
+def _page(data, default):
+    size = max(int(data.get("maxResultsPerPage", default)), 1)
+    return size, max(int(data.get("pageNumber", 1)), 1)
+
+
+def _paginated(total, size, number):
+    return {"totalNumPages": max(-(-total // size), 1), "pageNumber": number, "maxResultsPerPage": size, "totalNumResults": total}
+
+
+class SyntheticLeague:
+    """ A made up League that answers every Fantrax method :class:`~fantraxapi.FantraxAPI` calls with response data
+        shaped like the real responses.
+
+        Everything is derived from ``seed`` so two Leagues built with the same arguments return the same data. Players,
+        their stats and the Transaction rows are computed from their index when a response is built, so even the
+        ``100`` times :data:`SCALES` League only keeps the Teams and Rosters in memory.
+
+        .. code-block:: python
+
+            league = SyntheticLeague.scaled(10)
+            data = league.respond("getStandings", {"leagueId": league.league_id, "view": "SCHEDULE"})
+            league.write("payloads/10x")
+
+        Parameters:
+            league_id (str): Fantrax League ID.
+            num_teams (int): Number of Teams.
+            num_periods (int): Number of regular season Scoring Periods.
+            num_players (int): Number of Players, the ones not on a Roster are available. Raised to fill every Roster.
+            seed (int): Seed of every random choice.
+            start (datetime): First day of the season.
+            roster_size (int): Number of Players on each Roster.
+            num_stats (Optional[int]): Number of stat columns of each skater and goalie table, up to
+                ``len(SKATER_STATS)`` and ``len(GOALIE_STATS)`` named columns with numbered ones after that.
+            num_transactions (int): Number of Transactions, each is a claim followed by up to ``max_group - 1`` drops.
+            max_group (int): Most rows in one Transaction, every Transaction has between 1 and ``max_group`` rows.
+            num_trades (int): Number of pending Trades.
+
+        Attributes:
+            teams (List[dict]): ``id``, ``name`` and ``shortName`` of every Team.
+            rosters (Dict[str, List[int]]): Index of every Player on each Team, see :meth:`scorer`.
+    """
+    def __init__(self, league_id: str = "synthetic", num_teams: int = 12, num_periods: int = 20, num_players: int = 600,
+                 seed: int = 0, start: datetime = datetime(2024, 10, 7), roster_size: int = 20, num_stats: Optional[int] = None,
+                 num_transactions: int = 200, num_trades: int = 5, max_group: int = 2):
+        if num_teams < 2:
+            raise FantraxException("A League needs at least 2 Teams")
+        if roster_size < 1:
+            raise FantraxException("A Roster needs at least 1 Player")
+        if max_group < 1:
+            raise FantraxException("A Transaction needs at least 1 row")
+        self.league_id = league_id
+        self.num_teams = num_teams
+        self.num_periods = num_periods
+        self.num_players = max(num_players, num_teams * roster_size)
+        self.seed = seed
+        self.start = start
+        self.roster_size = roster_size
+        self.num_transactions = num_transactions
+        self.num_trades = num_trades
+        self.max_group = max_group
+        self._skater_stats = self._columns(SKATER_STATS, num_stats)
+        self._goalie_stats = self._columns(GOALIE_STATS, num_stats)
+        rng = random.Random(seed)
+
+        self.teams = []
+        for i in range(num_teams):
+            name = f"{rng.choice(_FIRST)}'s {rng.choice(_TEAM_WORDS)} {i + 1}"
+            self.teams.append({"id": _base36(rng.getrandbits(80), 16), "name": name, "shortName": f"T{i + 1}"})
+
+        order = list(range(self.num_players))
+        rng.shuffle(order)
+        self.rosters = {}
+        for i, team in enumerate(self.teams):
+            self.rosters[team["id"]] = sorted(order[i * roster_size:(i + 1) * roster_size])
+        self._available = sorted(order[num_teams * roster_size:])
+        self._owners = {index: team_id for team_id, indexes in self.rosters.items() for index in indexes}
+        self._by_position = {}
+        self._tx_rows = None
+
+    @classmethod
+    def scaled(cls, scale: int = 1, league_id: str = "synthetic", seed: int = 0, **kwargs) -> "SyntheticLeague":
+        """ League of one of the :data:`SCALES` sizes, ``kwargs`` override single knobs.
+
+            Raises:
+                :class:`FantraxException`: When the scale isn't in :data:`SCALES`.
+        """
+        if scale not in SCALES:
+            raise FantraxException(f"Scale: {scale} not found, options: {', '.join(str(s) for s in SCALES)}")
+        return cls(league_id, seed=seed, **{**SCALES[scale], **kwargs})
+
+    @staticmethod
+    def _columns(names, count):
+        if count is None:
+            return names
+        return tuple(names[:count]) + tuple(f"S{i + 1}" for i in range(len(names), count))
+
+    def scorer(self, index: int) -> dict:
+        """ Scorer data of the Player at ``index``. """
+        first, last = _FIRST[self._value(index, 1) % len(_FIRST)], _LAST[self._value(index, 2) % len(_LAST)]
+        team_name, team_short = NHL_TEAMS[index % len(NHL_TEAMS)]
+        pos_id = self._position(index)
+        scorer = {
+            "scorerId": _base36(index + 36 ** 4, 5),
+            "name": f"{first} {last}",
+            "shortName": f"{first[0]}. {last}",
+            "teamName": team_name,
+            "teamShortName": team_short,
+            "posShortNames": POSITIONS[pos_id][1],
+            "posIdsNoFlex": [pos_id],
+            "posIds": [pos_id] if pos_id == "201" else [pos_id, "208"],
+        }
+        if index % 17 == 0:
+            scorer["icons"] = [{"tooltip": f"{last} is day-to-day", "typeId": "1"}]
+        return scorer
+
+    def add_transactions(self, count: int = 1):
+        """ Adds ``count`` Transactions newer than every existing one. Call :meth:`~fantraxapi.server.FantraxServer.clear`
+            when the League is being served.
+        """
+        self.num_transactions += count
+        self._tx_rows = None
+
+    def respond(self, method: str, data: Dict[str, Any]) -> dict:
+        """ Response data of ``method`` for the request data ``data``.
+
+            Raises:
+                :class:`FantraxException`: When the method isn't one the library calls.
+        """
+        handler = getattr(self, f"_{method}", None)
+        if handler is None:
+            raise FantraxException(f"Method: {method} not supported by SyntheticLeague")
+        return handler(data)
+
+    def payloads(self) -> Dict[str, Tuple[str, dict, dict]]:
+        """ ``name -> (method, request data, response data)`` of every request in :data:`SAMPLES`. """
+        output = {}
+        for name, (method, data) in SAMPLES.items():
+            data = {"leagueId": self.league_id, **data}
+            if method == "getTeamRosterInfo":
+                data["teamId"] = self.teams[0]["id"]
+            elif method == "getPlayerStats":
+                data["maxResultsPerPage"] = max(len(self._available), 1)
+            elif method == "getTransactionDetailsHistory":
+                data["maxResultsPerPage"] = max(len(self._transaction_index()), 1)
+            output[name] = (method, data, self.respond(method, data))
+        return output
+
+    def write(self, directory: str):
+        """ Writes every :meth:`payloads` response to ``<name>.json`` in ``directory`` in the format Fantrax sends it. """
+        os.makedirs(directory, exist_ok=True)
+        for name, (method, data, response) in self.payloads().items():
+            with open(os.path.join(directory, f"{name}.json"), "w", encoding="utf-8") as f:
+                json.dump({"responses": [{"data": response}]}, f, separators=(",", ":"))
+
+    def _value(self, *keys) -> int:
+        """ Deterministic pseudo random number for ``keys`` without storing anything. """
+        value = self.seed
+        for key in keys:
+            value = (value * 1_000_003 + key) & 0xFFFFFFFF
+        value ^= value >> 16
+        value = (value * 0x45D9F3B) & 0xFFFFFFFF
+        return value ^ (value >> 16)
+
+    def _period_dates(self, week):
+        begin = self.start + timedelta(days=7 * (week - 1))
+        return begin, begin + timedelta(days=6)
+
+    def _sub_caption(self, week):
+        begin, end = self._period_dates(week)
+        return f"({begin:%a %b %d, %Y} - {end:%a %b %d, %Y})"
+
+    def _team_info(self):
+        return {t["id"]: {"name": t["name"], "shortName": t["shortName"], "logoUrl512": f"https://fantraximg.com/logos/{t['id']}.svg"}
+                for t in self.teams}
+
+    def _stat_headers(self, goalies):
+        return self._goalie_stats if goalies else self._skater_stats
+
+    @staticmethod
+    def _position(index) -> str:
+        return "201" if index % 10 == 0 else "202" if index % 3 == 0 else "207"
+
+    def _stat_cells(self, index, goalies, period=0):
+        cells = []
+        for column, header in enumerate(self._stat_headers(goalies)):
+            value = self._value(index, column, period)
+            if header == "GAA":
+                cells.append({"content": f"{1.5 + value % 250 / 100:.2f}"})
+            elif header == "SV%":
+                cells.append({"content": f".{880 + value % 60}"})
+            elif header == "+/-":
+                cells.append({"content": str(value % 31 - 15)})
+            elif header == "ATOI":
+                cells.append({"content": f"{8 + value % 17}:{value % 60:02d}"})
+            elif header == "FPts":
+                cells.append({"content": f"{value % 50000 / 100:,.1f}"})
+            else:
+                cells.append({"content": str(value % (82 if header == "GP" else 60))})
+        return cells
+
+    def _matchup(self, away, home, *keys):
+        return {"cells": [
+            {"teamId": away["id"], "content": away["name"]}, {"content": f"{self._value(*keys, 0) % 150000 / 100:,.2f}"},
+            {"teamId": home["id"], "content": home["name"]}, {"content": f"{self._value(*keys, 1) % 150000 / 100:,.2f}"},
+        ]}
+
+    def _schedule_period(self, week):
+        """ Round robin pairings of every Team for ``week``. """
+        teams = self.teams if self.num_teams % 2 == 0 else self.teams + [None]
+        rotation = (week - 1) % (len(teams) - 1)
+        ordered = [teams[0]] + teams[1:][rotation:] + teams[1:][:rotation]
+        rows = []
+        half = len(ordered) // 2
+        for i in range(half):
+            away, home = ordered[i], ordered[-1 - i]
+            if away is not None and home is not None:
+                rows.append(self._matchup(away, home, week, i))
+        return {"caption": f"Scoring Period {week}", "subCaption": self._sub_caption(week), "rows": rows}
+
+    def _standings_table(self, period):
+        header = ["W", "L", "T", "Pts", "FPtsF", "FPtsA", "Streak"]
+        ranked = sorted(self.teams, key=lambda t: self._value(period, int(t["id"], 36) & 0xFFFF), reverse=True)
+        rows = []
+        for rank, team in enumerate(ranked, 1):
+            wins = self.num_teams - rank
+            rows.append({
+                "fixedCells": [{"content": str(rank)}, {"teamId": team["id"], "content": team["name"]}],
+                "cells": [{"content": str(wins)}, {"content": str(rank - 1)}, {"content": "0"}, {"content": str(wins * 2)},
+                          {"content": f"{self._value(period, rank, 0) % 300000 / 100:,.2f}"},
+                          {"content": f"{self._value(period, rank, 1) % 300000 / 100:,.2f}"},
+                          {"content": f"W{rank % 4 + 1}"}],
+            })
+        return {"tableType": "H2hPointsBased1", "caption": "Standings", "header": {"cells": [{"shortName": h} for h in header]}, "rows": rows}
+
+    def _playoff_rounds(self, teams, bracket):
+        """ Playoff Rounds of a single elimination bracket between ``teams``, higher seeds win. """
+        tables = []
+        week = self.num_periods
+        while len(teams) > 1:
+            week += 1
+            rows = [self._matchup(teams[i], teams[-1 - i], week, bracket, i) for i in range(len(teams) // 2)]
+            tables.append({"caption": f"Playoffs - Round {week - self.num_periods}", "subCaption": self._sub_caption(week), "rows": rows})
+            teams = teams[:len(teams) // 2]
+        return tables
+
+    def _brackets(self):
+        playoff_teams = 2
+        while playoff_teams * 2 <= min(8, self.num_teams):
+            playoff_teams *= 2
+        consolation = self.teams[playoff_teams:playoff_teams * 2]
+        return self.teams[:playoff_teams], consolation if len(consolation) == playoff_teams else []
+
+    def _getFantasyLeagueInfo(self, data):
+        team = self.teams[0]
+        return {
+            "fantasySettings": {"myDefaultTeamId": team["id"], "myTeamIds": [team["id"]], "teamName": team["name"],
+                                "leagueName": f"Synthetic League {self.league_id}", "subtitle": f"{self.start.year}-{str(self.start.year + 1)[2:]} NHL"},
+            "positionMap": self._getRefObject({"type": "Position"})["allObjs"],
+        }
+
+    def _getFantasyTeams(self, data):
+        return {"fantasyTeams": [{**t, "logoUrl256": f"https://fantraximg.com/logos/{t['id']}.svg"} for t in self.teams]}
+
+    def _getRefObject(self, data):
+        if data.get("type") != "Position":
+            raise FantraxException(f"Ref Object Type: {data.get('type')} not supported by SyntheticLeague")
+        return {"allObjs": {k: {"id": k, "name": name, "shortName": short} for k, (name, short) in POSITIONS.items()}}
+
+    def _getStandings(self, data):
+        view = data.get("view")
+        response = {"fantasyTeamInfo": self._team_info()}
+        if view == "SCHEDULE":
+            response["tableList"] = [self._schedule_period(week) for week in range(1, self.num_periods + 1)]
+        elif view == "PLAYOFFS":
+            championship, consolation = self._brackets()
+            tabs = [{"id": "PLAYOFFS", "name": "Championship"}]
+            if consolation:
+                tabs.append({"id": ".1", "name": "Consolation"})
+            response["displayedLists"] = {"tabs": tabs}
+            response["tableList"] = self._playoff_rounds(championship, 0) + [self._standings_table(self.num_periods)]
+        elif view == ".1":
+            response["tableList"] = self._playoff_rounds(self._brackets()[1], 1) + [self._standings_table(self.num_periods)]
+        else:
+            period = int(data.get("period", self.num_periods))
+            response["tableList"] = [{"tableType": "SECTION_HEADING", "caption": "Regular Season", "rows": []}, self._standings_table(period)]
+        return response
+
+    @property
+    def _active_slots(self):
+        return max(round(self.roster_size * 0.7), 1)
+
+    def _roster_rows(self, indexes, goalies):
+        rows = []
+        active = min(2, self._active_slots) if goalies else self._active_slots - min(2, self._active_slots)
+        for slot, index in enumerate(indexes):
+            scorer = self.scorer(index)
+            status = "1" if slot < active else "3" if "icons" in scorer else "2"
+            rows.append({"scorer": scorer, "statusId": status, "posId": scorer["posIdsNoFlex"][0],
+                         "cells": [{"content": ""}] + self._stat_cells(index, goalies)})
+        return rows
+
+    def _getTeamRosterInfo(self, data):
+        if data.get("view") == "GAMES_PER_POS":
+            return {"gamePlayedPerPosData": {"tableData": [
+                {"pos": "NHL Team Skaters (TmS)", "max": "82", "gp": str(self._value(1) % 82)},
+                {"pos": "NHL Team Goalies (TmG)", "max": str(3 + self._value(2) % 3), "gp": str(self._value(3) % 3)},
+            ]}}
+        team_id = data.get("teamId")
+        if team_id not in self.rosters:
+            raise FantraxException(f"Team ID: {team_id} not found")
+        indexes = self.rosters[team_id]
+        skaters = [i for i in indexes if self._position(i) != "201"]
+        goalies = [i for i in indexes if self._position(i) == "201"]
+        tables = []
+        for group, goalie in ((skaters, False), (goalies, True)):
+            header = [{"shortName": "Opp"}] + [{"shortName": h} for h in self._stat_headers(goalie)]
+            tables.append({"header": {"cells": header}, "rows": self._roster_rows(group, goalie)})
+        rows = [row for table in tables for row in table["rows"]]
+        totals = [sum(r["statusId"] == status for r in rows) for status in ("1", "2", "3")]
+        return {
+            "miscData": {"statusTotals": [
+                {"total": totals[0], "max": self._active_slots, "name": "Active", "id": "1"},
+                {"total": totals[1], "max": self.roster_size - self._active_slots, "name": "Reserve", "id": "2"},
+                {"total": totals[2], "max": "Unlimited", "name": "Inj Res", "id": "3"},
+            ]},
+            "tables": tables,
+        }
+
+    def _getPlayerStats(self, data):
+        size, number = _page(data, 20)
+        position = data.get("positionOrGroup", "ALL")
+        available = data.get("statusOrTeamFilter", "ACTIVE_AVAILABLE") == "ACTIVE_AVAILABLE"
+        indexes = self._filtered(available, position)
+        goalies = position == "POS_201"
+        rows = []
+        for rank, index in enumerate(indexes[(number - 1) * size:number * size], (number - 1) * size + 1):
+            owner = self._owners.get(index)
+            cells = [{"content": str(rank)}, {"content": "FA" if owner is None else "W"}, {"content": f"{self._value(index) % 100000 / 100:.2f}"}]
+            rows.append({"scorer": self.scorer(index), "cells": cells + self._stat_cells(index, goalies)})
+        header = [{"shortName": "Rk"}, {"shortName": "Sta"}, {"shortName": "Score"}] + [{"shortName": h} for h in self._stat_headers(goalies)]
+        return {"statsTable": rows, "tableHeader": {"cells": header}, "paginatedResultSet": _paginated(len(indexes), size, number)}
+
+    def _filtered(self, available, position):
+        """ Player indexes matching a getPlayerStats filter, kept because every page of a walk asks for the same ones. """
+        key = (available, position)
+        if key not in self._by_position:
+            indexes = self._available if available else range(self.num_players)
+            if position != "ALL":
+                pos_id = position[4:]
+                indexes = [i for i in indexes if pos_id == self._position(i) or (pos_id == "208" and self._position(i) != "201")]
+            self._by_position[key] = indexes
+        return self._by_position[key]
+
+    def _transaction_index(self):
+        """ ``(Transaction number, move)`` of every Transaction row newest first, a claim followed by any drops. """
+        if self._tx_rows is None:
+            self._tx_rows = []
+            for tx in range(self.num_transactions, 0, -1):
+                self._tx_rows.extend((tx, move) for move in range(self._group_size(tx)))
+        return self._tx_rows
+
+    def _group_size(self, tx):
+        return 1 + self._value(tx, 2) % self.max_group
+
+    def _transaction_row(self, tx, move):
+        team = self.teams[self._value(tx, 0) % self.num_teams]
+        when = self.start + timedelta(days=7 * self.num_periods) * tx / (self.num_transactions + 1)
+        if move == 0:
+            index = self._available[self._value(tx, 1) % len(self._available)] if self._available else 0
+        else:
+            index = self.rosters[team["id"]][self._value(tx, 2 + move) % self.roster_size]
+        return {
+            "txSetId": _base36(tx + 36 ** 7, 8),
+            "cells": [{"teamId": team["id"], "content": team["name"]}, {"content": f"{when:%a %b %d, %Y, %I:%M%p}"}],
+            "numInGroup": self._group_size(tx),
+            "scorer": self.scorer(index),
+            "claimType": "FA" if move == 0 else "",
+            "transactionCode": "CLAIM" if move == 0 else "DROP",
+        }
+
+    def _getTransactionDetailsHistory(self, data):
+        size, number = _page(data, 100)
+        index = self._transaction_index()
+        rows = [self._transaction_row(tx, move) for tx, move in index[(number - 1) * size:number * size]]
+        return {"table": {"rows": rows}, "paginatedResultSet": _paginated(len(index), size, number)}
+
+    def _getPendingTransactions(self, data):
+        trades = []
+        for trade in range(self.num_trades):
+            position = self._value(trade, 0) % self.num_teams
+            first = self.teams[position]
+            second = self.teams[(position + 1 + self._value(trade, 1) % (self.num_teams - 1)) % self.num_teams]
+            proposed = self.start + timedelta(days=self._value(trade, 2) % (7 * self.num_periods))
+            moves = []
+            for source, target in ((first, second), (second, first)):
+                index = self.rosters[source["id"]][self._value(trade, len(moves)) % self.roster_size]
+                moves.append({"from": {"teamId": source["id"]}, "to": {"teamId": target["id"]}, "scorer": self.scorer(index),
+                              "scorePerGame": self._value(index) % 500 / 100, "score": self._value(index) % 20000 / 100})
+            moves.append({"from": {"teamId": first["id"]}, "to": {"teamId": second["id"]},
+                          "draftPick": {"round": 1 + trade % 3, "year": self.start.year + 1, "origOwnerTeam": {"id": first["id"]}}})
+            trades.append({
+                "txSetId": _base36(trade + 36 ** 6, 7),
+                "creatorTeamId": first["id"],
+                "usefulInfo": [{"name": "Proposed", "value": f"{proposed:%a %b %d, %Y, %I:%M%p}"},
+                               {"name": "Accepted", "value": f"{proposed + timedelta(days=1):%a %b %d, %Y, %I:%M%p}"},
+                               {"name": "To be executed", "value": f"{proposed + timedelta(days=3):%a %b %d, %Y, %I:%M%p}"}],
+                "moves": moves,
+            })
+        return {"tradeInfoList": trades} if trades else {}
+
+    def _getTradeBlocks(self, data):
+        blocks = []
+        for i, team in enumerate(self.teams):
+            if i % 3 == 2:
+                blocks.append({"teamId": team["id"]})
+                continue
+            offered = {}
+            for index in self.rosters[team["id"]][:3]:
+                offered.setdefault(self._position(index), []).append(self.scorer(index))
+            blocks.append({
+                "teamId": team["id"],
+                "lastUpdated": {"date": int((self.start + timedelta(days=i)).timestamp() * 1000)},
+                "comment": {"body": f"{team['name']} is open to offers"},
+                "scorersOffered": {"scorers": offered},
+                "positionsWanted": {"positions": ["202", "201"] if i % 2 else ["207"]},
+                "statsWanted": {"stats": [{"shortName": s} for s in self._skater_stats[1 + i % 4:3 + i % 4]]},
+            })
+        return {"tradeBlocks": blocks}
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        return f"Synthetic League: {self.league_id} ({self.num_teams} Teams, {self.num_players} Players)"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write the response of every Fantrax method for a synthetic League.")
+    parser.add_argument("output", help="Directory the JSON files are written to")
+    parser.add_argument("--scale", type=int, default=1, choices=sorted(SCALES))
+    parser.add_argument("--teams", type=int, help="Teams in the League")
+    parser.add_argument("--periods", type=int, help="Scoring Periods in the League")
+    parser.add_argument("--players", type=int, help="Players in the League")
+    parser.add_argument("--roster-size", type=int, help="Players on each Roster")
+    parser.add_argument("--stats", type=int, help="Stat columns of each table")
+    parser.add_argument("--transactions", type=int, help="Transactions in the League")
+    parser.add_argument("--trades", type=int, help="Pending Trades in the League")
+    parser.add_argument("--max-group", type=int, help="Most rows in one Transaction")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    knobs = {"num_teams": args.teams, "num_periods": args.periods, "num_players": args.players, "roster_size": args.roster_size,
+             "num_stats": args.stats, "num_transactions": args.transactions, "num_trades": args.trades, "max_group": args.max_group}
+    league = SyntheticLeague.scaled(args.scale, seed=args.seed, **{k: v for k, v in knobs.items() if v is not None})
+    league.write(args.output)
+    print(f"{league} written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+import re
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from fantraxapi.exceptions import FantraxException
+
+if TYPE_CHECKING:
+    from fantraxapi.objs import PlayerStats
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_br = re.compile(r"<br\s*/?>")
+
+
+def _number(value: str) -> float:
+    """ Parses a Fantrax stat cell like ``1,325.28``, ``27%`` or ``+4.9%``. Empty cells and ``-`` are NaN. """
+    value = value.replace(",", "").rstrip("%")
+    if value in ("", "-"):
+        return float("nan")
+    return float(value)
+
+
+class StatsTable:
+    """ Columnar table of Player Stats backed by NumPy arrays, requires the ``numpy`` package.
+
+        Every stat header becomes one column. Columns where every cell is a number (allowing ``,``, ``%`` and ``+``)
+        are ``float64`` with NaN for empty cells, all other columns are kept as strings. When a header appears more
+        than once the later columns are named ``"<header> (2)"``, ``"<header> (3)"``...
+
+        Filtering, sorting and top-k all work on whole arrays and return new tables without creating an object
+        per row.
+
+        .. code-block:: python
+
+            table = api.get_available_players("F").table
+            shooters = table.filter(table["GP"] >= 5).top("SOG", 20)
+            print(shooters.names, shooters["SOG"])
+
+        Attributes:
+            player_ids (numpy.ndarray): Player ID of every row.
+            names (numpy.ndarray): Player Name of every row.
+            positions (numpy.ndarray): Player Positions of every row.
+            teams (numpy.ndarray): Team Short Name of every row.
+            columns (Dict[str, numpy.ndarray]): Stat columns keyed by header.
+    """
+    def __init__(self, player_ids, names, positions, teams, columns: Dict[str, "np.ndarray"]):
+        if np is None:
+            raise FantraxException("StatsTable requires numpy: pip install numpy")
+        self.player_ids = np.asarray(player_ids, dtype=object)
+        self.names = np.asarray(names, dtype=object)
+        self.positions = np.asarray(positions, dtype=object)
+        self.teams = np.asarray(teams, dtype=object)
+        self.columns = columns
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Union[Tuple[dict, Sequence[str]], "PlayerStats"]]) -> "StatsTable":
+        """ Builds a table from raw ``statsTable`` or roster rows, or from parsed :class:`~fantraxapi.objs.PlayerStats`.
+
+            Raw rows are used without creating :class:`~fantraxapi.objs.PlayerStats` objects, parsed rows use the raw
+            cell values they keep, so both give the same columns. Rows without a Player are skipped. Rows can have
+            different headers, missing cells are NaN or ``""``.
+
+            Parameters:
+                rows (Iterable[Union[Tuple[dict, Sequence[str]], :class:`~fantraxapi.objs.PlayerStats`]]): Pairs of raw
+                    row data and the stat headers of that row, or parsed rows.
+
+            Returns:
+                :class:`~StatsTable`
+        """
+        if np is None:
+            raise FantraxException("StatsTable requires numpy: pip install numpy")
+        player_ids, names, positions, teams = [], [], [], []
+        cells = {}
+        header_cache = {}
+        for row in rows:
+            if isinstance(row, tuple):
+                data, headers = row
+                if "scorer" not in data:
+                    continue
+                scorer = data["scorer"]
+                player_ids.append(scorer["scorerId"])
+                names.append(scorer["name"])
+                positions.append(scorer["posShortNames"])
+                teams.append(scorer["teamShortName"] if "teamShortName" in scorer else scorer["teamName"])
+                values = (cell.get("content", None) for cell in data.get("cells", []))
+            else:
+                if row.player is None:
+                    continue
+                headers, values = row._stat_headers, row._values
+                player_ids.append(row.player.id)
+                names.append(row.player.name)
+                positions.append(row.player.pos_short_name)
+                teams.append(row.player.team_short_name)
+            index = len(player_ids) - 1
+            key = id(headers)
+            if key not in header_cache:
+                header_cache[key] = (headers, cls._column_names(headers))
+            for name, content in zip(header_cache[key][1], values):
+                if name not in cells:
+                    cells[name] = [""] * index
+                column = cells[name]
+                column.extend([""] * (index - len(column)))
+                column.append("" if content is None else str(content))
+        return cls._build(player_ids, names, positions, teams, cells)
+
+    @classmethod
+    def _build(cls, player_ids, names, positions, teams, cells: Dict[str, List[str]]) -> "StatsTable":
+        total = len(player_ids)
+        columns = {}
+        for name, values in cells.items():
+            values.extend([""] * (total - len(values)))
+            columns[name] = cls._column(values)
+        return cls(player_ids, names, positions, teams, columns)
+
+    @staticmethod
+    def _column_names(headers: Sequence[str]) -> List[str]:
+        seen = {}
+        names = []
+        for header in headers:
+            seen[header] = seen.get(header, 0) + 1
+            names.append(header if seen[header] == 1 else f"{header} ({seen[header]})")
+        return names
+
+    @staticmethod
+    def _column(values: List[str]) -> "np.ndarray":
+        try:
+            return np.array([_number(v) for v in values], dtype=np.float64)
+        except ValueError:
+            return np.array([_br.sub(" ", v) for v in values], dtype=object)
+
+    def __len__(self):
+        return len(self.player_ids)
+
+    def __contains__(self, column):
+        return column in self.columns
+
+    def __getitem__(self, key: Union[str, "np.ndarray", slice, List[int]]) -> Union["np.ndarray", "StatsTable"]:
+        """ A stat column when given a header, otherwise a new table of the rows selected by a mask, indexes or slice. """
+        if isinstance(key, str):
+            if key not in self.columns:
+                raise FantraxException(f"Stat Column: {key} not found")
+            return self.columns[key]
+        return self.take(key)
+
+    @property
+    def headers(self) -> List[str]:
+        """ Names of every stat column. """
+        return list(self.columns)
+
+    def take(self, index: Union["np.ndarray", slice, List[int]]) -> "StatsTable":
+        """ New table with the rows selected by a boolean mask, an array of row indexes or a slice. """
+        return StatsTable(self.player_ids[index], self.names[index], self.positions[index], self.teams[index],
+                          {k: v[index] for k, v in self.columns.items()})
+
+    def filter(self, mask: "np.ndarray") -> "StatsTable":
+        """ New table with the rows where ``mask`` is ``True``.
+
+            Parameters:
+                mask (numpy.ndarray): Boolean array with one value per row, e.g. ``table["G"] > 5``.
+        """
+        return self.take(np.asarray(mask, dtype=bool))
+
+    def sort(self, column: str, descending: bool = True) -> "StatsTable":
+        """ New table sorted by a stat column, NaN values are always last.
+
+            Parameters:
+                column (str): Stat header to sort by.
+                descending (bool): Sort highest first.
+        """
+        return self.take(self._order(self[column], descending))
+
+    def top(self, column: str, k: int, descending: bool = True) -> "StatsTable":
+        """ New table with the ``k`` best rows by a stat column, sorted. Uses a partial sort for numeric columns.
+
+            Parameters:
+                column (str): Stat header to rank by.
+                k (int): Number of rows to keep.
+                descending (bool): Keep the highest values.
+
+            Raises:
+                :class:`FantraxException`: When ``k`` is negative.
+        """
+        if k < 0:
+            raise FantraxException(f"Top: k must be 0 or more, got {k}")
+        values = self[column]
+        if k >= len(values) or values.dtype == object:
+            return self.take(self._order(values, descending)[:k])
+        keys = self._keys(values, descending)
+        index = np.argpartition(keys, k)[:k]
+        return self.take(index[np.argsort(keys[index], kind="stable")])
+
+    @staticmethod
+    def _keys(values, descending):
+        keys = -values if descending else values.copy()
+        keys[np.isnan(keys)] = np.inf
+        return keys
+
+    def _order(self, values, descending):
+        if values.dtype == object:
+            order = np.argsort(values.astype(str), kind="stable")
+            return order[::-1] if descending else order
+        return np.argsort(self._keys(values, descending), kind="stable")
+
+    def row(self, index: int) -> Dict[str, Optional[Union[str, float]]]:
+        """ One row as a dict of Player ID, Name, Positions, Team and every stat column. """
+        output = {"id": self.player_ids[index], "name": self.names[index], "positions": self.positions[index], "team": self.teams[index]}
+        for name, column in self.columns.items():
+            output[name] = column[index].item() if column.dtype != object else column[index]
+        return output
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        return f"Stats Table ({len(self)} Players x {len(self.columns)} Stats)"
@@ -0,0 +1,92 @@
+import functools
+import inspect
+from contextlib import nullcontext
+
+try:
+    from opentelemetry.trace import use_span
+except ImportError:
+    use_span = None
+
+NO_SPAN = nullcontext()
+""" Context manager used in place of a span when no tracer is set. """
+
+
+def traced(func):
+    """ Runs an API method inside a ``fantrax.<method name>`` span when the API object has a tracer.
+
+        Works on regular and ``async`` methods and on generators, where the span covers the whole iteration and every
+        request made while walking it is a child of the span. Without a tracer the method is called directly.
+    """
+    name = f"fantrax.{func.__name__}"
+
+    if inspect.isasyncgenfunction(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if self.tracer is None:
+                return func(self, *args, **kwargs)
+            return _traced_async_iterator(self.tracer, name, self._span_attributes(func.__name__), func(self, *args, **kwargs))
+    elif inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if self.tracer is None:
+                return func(self, *args, **kwargs)
+            return _traced_iterator(self.tracer, name, self._span_attributes(func.__name__), func(self, *args, **kwargs))
+    elif inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            if self.tracer is None:
+                return await func(self, *args, **kwargs)
+            with self.tracer.start_as_current_span(name, attributes=self._span_attributes(func.__name__)):
+                return await func(self, *args, **kwargs)
+    else:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if self.tracer is None:
+                return func(self, *args, **kwargs)
+            with self.tracer.start_as_current_span(name, attributes=self._span_attributes(func.__name__)):
+                return func(self, *args, **kwargs)
+    return wrapper
+
+
+def _steps_current(tracer) -> bool:
+    """ Whether the span can be made current only while the generator runs instead of across every ``yield``. """
+    return use_span is not None and hasattr(tracer, "start_span")
+
+
+def _traced_iterator(tracer, name, attributes, iterator):
+    if not _steps_current(tracer):
+        with tracer.start_as_current_span(name, attributes=attributes):
+            yield from iterator
+        return
+    span = tracer.start_span(name, attributes=attributes)
+    try:
+        while True:
+            with use_span(span, end_on_exit=False):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        iterator.close()
+        span.end()
+
+
+async def _traced_async_iterator(tracer, name, attributes, iterator):
+    if not _steps_current(tracer):
+        with tracer.start_as_current_span(name, attributes=attributes):
+            async for item in iterator:
+                yield item
+        return
+    span = tracer.start_span(name, attributes=attributes)
+    try:
+        while True:
+            with use_span(span, end_on_exit=False):
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    return
+            yield item
+    finally:
+        await iterator.aclose()
+        span.end()
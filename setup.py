@@ -34,6 +34,11 @@ setup(
         "requests",
         "setuptools"
     ],
+    extras_require={
+        "async": ["aiohttp"],
+        "numpy": ["numpy"],
+        "fast": ["orjson"]
+    },
     project_urls={
         "Documentation": "https://fantraxapi.metamanager.wiki",
         "Funding": "https://github.com/sponsors/meisnate12",
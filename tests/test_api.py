@@ -1,7 +1,14 @@
-import os, sys, time, unittest
+import asyncio, json, multiprocessing, os, sys, tempfile, time, unittest
 from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
 from dotenv import load_dotenv
-from fantraxapi import FantraxAPI
+from fantraxapi import AsyncFantraxAPI, Cassette, FantraxAPI, FantraxException, MemoryCache, Metrics, SQLiteCache
+from fantraxapi.aio import aiohttp, gather_limited
+from fantraxapi.decoders import DECODERS, get_decoder
+from fantraxapi.server import FantraxServer
+from fantraxapi.synthetic import SyntheticLeague
+from fantraxapi.table import StatsTable, np
 
 """
 import logging
@@ -12,8 +19,8 @@ logger.addHandler(logging.StreamHandler())
 
 load_dotenv()
 
-league_id = os.environ["LEAGUE_ID"]
-local = os.environ["LOCAL"] == "True"
+league_id = os.environ.get("LEAGUE_ID")
+local = os.environ.get("LOCAL") == "True"
 py_version = f"{sys.version_info.major}.{sys.version_info.minor}"
 
 team_names = [
@@ -31,6 +38,7 @@ team_names = [
     "Tease McBulge"
 ]
 
+@unittest.skipIf(not league_id, "LEAGUE_ID is not set")
 class APITests(unittest.TestCase):
 
     @classmethod
@@ -41,3 +49,592 @@ class APITests(unittest.TestCase):
         for team in self.api.teams:
             self.assertIn(team.name, team_names)
 
+
+class ServerTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FantraxServer().start()
+        cls.url = cls.server.url
+        cls.api = FantraxAPI("synthetic", base_url=cls.url)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test_batch(self):
+        with self.api.batch() as batch:
+            teams = batch.request("getFantasyTeams")
+            positions = batch.request("getRefObject", type="Position")
+        self.assertEqual(len(batch), 2)
+        self.assertIn("fantasyTeams", teams.data)
+        self.assertIn("allObjs", positions.data)
+
+    def test_batch_failed(self):
+        with FantraxServer(error_rate=1.0, errors=("page_error",)) as server:
+            api = FantraxAPI("synthetic", base_url=server.url)
+            with self.assertRaises(FantraxException):
+                with api.batch() as batch:
+                    standings = batch.request("getStandings")
+            with self.assertRaisesRegex(FantraxException, "getStandings failed"):
+                standings.data # noqa
+            self.assertEqual(str(standings), "getStandings (Failed)")
+
+    def test_cache(self):
+        cache = MemoryCache()
+        first = FantraxAPI("synthetic", base_url=self.url, cache=cache)
+        name = first.league_name
+        self.assertEqual(cache.stats["hits"], 0)
+        second = FantraxAPI("synthetic", base_url=self.url, cache=cache)
+        self.assertEqual(second.league_name, name)
+        self.assertEqual(cache.stats["hits"], 1)
+        cache.invalidate("getFantasyLeagueInfo")
+        self.assertEqual(cache.stats["entries"], 0)
+
+    def test_fold_league_info(self):
+        api = FantraxAPI("synthetic", base_url=self.url, fold_league_info=True)
+        self.assertIsNone(api._league_info)
+        api.standings()
+        self.assertIsNotNone(api._league_info)
+        self.assertEqual(api.league_name, self.api.league_name)
+
+    def test_available_players(self):
+        players = list(self.api.iter_available_players(page_size=50))
+        self.assertEqual(len(players), len(self.api.get_available_players(page_size=200)))
+        self.assertEqual(len({p.player.id for p in players}), len(players))
+
+    def test_stream_available_players(self):
+        streamed = list(self.api.iter_available_players(page_size=200, stream=True))
+        buffered = list(self.api.iter_available_players(page_size=200))
+        self.assertEqual([p.player.id for p in streamed], [p.player.id for p in buffered])
+        self.assertEqual(streamed[0].stats, buffered[0].stats)
+
+    def test_hooks(self):
+        events = []
+        api = FantraxAPI("synthetic", base_url=self.url, hooks={"on_response": events.append, "on_parsed": events.append})
+        api.standings()
+        self.assertEqual(events[-2].methods[-1], "getStandings")
+        self.assertIn("download", events[-2].timings)
+        self.assertEqual(events[-1].name, "standings")
+
+    def test_hook_timings(self):
+        events = []
+        with FantraxServer() as server:
+            api = FantraxAPI("synthetic", base_url=server.url, hooks={"on_request": lambda event: time.sleep(0.2), "on_response": events.append})
+            api.standings()
+        self.assertTrue(events)
+        for event in events:
+            self.assertLess(event.seconds, 0.2)
+
+    def test_metrics(self):
+        metrics = Metrics()
+        api = metrics.attach(FantraxAPI("synthetic", base_url=self.url, cache=MemoryCache()))
+        api.standings()
+        api.standings()
+        self.assertEqual(metrics.stats["requests"]["getStandings"], 1)
+        self.assertEqual(metrics.stats["cache"]["hits"], 1)
+        self.assertIn('fantrax_requests_total{method="getStandings"} 1', metrics.render())
+
+    def test_metrics_batch(self):
+        metrics = Metrics()
+        with FantraxServer() as server:
+            api = metrics.attach(FantraxAPI("synthetic", base_url=server.url))
+            with api.batch() as batch:
+                batch.request("getStandings")
+                batch.request("getStandings", period="1")
+                batch.request("getFantasyTeams")
+        self.assertEqual(metrics.stats["requests"], {"getStandings": 1, "getFantasyTeams": 1})
+        self.assertEqual(list(metrics.stats["seconds"]), ["batch"])
+        del api, batch
+        self.assertEqual(len(metrics._apis), 0)
+
+    def test_tracing(self):
+        spans = []
+
+        class Span:
+            def __init__(self, name, attributes):
+                spans.append((name, attributes))
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, exc_type, exc_val, exc_tb):
+                pass
+
+            def set_attribute(self, key, value):
+                pass
+
+        class Tracer:
+            def start_as_current_span(self, name, attributes=None):
+                return Span(name, attributes)
+
+        api = FantraxAPI("synthetic", base_url=self.url, tracer=Tracer())
+        api.standings()
+        self.assertEqual([name for name, _ in spans][0], "fantrax.standings")
+        self.assertIn("fantrax.request", [name for name, _ in spans])
+        self.assertEqual(spans[-1][1]["fantrax.method"], "standings")
+
+    def test_tracing_iterators(self):
+        try:
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+            from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+        except ImportError:
+            self.skipTest("opentelemetry-sdk is not installed")
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        api = FantraxAPI("synthetic", base_url=self.url, tracer=provider.get_tracer("fantraxapi"))
+        for method in ["iter_available_players", "iter_transactions"]:
+            with self.subTest(method=method):
+                exporter.clear()
+                self.assertGreater(len(list(getattr(api, method)(page_size=20))), 20)
+                spans = exporter.get_finished_spans()
+                parent = [span for span in spans if span.name == f"fantrax.{method}"]
+                self.assertEqual(len(parent), 1)
+                requests = [span for span in spans if span.name == "fantrax.request"]
+                self.assertGreater(len(requests), 1)
+                for span in requests:
+                    self.assertEqual(span.parent.span_id, parent[0].context.span_id)
+
+    def test_cassette(self):
+        path = os.path.join(tempfile.mkdtemp(), "league.json.gz")
+        with Cassette(path, mode="record") as cassette:
+            recorded = FantraxAPI("synthetic", base_url=self.url, cassette=cassette).standings()
+        cassette = Cassette(path)
+        self.assertTrue(cassette.replaying)
+        replayed = FantraxAPI("synthetic", base_url=self.url, cassette=cassette).standings()
+        self.assertEqual(str(replayed), str(recorded))
+        self.assertEqual(cassette.plays, len(cassette))
+
+    def test_cassette_copies(self):
+        path = os.path.join(tempfile.mkdtemp(), "league.json.gz")
+        with FantraxServer() as server:
+            with Cassette(path, mode="record") as cassette:
+                api = FantraxAPI("synthetic", base_url=server.url, cassette=cassette)
+                api.request_many([("getFantasyTeams", {})])[0]["fantasyTeams"].clear()
+        cassette = Cassette(path)
+        api = FantraxAPI("synthetic", cassette=cassette)
+        for _ in range(2):
+            teams = api.request_many([("getFantasyTeams", {})])[0]["fantasyTeams"]
+            self.assertEqual(len(teams), 12)
+            teams.clear()
+
+    def test_server(self):
+        with FantraxServer(league_options={"num_teams": 10}) as server:
+            api = FantraxAPI("synthetic", base_url=server.url)
+            self.assertEqual(len(api.teams), 10)
+            self.assertEqual(len(api.roster_info(api.default_team_id).rows), 20)
+            self.assertTrue(api.playoffs())
+        with FantraxServer(max_cached=2) as server:
+            api = FantraxAPI("synthetic", base_url=server.url)
+            for week in range(1, 5):
+                api.standings(week)
+            self.assertEqual(len(server._bodies), 2)
+        with FantraxServer(error_rate=1.0) as server:
+            with self.assertRaises(FantraxException):
+                FantraxAPI("synthetic", base_url=server.url).standings()
+
+    def test_synthetic_league(self):
+        league = SyntheticLeague("knobs", num_teams=4, roster_size=10, num_stats=25, num_transactions=30)
+        with FantraxServer(leagues=[league]) as server:
+            api = FantraxAPI("knobs", base_url=server.url)
+            roster = api.roster_info(api.default_team_id)
+            self.assertEqual(len(roster.rows), 10)
+            self.assertEqual(len(roster.rows[0].stats), 26)
+            self.assertEqual(len(list(api.iter_transactions(page_size=7))), 30)
+        self.assertEqual(SyntheticLeague.scaled(10).num_teams, 10 * SyntheticLeague.scaled(1).num_teams)
+
+    def test_all_rosters(self):
+        rosters = self.api.all_rosters()
+        self.assertEqual(set(rosters), {team.team_id for team in self.api.teams})
+        roster = self.api.roster_info(self.api.default_team_id)
+        self.assertEqual(str(rosters[self.api.default_team_id]), str(roster))
+        for row in rosters[self.api.default_team_id].rows:
+            if row.player:
+                self.assertIs(self.api.player(row.player.id), row.player)
+
+    def test_transactions(self):
+        for transaction in self.api.transactions():
+            self.assertTrue(transaction.finalized)
+            self.assertEqual(len(transaction.players), transaction.count)
+
+    def test_transactions_split_group(self):
+        with FantraxServer() as server:
+            api = FantraxAPI("synthetic", base_url=server.url)
+            for count in range(1, 12):
+                transactions = api.transactions(count)
+                self.assertGreaterEqual(len(transactions), 1)
+                for transaction in transactions:
+                    self.assertTrue(transaction.finalized)
+                    self.assertEqual(len(transaction.players), transaction.count)
+
+    def test_transaction_groups(self):
+        league = SyntheticLeague("groups", num_transactions=20, max_group=4)
+        data = {"leagueId": "groups", "maxResultsPerPage": "7", "pageNumber": "1"}
+        first, second = league.respond("getTransactionDetailsHistory", data), league.respond("getTransactionDetailsHistory", dict(data, pageNumber="2"))
+        straddling = first["table"]["rows"][-1]
+        self.assertGreaterEqual(straddling["numInGroup"], 3)
+        self.assertEqual(second["table"]["rows"][0]["txSetId"], straddling["txSetId"])
+        with FantraxServer(leagues=[league]) as server:
+            api = FantraxAPI("groups", base_url=server.url)
+            for page_size in range(1, 9):
+                for transactions in (api.transactions(page_size), list(api.iter_transactions(page_size=page_size)),
+                                     api.transaction_sync(page_size=page_size).backfill()):
+                    for transaction in transactions:
+                        self.assertTrue(transaction.finalized)
+                        self.assertEqual(len(transaction.players), transaction.count)
+            self.assertEqual(len(list(api.iter_transactions(page_size=5))), 20)
+            self.assertIn(straddling["txSetId"], [t.id for t in api.transactions(7)])
+            self.assertEqual(max(t.count for t in api.iter_transactions()), 4)
+
+    def test_transaction_sync(self):
+        league = SyntheticLeague("sync", num_transactions=40)
+        methods = []
+        with FantraxServer(leagues=[league]) as server:
+            api = FantraxAPI("sync", base_url=server.url, hooks={"on_request": lambda event: methods.extend(event.methods)})
+            sync = api.transaction_sync(page_size=10)
+            history = sync.backfill()
+            self.assertEqual(len(history), 40)
+            self.assertEqual(sync.last_id, history[0].id)
+            self.assertEqual(sync.poll(), [])
+            league.add_transactions()
+            server.clear()
+            methods.clear()
+            new = sync.poll()
+            self.assertEqual(len(new), 1)
+            self.assertNotIn(new[0].id, {t.id for t in history})
+            self.assertEqual(methods, ["getTransactionDetailsHistory"])
+            resumed = api.transaction_sync(last_id=history[0].id, page_size=10).poll()
+            self.assertEqual([t.id for t in resumed], [new[0].id])
+
+    def test_player_identity(self):
+        players = self.api.get_available_players()
+        for row in players.rows[:10]:
+            self.assertIs(self.api.player(row.player.id), row.player)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_stats_table(self):
+        with FantraxServer() as server:
+            eager = FantraxAPI("synthetic", base_url=server.url)
+            lazy = FantraxAPI("synthetic", base_url=server.url, lazy=True)
+            for first, second in ((eager.roster_info(eager.default_team_id), lazy.roster_info(lazy.default_team_id)),
+                                  (eager.get_available_players(), lazy.get_available_players())):
+                self.assertIsNone(first._data)
+                self.assertEqual(first.table.headers, second.table.headers)
+                self.assertEqual(list(first.table.player_ids), list(second.table.player_ids))
+                for header in first.table.headers:
+                    self.assertEqual(str(first.table[header].tolist()), str(second.table[header].tolist()))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_stats_table_repeated_headers(self):
+        fixtures = os.path.dirname(os.path.abspath(__file__))
+        with open(os.path.join(fixtures, "league_info.json"), encoding="utf-8") as f:
+            position_map = json.load(f)["responses"][0]["data"]["positionMap"]
+        with open(os.path.join(fixtures, "active_available_players.json"), encoding="utf-8") as f:
+            response = json.load(f)["responses"][0]["data"]
+        tables = []
+        for lazy in (False, True):
+            api = FantraxAPI("fixture", lazy=lazy)
+            api._load_positions({"allObjs": position_map})
+            tables.append(api._parse_available_players([response]).table)
+        eager, lazy = tables
+        self.assertIn("+/- (2)", eager.headers)
+        self.assertEqual(eager.headers, lazy.headers)
+        for header in eager.headers:
+            self.assertEqual(str(eager[header].tolist()), str(lazy[header].tolist()))
+        first = response["statsTable"][0]
+        self.assertEqual(eager["+/-"][0], float(first["cells"][8]["content"].rstrip("%")))
+        self.assertEqual(eager["+/- (2)"][0], float(first["cells"][12]["content"]))
+
+    def test_lazy(self):
+        lazy = FantraxAPI("synthetic", base_url=self.url, lazy=True)
+        eager = self.api.roster_info(self.api.default_team_id)
+        roster = lazy.roster_info(lazy.default_team_id)
+        self.assertEqual(len(roster.rows), len(eager.rows))
+        self.assertEqual(roster.rows[0].stats, eager.rows[0].stats)
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class AsyncAPITests(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.server = FantraxServer(league_options={"num_teams": 8, "num_players": 300}).start()
+        self.addCleanup(self.server.stop)
+
+    async def test_load(self):
+        async with AsyncFantraxAPI("synthetic", base_url=self.server.url) as api:
+            with self.assertRaises(FantraxException):
+                api.teams # noqa
+            with self.assertRaises(FantraxException):
+                api.positions # noqa
+            await api.load()
+            await api.load()
+            self.assertEqual(self.server.requests, 1)
+            self.assertEqual(len(api.teams), 8)
+            self.assertIn("G", [p.short_name for p in api.positions.values()])
+
+    async def test_methods(self):
+        async with AsyncFantraxAPI("synthetic", base_url=self.server.url) as api:
+            self.assertTrue(await api.scoring_periods())
+            self.assertTrue((await api.standings()).standings)
+            self.assertIsInstance(await api.pending_trades(), list)
+            self.assertIsInstance(await api.trade_block(), list)
+            self.assertTrue(all(t.finalized for t in await api.transactions(5)))
+            self.assertTrue(await api.playoffs())
+            roster = await api.roster_info(api.teams[0].team_id)
+            rosters = await api.all_rosters()
+            self.assertEqual(set(rosters), {team.team_id for team in api.teams})
+            self.assertEqual(str(rosters[api.teams[0].team_id]), str(roster))
+
+    async def test_available_players(self):
+        async with AsyncFantraxAPI("synthetic", base_url=self.server.url) as api:
+            players = await api.get_available_players()
+            paged = [p async for p in api.iter_available_players(page_size=50)]
+            streamed = [p async for p in api.iter_available_players(page_size=50, stream=True)]
+            self.assertEqual([p.player.id for p in paged], [p.player.id for p in players])
+            self.assertEqual([p.player.id for p in streamed], [p.player.id for p in players])
+            self.assertEqual(streamed[0].stats, paged[0].stats)
+
+    async def test_batch_failed(self):
+        self.server.error_rate = 1.0
+        async with AsyncFantraxAPI("synthetic", base_url=self.server.url) as api:
+            with self.assertRaises(FantraxException):
+                async with api.batch() as batch:
+                    standings = batch.request("getStandings")
+            with self.assertRaisesRegex(FantraxException, "getStandings failed"):
+                standings.data # noqa
+
+    async def test_gather_limited(self):
+        running, peak = 0, 0
+
+        async def work(value):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return value
+
+        self.assertEqual(await gather_limited(*[work(i) for i in range(20)], limit=3), list(range(20)))
+        self.assertEqual(peak, 3)
+
+
+def _set_standings(cache, week):
+    cache.set("getStandings", {"leagueId": "cache", "period": week}, {"week": week})
+
+
+class MemoryCacheTests(unittest.TestCase):
+
+    def test_copies(self):
+        cache = MemoryCache()
+        value = {"rows": [1, 2]}
+        cache.set("getStandings", {"leagueId": "cache"}, value)
+        value["rows"].append(3)
+        cached = cache.get("getStandings", {"leagueId": "cache"})
+        self.assertEqual(cached, {"rows": [1, 2]})
+        cached["rows"].append(4)
+        self.assertEqual(cache.get("getStandings", {"leagueId": "cache"}), {"rows": [1, 2]})
+        with FantraxServer() as server:
+            api = FantraxAPI("synthetic", base_url=server.url, cache=cache)
+            api.request_many([("getFantasyTeams", {})])[0]["fantasyTeams"].clear()
+            self.assertTrue(api.request_many([("getFantasyTeams", {})])[0]["fantasyTeams"])
+
+    def test_max_entries(self):
+        cache = MemoryCache(max_entries=2)
+        _set_standings(cache, 1)
+        _set_standings(cache, 2)
+        cache.get("getStandings", {"leagueId": "cache", "period": 1})
+        _set_standings(cache, 3)
+        self.assertEqual(cache.stats["entries"], 2)
+        self.assertEqual(cache.stats["evictions"], 1)
+        self.assertIsNone(cache.get("getStandings", {"leagueId": "cache", "period": 2}))
+        self.assertEqual(cache.get("getStandings", {"leagueId": "cache", "period": 1}), {"week": 1})
+
+    def test_max_bytes(self):
+        size = len(json.dumps({"week": 1}, separators=(",", ":")))
+        cache = MemoryCache(max_bytes=size * 2)
+        for week in range(1, 4):
+            _set_standings(cache, week)
+        self.assertEqual(cache.stats["entries"], 2)
+        self.assertEqual(cache.stats["bytes"], size * 2)
+        self.assertIsNone(cache.get("getStandings", {"leagueId": "cache", "period": 1}))
+        cache.set("getStandings", {"leagueId": "cache"}, {"rows": list(range(100))})
+        self.assertIsNone(cache.get("getStandings", {"leagueId": "cache"}))
+
+    def test_ttl(self):
+        cache = MemoryCache(ttls={"getStandings": 0.05, "getFantasyTeams": 60})
+        _set_standings(cache, 1)
+        self.assertIsNotNone(cache.get("getStandings", {"leagueId": "cache", "period": 1}))
+        time.sleep(0.1)
+        self.assertIsNone(cache.get("getStandings", {"leagueId": "cache", "period": 1}))
+        self.assertEqual((cache.stats["expirations"], cache.stats["entries"]), (1, 0))
+        cache.set("getFantasyTeams", {"leagueId": "cache"}, {"teams": []})
+        cache.set("uncached", {"leagueId": "cache"}, {"teams": []})
+        self.assertEqual(cache.stats["entries"], 1)
+
+    def test_invalidate(self):
+        cache = MemoryCache()
+        for league in ("a", "b"):
+            cache.set("getStandings", {"leagueId": league}, {"league": league})
+            cache.set("getFantasyTeams", {"leagueId": league}, {"league": league})
+        cache.invalidate("getStandings", "a")
+        self.assertEqual(cache.stats["entries"], 3)
+        cache.invalidate(league_id="b")
+        self.assertEqual(cache.stats["entries"], 1)
+        self.assertEqual(cache.get("getFantasyTeams", {"leagueId": "a"}), {"league": "a"})
+        cache.invalidate("getFantasyTeams")
+        self.assertEqual(cache.stats["entries"], 0)
+        cache.set("getStandings", {"leagueId": "a"}, {"league": "a"})
+        cache.invalidate()
+        self.assertEqual(cache.stats["entries"], 0)
+
+
+class SQLiteCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "cache.db")
+
+    @staticmethod
+    def payload(seed):
+        return {"rows": [f"{seed}-{i * 7919 % 1000003:07d}" for i in range(200)]}
+
+    def test_round_trip(self):
+        cache = SQLiteCache(self.path)
+        data = {"leagueId": "cache", "period": 1}
+        value = {"name": "Standings ✓", "rows": [1, 2.5, None, True]}
+        cache.set("getStandings", data, value)
+        self.assertEqual(cache.get("getStandings", data), value)
+        self.assertIsNone(cache.get("getStandings", {"leagueId": "cache", "period": 2}))
+        self.assertEqual((cache.stats["hits"], cache.stats["misses"]), (1, 1))
+        cache.set("getStandings", data, self.payload(0))
+        self.assertEqual(cache.get("getStandings", data), self.payload(0))
+        self.assertLess(cache.stats["bytes"], len(json.dumps(self.payload(0))))
+
+    def test_ttl(self):
+        cache = SQLiteCache(self.path, ttls={"getStandings": 0.05})
+        cache.set("getStandings", {"leagueId": "cache"}, {"week": 1})
+        self.assertIsNotNone(cache.get("getStandings", {"leagueId": "cache"}))
+        time.sleep(0.1)
+        self.assertIsNone(cache.get("getStandings", {"leagueId": "cache"}))
+        self.assertEqual(cache.stats["expirations"], 1)
+        self.assertEqual(cache.stats["entries"], 0)
+
+    def test_max_entries(self):
+        cache = SQLiteCache(self.path, max_entries=2)
+        for week in range(1, 4):
+            _set_standings(cache, week)
+            time.sleep(0.01)
+        self.assertEqual(cache.stats["entries"], 2)
+        self.assertEqual(cache.stats["evictions"], 1)
+        self.assertIsNone(cache.get("getStandings", {"leagueId": "cache", "period": 1}))
+
+    def test_max_bytes(self):
+        probe = SQLiteCache(os.path.join(tempfile.mkdtemp(), "probe.db"))
+        probe.set("getStandings", {"leagueId": "cache"}, self.payload(0))
+        size = probe.stats["bytes"]
+        cache = SQLiteCache(self.path, max_bytes=int(size * 2.5))
+        for week in range(1, 3):
+            cache.set("getStandings", {"leagueId": "cache", "period": week}, self.payload(week))
+            time.sleep(0.01)
+        cache.get("getStandings", {"leagueId": "cache", "period": 1})
+        time.sleep(0.01)
+        cache.set("getStandings", {"leagueId": "cache", "period": 3}, self.payload(3))
+        self.assertEqual(cache.stats["entries"], 2)
+        self.assertLessEqual(cache.stats["bytes"], size * 2.5)
+        self.assertIsNone(cache.get("getStandings", {"leagueId": "cache", "period": 2}))
+        self.assertEqual(cache.get("getStandings", {"leagueId": "cache", "period": 1}), self.payload(1))
+
+    def test_shared(self):
+        cache = SQLiteCache(self.path)
+        _set_standings(cache, 1)
+        self.assertEqual(SQLiteCache(self.path).get("getStandings", {"leagueId": "cache", "period": 1}), {"week": 1})
+        if "fork" not in multiprocessing.get_all_start_methods():
+            self.skipTest("fork is not available")
+        process = multiprocessing.get_context("fork").Process(target=_set_standings, args=(cache, 2))
+        process.start()
+        process.join()
+        self.assertEqual(process.exitcode, 0)
+        self.assertEqual(cache.get("getStandings", {"leagueId": "cache", "period": 2}), {"week": 2})
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class StatsTableTests(unittest.TestCase):
+
+    def setUp(self):
+        headers = ["FPts", "G", "G", "Note"]
+        rows = [("1,325.28", "+4.9%", "1", "a<br/>b"), ("-", "2", "3", "x"), ("10", "", "2", "y")]
+        self.table = StatsTable.from_rows(
+            ({"scorer": {"scorerId": f"p{i}", "name": f"P{i}", "posShortNames": "C", "teamShortName": "T"},
+              "cells": [{"content": c} for c in cells]}, headers) for i, cells in enumerate(rows))
+
+    def test_parse(self):
+        self.assertEqual(self.table.headers, ["FPts", "G", "G (2)", "Note"])
+        self.assertEqual(self.table["FPts"][0], 1325.28)
+        self.assertEqual(self.table["G"][0], 4.9)
+        self.assertTrue(np.isnan(self.table["FPts"][1]))
+        self.assertTrue(np.isnan(self.table["G"][2]))
+        self.assertEqual(self.table["G (2)"].tolist(), [1.0, 3.0, 2.0])
+        self.assertEqual(self.table["Note"].tolist(), ["a b", "x", "y"])
+        with self.assertRaises(FantraxException):
+            self.table["A"] # noqa
+
+    def test_filter_sort(self):
+        self.assertEqual(self.table.filter(self.table["G (2)"] >= 2).player_ids.tolist(), ["p1", "p2"])
+        self.assertEqual(self.table.sort("FPts").player_ids.tolist(), ["p0", "p2", "p1"])
+        self.assertEqual(self.table.sort("FPts", descending=False).player_ids.tolist(), ["p2", "p0", "p1"])
+        self.assertEqual(self.table.sort("Note").player_ids.tolist(), ["p2", "p1", "p0"])
+
+    def test_top(self):
+        self.assertEqual(self.table.top("FPts", 2).player_ids.tolist(), ["p0", "p2"])
+        self.assertEqual(self.table.top("FPts", 1, descending=False).player_ids.tolist(), ["p2"])
+        self.assertEqual(self.table.top("G", 5).player_ids.tolist(), ["p0", "p1", "p2"])
+        self.assertEqual(len(self.table.top("FPts", 0)), 0)
+        with self.assertRaises(FantraxException):
+            self.table.top("FPts", -1)
+
+
+class _TruncatedHandler(BaseHTTPRequestHandler):
+    body = b'{"responses": [{"data": {"fantasyTeams": ['
+
+    def do_POST(self): # noqa: N802
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args): # noqa: A002
+        pass
+
+
+class DecoderTests(unittest.TestCase):
+    names = ("json", "orjson", "msgspec")
+
+    def test_names(self):
+        for name in self.names:
+            with self.subTest(name=name):
+                if name not in DECODERS:
+                    self.skipTest(f"{name} is not installed")
+                self.assertEqual(get_decoder(name)(b'{"a": [1, "\\u2713"]}'), {"a": [1, "\u2713"]})
+
+    def test_default_and_callable(self):
+        self.assertIn(get_decoder(), DECODERS.values())
+        decoder = lambda content: {"decoded": content} # noqa: E731
+        self.assertIs(get_decoder(decoder), decoder)
+
+    def test_unknown(self):
+        with self.assertRaises(FantraxException):
+            get_decoder("simplejson")
+
+    def test_invalid_json(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _TruncatedHandler)
+        Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        for name in DECODERS:
+            with self.subTest(name=name):
+                api = FantraxAPI("invalid", base_url=f"http://127.0.0.1:{server.server_address[1]}", json_decoder=name)
+                with self.assertRaisesRegex(FantraxException, "Failed to Connect"):
+                    api.request_many([("getFantasyTeams", {})])